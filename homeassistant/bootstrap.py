@@ -6,6 +6,7 @@ import asyncio
 from collections import defaultdict
 import contextlib
 from functools import partial
+import hashlib
 from itertools import chain
 import logging
 import logging.handlers
@@ -67,6 +68,7 @@ from .const import (
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
     REQUIRED_NEXT_PYTHON_VER,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
+    __version__,
 )
 from .exceptions import HomeAssistantError
 from .helpers import (
@@ -85,7 +87,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
 from .setup import (
@@ -126,6 +128,10 @@ STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
+STARTUP_PLAN_STORAGE_KEY = "core.startup_plan"
+STARTUP_PLAN_STORAGE_VERSION = 1
+STARTUP_PLAN_SAVE_DELAY = 300
+
 
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 CORE_INTEGRATIONS = {"homeassistant", "persistent_notification"}
@@ -733,6 +739,28 @@ async def async_setup_multi_components(
             )
 
 
+async def _async_startup_plan_key(
+    hass: core.HomeAssistant, domains: set[str]
+) -> str:
+    """Return a key for the inputs the dependency resolution depends on.
+
+    The key changes when the configured domains, the installed custom
+    integrations or the Home Assistant version change.
+    """
+    custom_components = await loader.async_get_custom_components(hass)
+    key_source = "\n".join(
+        (
+            __version__,
+            ",".join(sorted(domains)),
+            ",".join(
+                f"{domain}@{integration.version}"
+                for domain, integration in sorted(custom_components.items())
+            ),
+        )
+    )
+    return hashlib.sha256(key_source.encode()).hexdigest()
+
+
 async def _async_resolve_domains_to_setup(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> tuple[set[str], dict[str, loader.Integration]]:
@@ -773,6 +801,22 @@ async def _async_resolve_domains_to_setup(
 
     translations_to_load = additional_manifests_to_load.copy()
 
+    # The manifests resolved on the previous start are only a hint used to
+    # load them in the first round instead of one round per level of the
+    # dependency tree. Resolution below still runs so a stale plan can never
+    # change which domains are set up.
+    plan_store: Store[dict[str, Any]] = Store(
+        hass, STARTUP_PLAN_STORAGE_VERSION, STARTUP_PLAN_STORAGE_KEY, private=True
+    )
+    plan_key, stored_plan = await asyncio.gather(
+        _async_startup_plan_key(
+            hass, {*domains_to_setup, *additional_manifests_to_load}
+        ),
+        plan_store.async_load(),
+    )
+    if stored_plan is not None and stored_plan["key"] == plan_key:
+        additional_manifests_to_load.update(stored_plan["manifests"])
+
     # Resolve all dependencies so we know all integrations
     # that will have to be loaded and start right-away
     integration_cache: dict[str, loader.Integration] = {}
@@ -847,6 +891,10 @@ async def _async_resolve_domains_to_setup(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    plan = {"key": plan_key, "manifests": sorted(integration_cache)}
+    if plan != stored_plan:
+        plan_store.async_delay_save(lambda: plan, STARTUP_PLAN_SAVE_DELAY)
+
     # Optimistically check if requirements are already installed
     # ahead of setting up the integrations so we can prime the cache
     # We do not wait for this since its an optimization only
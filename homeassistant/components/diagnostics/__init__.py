@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Coroutine, Mapping
 from dataclasses import dataclass, field
 from http import HTTPStatus
@@ -23,6 +24,7 @@ from homeassistant.helpers.json import (
 )
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.update_coordinator import async_get_refresh_stats
 from homeassistant.loader import async_get_custom_components, async_get_integration
 from homeassistant.util.json import format_unserializable_data
 
@@ -59,16 +61,13 @@ class DiagnosticsData:
     """Diagnostic data."""
 
     platforms: dict[str, DiagnosticsPlatformData] = field(default_factory=dict)
+    process_platforms_task: asyncio.Task[None] | None = None
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up Diagnostics from a config entry."""
     hass.data[DOMAIN] = DiagnosticsData()
 
-    await integration_platform.async_process_integration_platforms(
-        hass, DOMAIN, _register_diagnostics_platform
-    )
-
     websocket_api.async_register_command(hass, handle_info)
     websocket_api.async_register_command(hass, handle_get)
     hass.http.register_view(DownloadDiagnosticsView)
@@ -102,14 +101,36 @@ def _register_diagnostics_platform(
     )
 
 
+async def _async_get_platforms(
+    hass: HomeAssistant,
+) -> dict[str, DiagnosticsPlatformData]:
+    """Return the diagnostics platforms.
+
+    Diagnostics platforms are only needed when the user asks for them,
+    so they are imported the first time they are requested instead of
+    during startup.
+    """
+    diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+    if diagnostics_data.process_platforms_task is None:
+        diagnostics_data.process_platforms_task = hass.async_create_task(
+            integration_platform.async_process_integration_platforms(
+                hass, DOMAIN, _register_diagnostics_platform, wait_for_platforms=True
+            ),
+            "process diagnostics platforms",
+            eager_start=True,
+        )
+    await asyncio.shield(diagnostics_data.process_platforms_task)
+    return diagnostics_data.platforms
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command({vol.Required("type"): "diagnostics/list"})
-@callback
-def handle_info(
+@websocket_api.async_response
+async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all possible diagnostic handlers."""
-    diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+    platforms = await _async_get_platforms(hass)
     result = [
         {
             "domain": domain,
@@ -118,7 +139,7 @@ def handle_info(
                 DiagnosticsSubType.DEVICE: info.device_diagnostics is not None,
             },
         }
-        for domain, info in diagnostics_data.platforms.items()
+        for domain, info in platforms.items()
     ]
     connection.send_result(msg["id"], result)
 
@@ -130,15 +151,15 @@ def handle_info(
         vol.Required("domain"): str,
     }
 )
-@callback
-def handle_get(
+@websocket_api.async_response
+async def handle_get(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all diagnostic handlers for a domain."""
     domain = msg["domain"]
-    diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+    platforms = await _async_get_platforms(hass)
 
-    if (info := diagnostics_data.platforms.get(domain)) is None:
+    if (info := platforms.get(domain)) is None:
         connection.send_error(
             msg["id"], websocket_api.ERR_NOT_FOUND, "Domain not supported"
         )
@@ -177,14 +198,17 @@ async def _async_get_json_file_response(
             "version": cc_obj.version,
             "requirements": cc_obj.requirements,
         }
+    payload: dict[str, Any] = {
+        "home_assistant": hass_sys_info,
+        "custom_components": custom_components,
+        "integration_manifest": integration.manifest,
+    }
+    if data_update_coordinators := async_get_refresh_stats(hass, d_id):
+        payload["data_update_coordinators"] = data_update_coordinators
+    payload["data"] = data
     try:
         json_data = json.dumps(
-            {
-                "home_assistant": hass_sys_info,
-                "custom_components": custom_components,
-                "integration_manifest": integration.manifest,
-                "data": data,
-            },
+            payload,
             indent=2,
             cls=ExtendedJSONEncoder,
         )
@@ -242,8 +266,8 @@ class DownloadDiagnosticsView(http.HomeAssistantView):
         if (config_entry := hass.config_entries.async_get_entry(d_id)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
-        diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
-        if (info := diagnostics_data.platforms.get(config_entry.domain)) is None:
+        platforms = await _async_get_platforms(hass)
+        if (info := platforms.get(config_entry.domain)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
         filename = f"{config_entry.domain}-{config_entry.entry_id}"
@@ -5,3 +5,7 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The maximum number of states in each message
+# when streaming historical states in chunks
+HISTORY_STREAM_CHUNK_SIZE = 2048
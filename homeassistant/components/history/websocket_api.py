@@ -36,10 +36,14 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import json_bytes
-from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.async_ import create_eager_task, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_STREAM_CHUNK_SIZE,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -63,6 +67,27 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _downsample_states(
+    states: MutableMapping[str, list[dict[str, Any]]],
+    start_time: dt,
+    end_time: dt | None,
+    buckets: int | None,
+) -> MutableMapping[str, list[dict[str, Any]]]:
+    """Downsample the states of each entity if buckets were requested."""
+    if not buckets:
+        return states
+    start_time_ts = start_time.timestamp()
+    end_time_ts = (end_time or dt_util.utcnow()).timestamp()
+    return {
+        entity_id: list(
+            history.downsample_compressed_states(
+                entity_states, start_time_ts, end_time_ts, buckets
+            )
+        )
+        for entity_id, entity_states in states.items()
+    }
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
@@ -73,22 +98,31 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    buckets: int | None = None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
-                hass,
+            _downsample_states(
+                cast(
+                    MutableMapping[str, list[dict[str, Any]]],
+                    history.get_significant_states(
+                        hass,
+                        start_time,
+                        end_time,
+                        entity_ids,
+                        None,
+                        include_start_time_state,
+                        significant_changes_only,
+                        minimal_response,
+                        no_attributes,
+                        True,
+                    ),
+                ),
                 start_time,
                 end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
+                buckets,
             ),
         )
     )
@@ -104,6 +138,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("buckets"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -168,6 +203,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("buckets"),
         )
     )
 
@@ -222,31 +258,30 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    buckets: int | None = None,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
-    states = cast(
-        MutableMapping[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
+    states = _downsample_states(
+        cast(
+            MutableMapping[str, list[dict[str, Any]]],
+            history.get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                True,
+            ),
         ),
+        start_time,
+        end_time,
+        buckets,
     )
-    last_time_ts = 0.0
-    for state_list in states.values():
-        if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
-            last_time_ts = cast(float, state_last_time)
+    last_time_ts = _states_last_time_ts(states)
 
     if last_time_ts == 0:
         # If we did not send any states ever, we need to send an empty response
@@ -265,6 +300,92 @@ def _generate_historical_response(
     )
 
 
+def _states_last_time_ts(states: MutableMapping[str, list[dict[str, Any]]]) -> float:
+    """Return the timestamp of the last state."""
+    last_time_ts = 0.0
+    for state_list in states.values():
+        if (
+            state_list
+            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
+            > last_time_ts
+        ):
+            last_time_ts = cast(float, state_last_time)
+    return last_time_ts
+
+
+@callback
+def _async_send_historical_chunk(
+    connection: ActiveConnection, msg_id: int, payload: bytes
+) -> bool:
+    """Send a chunk of historical states if the client is still subscribed."""
+    if msg_id not in connection.subscriptions:
+        return False
+    connection.send_message(payload)
+    return True
+
+
+def _stream_historical_response(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    send_empty: bool,
+    buckets: int | None = None,
+) -> float:
+    """Stream a historical response in chunks.
+
+    Each chunk is sent as soon as it is generated and the next
+    chunk is only generated once the event loop has queued the
+    previous one, which keeps the memory used bounded no matter
+    how long the time window is.
+    """
+    last_time_ts = 0.0
+    for states in history.stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        HISTORY_STREAM_CHUNK_SIZE,
+        buckets,
+    ):
+        chunk_last_time_ts = _states_last_time_ts(states)
+        last_time_ts = max(last_time_ts, chunk_last_time_ts)
+        payload = _generate_websocket_response(
+            msg_id,
+            start_time,
+            dt_util.utc_from_timestamp(last_time_ts),
+            states,
+        )
+        if not run_callback_threadsafe(
+            hass.loop, _async_send_historical_chunk, connection, msg_id, payload
+        ).result():
+            # The client unsubscribed while we were streaming
+            break
+
+    if last_time_ts == 0 and send_empty:
+        # If we did not send any states ever, we need to send an empty response
+        # so the websocket client knows it should render/process/consume the
+        # data.
+        run_callback_threadsafe(
+            hass.loop,
+            _async_send_historical_chunk,
+            connection,
+            msg_id,
+            _generate_websocket_response(msg_id, start_time, end_time, {}),
+        ).result()
+    return last_time_ts
+
+
 async def _async_send_historical_states(
     hass: HomeAssistant,
     connection: ActiveConnection,
@@ -277,9 +398,28 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    chunked: bool = False,
+    buckets: int | None = None,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
+    if chunked and entity_ids:
+        last_time_ts = await instance.async_add_executor_job(
+            _stream_historical_response,
+            hass,
+            connection,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty,
+            buckets,
+        )
+        return dt_util.utc_from_timestamp(last_time_ts) if last_time_ts != 0 else None
     last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
         _generate_historical_response,
         hass,
@@ -292,6 +432,7 @@ async def _async_send_historical_states(
         minimal_response,
         no_attributes,
         send_empty,
+        buckets,
     )
     if payload:
         connection.send_message(payload)
@@ -405,6 +546,8 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
+        vol.Optional("buckets"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -444,6 +587,8 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    chunked = msg["chunked"]
+    buckets: int | None = msg.get("buckets")
 
     if end_time and end_time <= utc_now:
         if (
@@ -470,6 +615,8 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            chunked,
+            buckets,
         )
         return
 
@@ -534,6 +681,8 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        chunked,
+        buckets,
     )
 
     if msg_id not in connection.subscriptions:
@@ -578,4 +727,6 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        chunked=chunked,
+        buckets=buckets,
     )
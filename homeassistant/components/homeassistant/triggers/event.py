@@ -7,7 +7,12 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.const import CONF_EVENT_DATA, CONF_PLATFORM, EVENT_STATE_REPORTED
+from homeassistant.const import (
+    CONF_EVENT_DATA,
+    CONF_PLATFORM,
+    EVENT_STATE_REPORTED,
+    MATCH_ALL,
+)
 from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, template
@@ -170,8 +175,25 @@ async def async_attach_trigger(
         )
 
     event_filter = filter_event if event_data_items or event_data_schema else None
+    # Many triggers often listen to the same event type for different
+    # devices, index them by a string in the event data so firing an
+    # event does not call the filter of every trigger
+    index_item: tuple[str, str] | None = None
+    if event_data_items:
+        index_item = next(
+            ((key, value) for key, value in event_data_items if isinstance(value, str)),
+            None,
+        )
     removes = [
-        hass.bus.async_listen(
+        hass.bus.async_listen_indexed(
+            event_type,
+            handle_event,
+            *index_item,
+            event_filter=event_filter,
+            run_immediately=True,
+        )
+        if index_item is not None and event_type != MATCH_ALL
+        else hass.bus.async_listen(
             event_type, handle_event, event_filter=event_filter, run_immediately=True
         )
         for event_type in event_types
@@ -808,7 +808,7 @@ class HomeKit:
         entity_states: list[State] = []
         entity_filter = self._filter.get_filter()
         entries = ent_reg.entities
-        for state in self.hass.states.async_all():
+        for state in self.hass.states.async_snapshot():
             entity_id = state.entity_id
             if not entity_filter(entity_id):
                 continue
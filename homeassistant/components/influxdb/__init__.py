@@ -14,7 +14,7 @@ from typing import Any
 
 from influxdb import InfluxDBClient, exceptions
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
-from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
+from influxdb_client.client.write_api import SYNCHRONOUS
 from influxdb_client.rest import ApiException
 import requests.exceptions
 import urllib3.exceptions
@@ -47,12 +47,16 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     API_VERSION_2,
     BATCH_BUFFER_SIZE,
+    BATCH_BUFFER_SIZE_MAX,
+    BATCH_LATENCY_SMOOTHING,
     BATCH_TIMEOUT,
+    BATCH_WRITE_LATENCY,
     CATCHING_UP_MESSAGE,
     CLIENT_ERROR_V1,
     CLIENT_ERROR_V2,
@@ -96,12 +100,19 @@ from .const import (
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_DIR,
+    SPOOL_FULL_MESSAGE,
+    SPOOL_MAX_BYTES,
+    SPOOLING_MESSAGE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
+    WROTE_SPOOLED_MESSAGE,
 )
+from .line_protocol import points_to_lines
+from .spool import LineSpool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -327,6 +338,7 @@ class InfluxClient:
 
     data_repositories: list[str]
     write: Callable[[str], None]
+    write_lines: Callable[[list[str]], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -348,11 +360,13 @@ def get_influx_connection(  # noqa: C901
         kwargs[CONF_VERIFY_SSL] = conf[CONF_VERIFY_SSL]
         if CONF_SSL_CA_CERT in conf:
             kwargs[CONF_SSL_CA_CERT] = conf[CONF_SSL_CA_CERT]
+        kwargs["enable_gzip"] = True
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
-        initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
-        write_api = influx.write_api(write_options=initial_write_mode)
+        # Writes are batched, retried and spooled by the InfluxDB thread,
+        # which needs the write to raise errors and to measure its latency
+        write_api = influx.write_api(write_options=SYNCHRONOUS)
 
         def write_v2(json):
             """Write data to V2 influx."""
@@ -370,6 +384,10 @@ def get_influx_connection(  # noqa: C901
                     raise ValueError(WRITE_ERROR % (json, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
+        def write_lines_v2(lines):
+            """Write line protocol to V2 influx."""
+            write_v2(lines)
+
         def query_v2(query, _=None):
             """Query V2 influx."""
             try:
@@ -391,7 +409,6 @@ def get_influx_connection(  # noqa: C901
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
                 write_v2(b"")
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -400,7 +417,7 @@ def get_influx_connection(  # noqa: C901
             else:
                 buckets = []
 
-        return InfluxClient(buckets, write_v2, query_v2, close_v2)
+        return InfluxClient(buckets, write_v2, write_lines_v2, query_v2, close_v2)
 
     # Else it's a V1 client
     if CONF_SSL_CA_CERT in conf and conf[CONF_VERIFY_SSL]:
@@ -429,12 +446,16 @@ def get_influx_connection(  # noqa: C901
     if CONF_SSL in conf:
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
+    kwargs["gzip"] = True
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
+    def write_v1(json, protocol="json"):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            if protocol == "json":
+                influx.write_points(json, time_precision=precision)
+            else:
+                influx.write_points(json, time_precision=precision, protocol=protocol)
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -446,6 +467,10 @@ def get_influx_connection(  # noqa: C901
                 raise ValueError(WRITE_ERROR % (json, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
+    def write_lines_v1(lines):
+        """Write line protocol to V1 influx."""
+        write_v1(lines, protocol="line")
+
     def query_v1(query, database=None):
         """Query V1 influx."""
         try:
@@ -472,7 +497,7 @@ def get_influx_connection(  # noqa: C901
     if test_read:
         databases = [db["name"] for db in query_v1(TEST_QUERY_V1)]
 
-    return InfluxClient(databases, write_v1, query_v1, close_v1)
+    return InfluxClient(databases, write_v1, write_lines_v1, query_v1, close_v1)
 
 
 def _retry_setup(hass: HomeAssistant, config: ConfigType) -> None:
@@ -493,7 +518,10 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool = LineSpool(hass.config.path(STORAGE_DIR, SPOOL_DIR), SPOOL_MAX_BYTES)
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_json, max_tries, spool, conf.get(CONF_PRECISION)
+    )
     instance.start()
 
     def shutdown(event):
@@ -510,7 +538,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(self, hass, influx, event_to_json, max_tries, spool, precision):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue: queue.SimpleQueue[threading.Event | tuple[float, Event] | None] = (
@@ -519,6 +547,10 @@ class InfluxThread(threading.Thread):
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.spool: LineSpool = spool
+        self.precision = precision
+        self.batch_size = BATCH_BUFFER_SIZE
+        self.point_latency: float | None = None
         self.write_errors = 0
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
@@ -541,11 +573,15 @@ class InfluxThread(threading.Thread):
         count = 0
         json = []
 
-        dropped = 0
+        old_json = []
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
-                timeout = None if count == 0 else self.batch_timeout()
+            while len(json) < self.batch_size and not self.shutdown:
+                if count:
+                    timeout = self.batch_timeout()
+                else:
+                    # Wake up to retry writing spooled events without new events
+                    timeout = RETRY_DELAY if self.spool else None
                 item = self.queue.get(timeout=timeout)
                 count += 1
 
@@ -555,24 +591,77 @@ class InfluxThread(threading.Thread):
                     timestamp, event = item
                     age = time.monotonic() - timestamp
 
-                    if age < queue_seconds:
-                        if event_json := self.event_to_json(event):
+                    if event_json := self.event_to_json(event):
+                        if age < queue_seconds:
                             json.append(event_json)
-                    else:
-                        dropped += 1
+                        else:
+                            old_json.append(event_json)
                 elif isinstance(item, threading.Event):
                     item.set()
 
-        if dropped:
-            _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
+        if old_json and self.spool_points(old_json):
+            _LOGGER.warning(CATCHING_UP_MESSAGE, len(old_json))
 
         return count, json
 
+    def spool_points(self, json):
+        """Spool points to write them once InfluxDB keeps up again."""
+        if not (lines := points_to_lines(json, self.precision)):
+            return True
+        if self.spool.append(lines):
+            return True
+        _LOGGER.warning(SPOOL_FULL_MESSAGE, len(json))
+        self.write_errors += len(json)
+        return False
+
+    def timed_write(self, write, data):
+        """Write data and adjust the batch size to the latency of the write."""
+        start = time.monotonic()
+        write(data)
+        latency = (time.monotonic() - start) / len(data)
+        if self.point_latency is None:
+            self.point_latency = latency
+        else:
+            self.point_latency += BATCH_LATENCY_SMOOTHING * (
+                latency - self.point_latency
+            )
+        if self.point_latency > 0:
+            batch_size = int(BATCH_WRITE_LATENCY / self.point_latency)
+        else:
+            batch_size = BATCH_BUFFER_SIZE_MAX
+        self.batch_size = min(max(batch_size, BATCH_BUFFER_SIZE), BATCH_BUFFER_SIZE_MAX)
+
+    def write_spooled(self):
+        """Write spooled events in order, without waiting between attempts."""
+        written = 0
+        while self.spool:
+            count, lines = self.spool.peek(self.batch_size)
+            try:
+                if lines:
+                    self.timed_write(self.influx.write_lines, lines)
+            except ValueError as err:
+                _LOGGER.error(err)
+            except ConnectionError:
+                return
+            self.spool.consume(count)
+            written += len(lines)
+
+        _LOGGER.info(WROTE_SPOOLED_MESSAGE, written)
+        if self.write_errors:
+            _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
+            self.write_errors = 0
+
     def write_to_influxdb(self, json):
         """Write preprocessed events to influxdb, with retry."""
+        if self.spool:
+            # Queue up behind the spooled events to write everything in order
+            self.spool_points(json)
+            self.write_spooled()
+            return
+
         for retry in range(self.max_tries + 1):
             try:
-                self.influx.write(json)
+                self.timed_write(self.influx.write, json)
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
@@ -587,16 +676,18 @@ class InfluxThread(threading.Thread):
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
                 else:
-                    if not self.write_errors:
-                        _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    _LOGGER.error(SPOOLING_MESSAGE, err)
+                    self.spool_points(json)
 
     def run(self):
         """Process incoming events."""
+        self.spool.load()
         while not self.shutdown:
-            _, json = self.get_events_json()
+            count, json = self.get_events_json()
             if json:
                 self.write_to_influxdb(json)
+            elif not count and self.spool:
+                self.write_spooled()
 
     def block_till_done(self):
         """Block till all events processed.
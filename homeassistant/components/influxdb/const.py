@@ -78,6 +78,11 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+BATCH_BUFFER_SIZE_MAX = 5000
+BATCH_WRITE_LATENCY = 2  # seconds
+BATCH_LATENCY_SMOOTHING = 0.2
+SPOOL_DIR = "influxdb_spool"
+SPOOL_MAX_BYTES = 50 * 1024 * 1024
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -117,8 +122,11 @@ QUERY_ERROR = (
     "Could not execute query '%s' due to '%s'. Check the syntax of your query."
 )
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
-CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
+CATCHING_UP_MESSAGE = "Catching up, spooled %d old events to write later."
+SPOOL_FULL_MESSAGE = "Spool is full, dropped %d events."
+SPOOLING_MESSAGE = "%s Spooling events until InfluxDB is available again."
 RESUMED_MESSAGE = "Resumed, lost %d events."
+WROTE_SPOOLED_MESSAGE = "Wrote %d spooled events."
 WROTE_MESSAGE = "Wrote %d events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
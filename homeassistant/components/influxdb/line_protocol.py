@@ -0,0 +1,79 @@
+"""Encode InfluxDB points as line protocol."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    INFLUX_CONF_FIELDS,
+    INFLUX_CONF_MEASUREMENT,
+    INFLUX_CONF_TAGS,
+    INFLUX_CONF_TIME,
+)
+
+NANOSECONDS_PER_PRECISION = {
+    "ns": 1,
+    "us": 1_000,
+    "ms": 1_000_000,
+    "s": 1_000_000_000,
+}
+
+_ESCAPE_MEASUREMENT = str.maketrans({",": r"\,", " ": r"\ ", "\n": r"\n"})
+_ESCAPE_KEY = str.maketrans({",": r"\,", "=": r"\=", " ": r"\ ", "\n": r"\n"})
+_ESCAPE_STRING = str.maketrans({'"': r"\"", "\\": r"\\", "\n": r"\n"})
+
+_EPOCH = dt_util.utc_from_timestamp(0)
+
+
+def _timestamp(time: datetime, precision: str | None) -> int:
+    """Return the timestamp of a point in the given precision."""
+    nanoseconds = (time - _EPOCH) // timedelta(microseconds=1) * 1_000
+    return nanoseconds // NANOSECONDS_PER_PRECISION[precision or "ns"]
+
+
+def _field_value(value: Any) -> str:
+    """Encode a field value."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return f"{value}i"
+    if isinstance(value, float):
+        return repr(value)
+    return f'"{str(value).translate(_ESCAPE_STRING)}"'
+
+
+def point_to_line(point: dict[str, Any], precision: str | None) -> str | None:
+    """Encode a point in the format used for JSON writes as line protocol.
+
+    Returns None for points without fields, they cannot be written.
+    """
+    fields = ",".join(
+        f"{str(key).translate(_ESCAPE_KEY)}={_field_value(value)}"
+        for key, value in point[INFLUX_CONF_FIELDS].items()
+        if value is not None
+    )
+    if not fields:
+        return None
+    line = str(point[INFLUX_CONF_MEASUREMENT]).translate(_ESCAPE_MEASUREMENT)
+    for key, value in sorted(point[INFLUX_CONF_TAGS].items()):
+        if value is None or value == "":
+            continue
+        line += (
+            f",{str(key).translate(_ESCAPE_KEY)}={str(value).translate(_ESCAPE_KEY)}"
+        )
+    line += f" {fields}"
+    if (time := point.get(INFLUX_CONF_TIME)) is not None:
+        line += f" {_timestamp(time, precision)}"
+    return line
+
+
+def points_to_lines(points: list[dict[str, Any]], precision: str | None) -> list[str]:
+    """Encode points as line protocol, skipping points without fields."""
+    return [
+        line
+        for point in points
+        if (line := point_to_line(point, precision)) is not None
+    ]
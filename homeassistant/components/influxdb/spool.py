@@ -0,0 +1,113 @@
+"""On-disk spool for points that could not be written to InfluxDB."""
+
+from __future__ import annotations
+
+from collections import deque
+import logging
+import os
+
+from homeassistant.util.file import WriteError, write_utf8_file
+
+_LOGGER = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".lp"
+
+
+class LineSpool:
+    """First in, first out spool of line protocol batches.
+
+    Each batch is stored in a segment file named after its sequence number
+    so batches are replayed in the order they were spooled, also after a
+    restart. The spool is only used from the InfluxDB thread.
+    """
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._segments: deque[tuple[int, int, int]] = deque()
+        self._next_segment = 0
+
+    def __bool__(self) -> bool:
+        """Return if there are spooled lines."""
+        return bool(self._segments)
+
+    def __len__(self) -> int:
+        """Return the number of spooled lines."""
+        return sum(lines for _, lines, _ in self._segments)
+
+    def _segment_path(self, segment: int) -> str:
+        """Return the path of a segment file."""
+        return os.path.join(self.path, f"{segment:012d}{SEGMENT_SUFFIX}")
+
+    def load(self) -> None:
+        """Load the segments left from before a restart."""
+        try:
+            names = os.listdir(self.path)
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            _LOGGER.error("Could not read the spool at %s: %s", self.path, err)
+            return
+
+        for name in sorted(names):
+            segment, suffix = os.path.splitext(name)
+            if suffix != SEGMENT_SUFFIX or not segment.isdigit():
+                continue
+            try:
+                with open(os.path.join(self.path, name), encoding="utf-8") as file:
+                    content = file.read()
+            except OSError as err:
+                _LOGGER.error("Could not read spooled points %s: %s", name, err)
+                continue
+            self._add_segment(int(segment), content)
+
+    def _add_segment(self, segment: int, content: str) -> None:
+        """Account for a segment that is stored on disk."""
+        size = len(content.encode())
+        self._segments.append((segment, content.count("\n"), size))
+        self.size += size
+        self._next_segment = segment + 1
+
+    def append(self, lines: list[str]) -> bool:
+        """Append a batch of lines, return False if they were not spooled."""
+        content = "".join(f"{line}\n" for line in lines)
+        if self.size + len(content.encode()) > self.max_bytes:
+            return False
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            write_utf8_file(self._segment_path(self._next_segment), content)
+        except (OSError, WriteError):
+            return False
+        self._add_segment(self._next_segment, content)
+        return True
+
+    def peek(self, max_lines: int) -> tuple[int, list[str]]:
+        """Return the oldest segments with up to max_lines lines.
+
+        At least one segment is returned, returns the number of segments
+        and their lines.
+        """
+        lines: list[str] = []
+        count = 0
+        for segment, segment_lines, _ in self._segments:
+            if count and len(lines) + segment_lines > max_lines:
+                break
+            try:
+                with open(self._segment_path(segment), encoding="utf-8") as file:
+                    lines.extend(file.read().splitlines())
+            except OSError as err:
+                _LOGGER.error("Could not read spooled points %s: %s", segment, err)
+            count += 1
+        return count, lines
+
+    def consume(self, count: int) -> None:
+        """Remove the oldest segments."""
+        for _ in range(count):
+            segment, _, size = self._segments.popleft()
+            self.size -= size
+            try:
+                os.remove(self._segment_path(segment))
+            except OSError as err:
+                _LOGGER.error("Could not remove spooled points %s: %s", segment, err)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -19,6 +20,7 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_NAME,
     EVENT_LOGBOOK_ENTRY,
+    MATCH_ALL,
 )
 from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
@@ -44,7 +46,7 @@ from .const import (  # noqa: F401
     LOGBOOK_ENTRY_NAME,
     LOGBOOK_ENTRY_SOURCE,
 )
-from .models import LazyEventPartialState, LogbookConfig
+from .models import ContextOriginIndex, LazyEventPartialState, LogbookConfig
 
 CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA}, extra=vol.ALLOW_EXTRA
@@ -136,7 +138,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     external_events: dict[
         str, tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]]
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    context_origins = ContextOriginIndex(time.time())
+    hass.bus.async_listen(MATCH_ALL, context_origins.async_add, run_immediately=True)
+    hass.data[DOMAIN] = LogbookConfig(
+        external_events, filters, entities_filter, context_origins
+    )
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
@@ -20,6 +20,10 @@ CONDITIONALLY_CONTINUOUS_DOMAINS = {SENSOR_DOMAIN}
 
 ATTR_MESSAGE = "message"
 
+# Number of contexts in each generation of the context origin index,
+# the index remembers between one and two generations of contexts
+CONTEXT_ORIGINS_GENERATION_SIZE = 5000
+
 DOMAIN = "logbook"
 
 CONTEXT_USER_ID = "context_user_id"
@@ -15,11 +15,13 @@ from homeassistant.components.recorder.models import (
     ulid_to_bytes_or_none,
     uuid_hex_to_bytes_or_none,
 )
-from homeassistant.const import ATTR_ICON, EVENT_STATE_CHANGED
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_ICON, EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, State, callback
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+from .const import CONTEXT_ORIGINS_GENERATION_SIZE
+
 if TYPE_CHECKING:
     from functools import cached_property
 else:
@@ -35,6 +37,51 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    context_origins: ContextOriginIndex | None = None
+
+
+class ContextOriginIndex:
+    """Index of the event that started each recently used context.
+
+    Contexts are added to the current generation when an event is fired
+    with them. When the current generation is full it becomes the previous
+    generation and the old previous generation is dropped, so the index
+    knows the origin of every context that was used after complete_after.
+
+    The index is only updated from the event loop, lookups are safe from
+    any thread since the generations are replaced instead of cleared.
+    """
+
+    def __init__(self, created: float) -> None:
+        """Init the index."""
+        self.complete_after = created
+        self._current_started = created
+        self.generations: tuple[dict[str, Event], dict[str, Event]] = ({}, {})
+
+    @callback
+    def async_add(self, event: Event) -> None:
+        """Remember the origin of the context of an event."""
+        context = event.context
+        current, previous = self.generations
+        if (context_id := context.id) in current:
+            return
+        current[context_id] = previous.get(context_id) or context.origin_event or event
+        if len(current) < CONTEXT_ORIGINS_GENERATION_SIZE:
+            return
+        # complete_after must be raised before the previous generation
+        # is dropped for readers in other threads
+        self.complete_after = self._current_started
+        self._current_started = event.time_fired_timestamp
+        self.generations = ({}, current)
+
+    def covers(self, start: float) -> bool:
+        """Return if the origins of all contexts used after start are known."""
+        return start > self.complete_after
+
+    def get(self, context_id: str) -> Event | None:
+        """Return the origin event of a context."""
+        current, previous = self.generations
+        return current.get(context_id) or previous.get(context_id)
 
 
 class LazyEventPartialState:
@@ -151,3 +198,24 @@ def async_event_to_row(event: Event) -> EventAsRow:
         row_id=hash(event),
         icon=new_state.attributes.get(ATTR_ICON),
     )
+
+
+def origin_event_to_row(event: Event) -> EventAsRow:
+    """Convert an origin event to a row.
+
+    Unlike the events streamed to the logbook, the origin of a context
+    can be a state_changed event for a removed entity.
+    """
+    if event.event_type != EVENT_STATE_CHANGED or event.data.get("new_state"):
+        return async_event_to_row(event)
+    context = event.context
+    return EventAsRow(
+        data=event.data,
+        context=context,
+        entity_id=event.data[ATTR_ENTITY_ID],
+        context_id_bin=ulid_to_bytes(context.id),
+        context_user_id_bin=uuid_hex_to_bytes_or_none(context.user_id),
+        context_parent_id_bin=ulid_to_bytes_or_none(context.parent_id),
+        time_fired_ts=event.time_fired_timestamp,
+        row_id=hash(event),
+    )
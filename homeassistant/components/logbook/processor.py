@@ -15,6 +15,7 @@ from sqlalchemy.engine.row import Row
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import (
+    bytes_to_ulid_or_none,
     bytes_to_uuid_hex_or_none,
     extract_event_type_ids,
     extract_metadata_ids,
@@ -62,7 +63,14 @@ from .const import (
     LOGBOOK_ENTRY_WHEN,
 )
 from .helpers import is_sensor_continuous
-from .models import EventAsRow, LazyEventPartialState, LogbookConfig, async_event_to_row
+from .models import (
+    ContextOriginIndex,
+    EventAsRow,
+    LazyEventPartialState,
+    LogbookConfig,
+    async_event_to_row,
+    origin_event_to_row,
+)
 from .queries import statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
@@ -82,6 +90,69 @@ class LogbookRun:
     include_entity_name: bool
     format_time: Callable[[Row | EventAsRow], Any]
     memoize_new_contexts: bool = True
+    context_origins: ContextOriginLookup | None = None
+
+
+class ContextOriginLookup:
+    """Look up the origin of the contexts of a request in the index.
+
+    The rows of the request are memoized separately so the shared context
+    lookup is left as is if the index stops covering the request while it
+    is processed and the request has to be repeated with context only rows.
+    """
+
+    def __init__(
+        self,
+        index: ContextOriginIndex,
+        start: float,
+        context_lookup: dict[bytes | None, Row | EventAsRow | None],
+    ) -> None:
+        """Init the lookup."""
+        self.index = index
+        self.start = start
+        self.context_lookup = context_lookup
+        self.rows: dict[bytes | None, Row | EventAsRow | None] = {}
+        self.origins: dict[bytes, Row | EventAsRow] = {}
+        self.complete = True
+
+    def get(self, context_id_bin: bytes) -> Row | EventAsRow | None:
+        """Return the origin row of a context used by the rows seen so far.
+
+        Like the context only rows, only the contexts used by the
+        rows of the request are resolved.
+        """
+        if context_id_bin in self.context_lookup:
+            return self.context_lookup[context_id_bin]
+        if origin := self.origins.get(context_id_bin):
+            return origin
+        if not (row := self.rows.get(context_id_bin)):
+            return None
+        origin = row
+        if (context_id := bytes_to_ulid_or_none(context_id_bin)) is None or (
+            origin_event := self.index.get(context_id)
+        ) is None:
+            if not self.index.covers(self.start):
+                self.complete = False
+        elif not _same_event(row, origin_row := origin_event_to_row(origin_event)):
+            origin = origin_row
+        self.origins[context_id_bin] = origin
+        return origin
+
+    def merge(self) -> bool:
+        """Merge the origins into the shared context lookup.
+
+        Returns False if the index did not cover the whole request.
+        """
+        origins = [
+            (context_id_bin, self.get(context_id_bin))
+            for context_id_bin in self.rows
+            if context_id_bin is not None
+        ]
+        if not self.complete:
+            return False
+        for context_id_bin, origin in origins:
+            self.context_lookup.setdefault(context_id_bin, origin)
+        return True
 
 
 class EventProcessor:
@@ -109,6 +180,7 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        self.context_origin_index = logbook_config.context_origins
         format_time = (
             _row_time_fired_timestamp if timestamp else _row_time_fired_isoformat
         )
@@ -141,7 +213,34 @@ class EventProcessor:
         start_day: dt,
         end_day: dt,
     ) -> list[dict[str, Any]]:
-        """Get events for a period of time."""
+        """Get events for a period of time.
+
+        For entities and devices the origins of the contexts are taken from
+        the context origin index instead of the database when it covers the
+        period.
+        """
+        logbook_run = self.logbook_run
+        if (
+            (self.entity_ids or self.device_ids)
+            and (index := self.context_origin_index) is not None
+            and index.covers(start := start_day.timestamp())
+        ):
+            context_origins = ContextOriginLookup(
+                index, start, logbook_run.context_lookup
+            )
+            logbook_run.context_origins = context_origins
+            try:
+                events = self._get_events(start_day, end_day, False)
+            finally:
+                logbook_run.context_origins = None
+            if context_origins.merge():
+                return events
+        return self._get_events(start_day, end_day, True)
+
+    def _get_events(
+        self, start_day: dt, end_day: dt, context_only_rows: bool
+    ) -> list[dict[str, Any]]:
+        """Get events for a period of time from the database."""
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -165,6 +264,7 @@ class EventProcessor:
                 self.device_ids,
                 self.filters,
                 self.context_id,
+                context_only_rows,
             )
             return self.humanify(
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
@@ -202,7 +302,10 @@ def _humanify(
     include_entity_name = logbook_run.include_entity_name
     format_time = logbook_run.format_time
     memoize_new_contexts = logbook_run.memoize_new_contexts
-    memoize_context = context_lookup.setdefault
+    if (context_origins := logbook_run.context_origins) is not None:
+        memoize_context = context_origins.rows.setdefault
+    else:
+        memoize_context = context_lookup.setdefault
 
     # Process rows
     for row in rows:
@@ -279,6 +382,7 @@ class ContextAugmenter:
 
     def __init__(self, logbook_run: LogbookRun) -> None:
         """Init the augmenter."""
+        self.logbook_run = logbook_run
         self.context_lookup = logbook_run.context_lookup
         self.entity_name_cache = logbook_run.entity_name_cache
         self.external_events = logbook_run.external_events
@@ -289,10 +393,12 @@ class ContextAugmenter:
         self, context_id_bin: bytes | None, row: Row | EventAsRow
     ) -> Row | EventAsRow | None:
         """Get the context row from the id or row context."""
-        if context_id_bin is not None and (
-            context_row := self.context_lookup.get(context_id_bin)
-        ):
-            return context_row
+        if context_id_bin is not None:
+            if (context_origins := self.logbook_run.context_origins) is not None:
+                if context_row := context_origins.get(context_id_bin):
+                    return context_row
+            elif context_row := self.context_lookup.get(context_id_bin):
+                return context_row
         if (context := getattr(row, "context", None)) is not None and (
             origin_event := context.origin_event
         ) is not None:
@@ -380,6 +486,15 @@ def _rows_match(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
     )
 
 
+def _same_event(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
+    """Check if a row from the database and an origin row are the same event."""
+    return (
+        row.time_fired_ts == other_row.time_fired_ts
+        and row.event_type == other_row.event_type
+        and row.entity_id == other_row.entity_id
+    )
+
+
 def _row_time_fired_isoformat(row: Row | EventAsRow) -> str:
     """Convert the row timed_fired to isoformat."""
     return process_timestamp_to_utc_isoformat(
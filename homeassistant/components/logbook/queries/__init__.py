@@ -26,8 +26,14 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    context_only_rows: bool = True,
 ) -> StatementLambdaElement:
-    """Generate the logbook statement for a logbook request."""
+    """Generate the logbook statement for a logbook request.
+
+    Entity and device requests also select the rows that share a context
+    with the matched rows, unless context_only_rows is False because the
+    origins of the contexts are looked up elsewhere.
+    """
     start_day = start_day_dt.timestamp()
     end_day = end_day_dt.timestamp()
     # No entities: logbook sends everything for the timeframe
@@ -56,6 +62,7 @@ def statement_for_request(
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
             [json_dumps(device_id) for device_id in device_ids],
+            context_only_rows,
         )
 
     # entities: logbook sends everything for the timeframe for the entities
@@ -66,6 +73,7 @@ def statement_for_request(
             event_type_ids,
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
+            context_only_rows,
         )
 
     # devices: logbook sends everything for the timeframe for the devices
@@ -75,4 +83,5 @@ def statement_for_request(
         end_day,
         event_type_ids,
         [json_dumps(device_id) for device_id in device_ids],
+        context_only_rows,
     )
@@ -80,8 +80,15 @@ def devices_stmt(
     end_day: float,
     event_type_ids: tuple[int, ...],
     json_quotable_device_ids: list[str],
+    context_only_rows: bool = True,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple devices."""
+    if not context_only_rows:
+        return lambda_stmt(
+            lambda: select_events_without_states(start_day, end_day, event_type_ids)
+            .where(apply_event_device_id_matchers(json_quotable_device_ids))
+            .order_by(Events.time_fired_ts)
+        )
     stmt = lambda_stmt(
         lambda: _apply_devices_context_union(
             select_events_without_states(start_day, end_day, event_type_ids).where(
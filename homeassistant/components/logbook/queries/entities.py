@@ -99,8 +99,18 @@ def entities_stmt(
     event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
     json_quoted_entity_ids: list[str],
+    context_only_rows: bool = True,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
+    if not context_only_rows:
+        return lambda_stmt(
+            lambda: select_events_without_states(start_day, end_day, event_type_ids)
+            .where(apply_event_entity_id_matchers(json_quoted_entity_ids))
+            .union_all(
+                states_select_for_entity_ids(start_day, end_day, states_metadata_ids)
+            )
+            .order_by(Events.time_fired_ts)
+        )
     return lambda_stmt(
         lambda: _apply_entities_context_union(
             select_events_without_states(start_day, end_day, event_type_ids).where(
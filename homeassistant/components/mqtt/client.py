@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterable, Iterator
 from dataclasses import dataclass
-from functools import lru_cache
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -92,6 +92,10 @@ INITIAL_SUBSCRIBE_COOLDOWN = 1.0
 SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
+# The maximum number of received messages handled in one event loop
+# iteration, the rest is handled in the next iterations so other
+# callbacks are not delayed by a burst of messages
+MAX_MESSAGES_PER_BATCH = 500
 
 SubscribePayloadType = str | bytes  # Only bytes if encoding is None
 
@@ -226,12 +230,11 @@ def subscribe(
     return remove
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
-    matcher: Any
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -303,6 +306,143 @@ def _is_simple_match(topic: str) -> bool:
     return not ("+" in topic or "#" in topic)
 
 
+class _SubscriptionTrieNode:
+    """A level of the subscription topics in a SubscriptionTrie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Match topics against wildcard subscriptions.
+
+    The levels of the subscription topics are stored in a trie, so
+    matching a topic only visits the nodes of its levels and the
+    wildcards next to them, instead of testing every subscription.
+    Subscriptions can be added and removed without rebuilding it.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+
+    def __contains__(self, topic: str) -> bool:
+        """Return if a subscription topic has subscriptions."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over all subscriptions."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions.append(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises ValueError if the subscription was not added.
+        """
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                raise ValueError(subscription)
+            path.append((node, level))
+            node = child
+        node.subscriptions.remove(subscription)
+        # Prune the levels that are no longer used by any subscription
+        for parent, level in reversed(path):
+            if node.subscriptions or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        subscriptions: list[Subscription] = []
+        # Wildcards in the first level do not match topics starting with $
+        _match_subscriptions(
+            self._root,
+            topic.split("/"),
+            0,
+            not topic.startswith("$"),
+            subscriptions,
+        )
+        return subscriptions
+
+
+def _match_subscriptions(
+    node: _SubscriptionTrieNode,
+    levels: list[str],
+    index: int,
+    wildcards: bool,
+    subscriptions: list[Subscription],
+) -> None:
+    """Collect the subscriptions of a node and its children matching the levels."""
+    children = node.children
+    if wildcards and (multi_level := children.get("#")) is not None:
+        # A multi-level wildcard also matches the parent level
+        subscriptions.extend(multi_level.subscriptions)
+    if index == len(levels):
+        subscriptions.extend(node.subscriptions)
+        return
+    if (child := children.get(levels[index])) is not None:
+        _match_subscriptions(child, levels, index + 1, True, subscriptions)
+    if wildcards and (single_level := children.get("+")) is not None:
+        _match_subscriptions(single_level, levels, index + 1, True, subscriptions)
+
+
+class MessageRateCounter:
+    """Count messages and the number of messages of the last full second."""
+
+    __slots__ = ("total", "_second", "_count", "_last_count")
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self.total = 0
+        self._second = 0
+        self._count = 0
+        self._last_count = 0
+
+    def add(self, second: int, count: int = 1) -> None:
+        """Count messages in a second of the monotonic clock."""
+        self.total += count
+        if second != self._second:
+            self._last_count = self._count if second == self._second + 1 else 0
+            self._second = second
+            self._count = 0
+        self._count += count
+
+    def per_second(self, second: int) -> int:
+        """Return the number of messages of the last full second."""
+        if second == self._second:
+            return self._last_count
+        if second == self._second + 1:
+            return self._count
+        return 0
+
+
 class EnsureJobAfterCooldown:
     """Ensure a cool down period before executing a job.
 
@@ -395,12 +535,19 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
         # which has subscribed messages.
         self._retained_topics: dict[Subscription, set[str]] = {}
+        # Messages are received by the paho thread and handed off to the
+        # event loop in batches, see _mqtt_on_message
+        self._pending_messages: deque[mqtt.MQTTMessage] = deque()
+        self._pending_messages_scheduled = False
+        self._messages_received = MessageRateCounter()
+        self._messages_dispatched = MessageRateCounter()
+        self._message_batches = 0
         self.connected = False
         self._ha_started = asyncio.Event()
         self._cleanup_on_unload: list[Callable[[], None]] = []
@@ -478,8 +625,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions or topic in self._wildcard_subscriptions
         )
 
     async def async_publish(
@@ -560,30 +707,25 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if _is_simple_match(subscription.topic):
             self._simple_subscriptions.setdefault(subscription.topic, []).append(
                 subscription
             )
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -628,11 +770,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -642,7 +781,6 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
             if subscription in self._retained_topics:
                 del self._retained_topics[subscription]
             # Only unsubscribe if currently connected
@@ -805,18 +943,54 @@ class MQTT:
         # and since they come in via a thread and need to be processed in the event loop,
         # we want to avoid hass.add_job since most of the time is spent calling
         # inspect to figure out how to run the callback.
-        self.loop.call_soon_threadsafe(self._mqtt_handle_message, msg)
+        #
+        # Waking up the event loop is expensive as well, so the messages are
+        # queued and only the first message since the last batch was handled
+        # schedules handling the batch. Appending to a deque and checking the
+        # flag are atomic, see _mqtt_handle_pending_messages for the other side.
+        self._pending_messages.append(msg)
+        if not self._pending_messages_scheduled:
+            self._pending_messages_scheduled = True
+            self.loop.call_soon_threadsafe(self._mqtt_handle_pending_messages)
+
+    @callback
+    def _mqtt_handle_pending_messages(self) -> None:
+        """Handle the messages queued by the paho thread."""
+        pending_messages = self._pending_messages
+        handle_message = self._mqtt_handle_message
+        self._message_batches += 1
+        # Reset the flag before taking the messages, so a message queued
+        # after this point is either handled now or schedules a new batch
+        self._pending_messages_scheduled = False
+        for _ in range(MAX_MESSAGES_PER_BATCH):
+            try:
+                msg = pending_messages.popleft()
+            except IndexError:
+                return
+            handle_message(msg)
+        if pending_messages and not self._pending_messages_scheduled:
+            # Handle the rest in the next iteration, the loop is
+            # already awake so there is no need to wake it up threadsafe
+            self._pending_messages_scheduled = True
+            self.loop.call_soon(self._mqtt_handle_pending_messages)
+
+    @callback
+    def async_message_statistics(self) -> dict[str, int]:
+        """Return statistics about the received messages."""
+        second = int(time.monotonic())
+        return {
+            "received": self._messages_received.total,
+            "received_per_second": self._messages_received.per_second(second),
+            "dispatched": self._messages_dispatched.total,
+            "dispatched_per_second": self._messages_dispatched.per_second(second),
+            "batches": self._message_batches,
+            "pending": len(self._pending_messages),
+        }
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        subscriptions = self._wildcard_subscriptions.matches(topic)
         if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            if subscription.matcher(topic)
-        )
+            subscriptions[:0] = self._simple_subscriptions[topic]
         return subscriptions
 
     @callback
@@ -833,8 +1007,11 @@ class MQTT:
             msg.payload[0:8192],
         )
         timestamp = dt_util.utcnow()
+        second = int(time.monotonic())
+        self._messages_received.add(second)
 
         subscriptions = self._matching_subscriptions(topic)
+        dispatched = 0
 
         for subscription in subscriptions:
             if msg.retain:
@@ -869,6 +1046,9 @@ class MQTT:
                     timestamp,
                 ),
             )
+            dispatched += 1
+        if dispatched:
+            self._messages_dispatched.add(second, dispatched)
         self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
     def _mqtt_on_callback(
@@ -965,13 +1145,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
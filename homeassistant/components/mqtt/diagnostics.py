@@ -69,6 +69,7 @@ def _async_get_diagnostics(
                 )
             ],
             mqtt_debug_info=debug_info.info_for_config_entry(hass),
+            message_statistics=mqtt_instance.async_message_statistics(),
         )
 
     return data
@@ -278,13 +278,12 @@ def async_handle_schema_error(
 async def _async_discover(
     hass: HomeAssistant,
     domain: str,
-    setup: Callable[[MQTTDiscoveryPayload], None] | None,
-    async_setup: Callable[[MQTTDiscoveryPayload], Coroutine[Any, Any, None]] | None,
+    async_setup: Callable[[MQTTDiscoveryPayload], Coroutine[Any, Any, None]],
     discovery_payload: MQTTDiscoveryPayload,
 ) -> None:
-    """Discover and add an MQTT entity, automation or tag.
+    """Discover and add an MQTT automation or tag.
 
-    setup is to be run in the event loop when there is nothing to be awaited.
+    Discovered entities are set up in batches by async_setup_entity_entry_helper.
     """
     if not mqtt_config_entry_enabled(hass):
         _LOGGER.warning(
@@ -298,10 +297,7 @@ async def _async_discover(
         return
     discovery_data = discovery_payload.discovery_data
     try:
-        if setup is not None:
-            setup(discovery_payload)
-        elif async_setup is not None:
-            await async_setup(discovery_payload)
+        await async_setup(discovery_payload)
     except vol.Invalid as err:
         discovery_hash = discovery_data[ATTR_DISCOVERY_HASH]
         clear_discovery_hash(hass, discovery_hash)
@@ -334,7 +330,7 @@ async def async_setup_non_entity_entry_helper(
     async def async_setup_from_discovery(
         discovery_payload: MQTTDiscoveryPayload,
     ) -> None:
-        """Set up an MQTT entity, automation or tag from discovery."""
+        """Set up an MQTT automation or tag from discovery."""
         config: ConfigType = discovery_schema(discovery_payload)
         await async_setup(config, discovery_data=discovery_payload.discovery_data)
 
@@ -343,7 +339,7 @@ async def async_setup_non_entity_entry_helper(
             hass,
             MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
             functools.partial(
-                _async_discover, hass, domain, None, async_setup_from_discovery
+                _async_discover, hass, domain, async_setup_from_discovery
             ),
         )
     )
@@ -361,29 +357,74 @@ async def async_setup_entity_entry_helper(
 ) -> None:
     """Set up entity creation dynamically through MQTT discovery."""
     mqtt_data = get_mqtt_data(hass)
+    # Discovered items are queued and set up together on the next iteration
+    # of the event loop, this way the retained discovery messages replayed by
+    # the broker are added with one call to async_add_entities per batch.
+    pending_discovery_payloads: list[MQTTDiscoveryPayload] = []
 
     @callback
-    def async_setup_from_discovery(
-        discovery_payload: MQTTDiscoveryPayload,
-    ) -> None:
-        """Set up an MQTT entity from discovery."""
+    def async_setup_from_discovery() -> None:
+        """Set up the MQTT entities discovered since the last call."""
         nonlocal entity_class
-        config: DiscoveryInfoType = discovery_schema(discovery_payload)
-        if schema_class_mapping is not None:
-            entity_class = schema_class_mapping[config[CONF_SCHEMA]]
-        if TYPE_CHECKING:
-            assert entity_class is not None
-        async_add_entities(
-            [entity_class(hass, config, entry, discovery_payload.discovery_data)]
-        )
+        if not pending_discovery_payloads:
+            return
+        discovery_payloads = pending_discovery_payloads.copy()
+        pending_discovery_payloads.clear()
+        if not mqtt_config_entry_enabled(hass):
+            for discovery_payload in discovery_payloads:
+                _LOGGER.warning(
+                    (
+                        "MQTT integration is disabled, skipping setup of discovered"
+                        " item MQTT %s, payload %s"
+                    ),
+                    domain,
+                    discovery_payload,
+                )
+            return
+        entities: list[Entity] = []
+        for discovery_payload in discovery_payloads:
+            discovery_data = discovery_payload.discovery_data
+            try:
+                config: DiscoveryInfoType = discovery_schema(discovery_payload)
+                if schema_class_mapping is not None:
+                    entity_class = schema_class_mapping[config[CONF_SCHEMA]]
+                if TYPE_CHECKING:
+                    assert entity_class is not None
+                entities.append(entity_class(hass, config, entry, discovery_data))
+            except vol.Invalid as err:
+                discovery_hash = discovery_data[ATTR_DISCOVERY_HASH]
+                clear_discovery_hash(hass, discovery_hash)
+                async_dispatcher_send(
+                    hass, MQTT_DISCOVERY_DONE.format(discovery_hash), None
+                )
+                async_handle_schema_error(discovery_payload, err)
+            except Exception:  # pylint: disable=broad-except
+                discovery_hash = discovery_data[ATTR_DISCOVERY_HASH]
+                clear_discovery_hash(hass, discovery_hash)
+                async_dispatcher_send(
+                    hass, MQTT_DISCOVERY_DONE.format(discovery_hash), None
+                )
+                _LOGGER.exception(
+                    "Error setting up discovered item MQTT %s, payload %s",
+                    domain,
+                    discovery_payload,
+                )
+        async_add_entities(entities)
 
-    mqtt_data.reload_dispatchers.append(
-        async_dispatcher_connect(
-            hass,
-            MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
-            functools.partial(
-                _async_discover, hass, domain, async_setup_from_discovery, None
+    @callback
+    def async_queue_discovery(discovery_payload: MQTTDiscoveryPayload) -> None:
+        """Queue a discovered MQTT entity to be set up."""
+        if not pending_discovery_payloads:
+            hass.loop.call_soon(async_setup_from_discovery)
+        pending_discovery_payloads.append(discovery_payload)
+
+    mqtt_data.reload_dispatchers.extend(
+        (
+            async_dispatcher_connect(
+                hass, MQTT_DISCOVERY_NEW.format(domain, "mqtt"), async_queue_discovery
             ),
+            # Drop the queued items when the entry is unloaded
+            pending_discovery_payloads.clear,
         )
     )
 
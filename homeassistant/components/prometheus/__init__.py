@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import suppress
+import gzip
 import logging
 import string
+import threading
 from typing import Any, TypeVar, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
 from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.openmetrics import exposition as openmetrics_exposition
+from prometheus_client.registry import Collector
+from prometheus_client.samples import Sample
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -26,7 +31,7 @@ from homeassistant.components.cover import (
     ATTR_CURRENT_POSITION,
     ATTR_CURRENT_TILT_POSITION,
 )
-from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.humidifier import ATTR_AVAILABLE_MODES, ATTR_HUMIDITY
 from homeassistant.components.light import ATTR_BRIGHTNESS
 from homeassistant.components.sensor import SensorDeviceClass
@@ -82,6 +87,8 @@ COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
 
 DEFAULT_NAMESPACE = "homeassistant"
 
+OPENMETRICS_EOF = b"# EOF\n"
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -109,8 +116,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -131,6 +136,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         override_metric,
         default_metric,
     )
+    hass.http.register_view(PrometheusView(metrics, conf[CONF_REQUIRES_AUTH]))
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
     hass.bus.listen(
@@ -145,6 +151,129 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+class _Collectors(Collector):
+    """Expose a fixed set of collectors like a registry for rendering."""
+
+    def __init__(self, collectors: Iterable[Collector]) -> None:
+        """Initialize the collectors."""
+        self._collectors = collectors
+
+    def collect(self) -> Iterator[prometheus_client.Metric]:
+        """Collect the metrics of all collectors."""
+        for collector in self._collectors:
+            yield from collector.collect()
+
+
+class _Samples(Collector):
+    """Collect a metric family with only some of its samples."""
+
+    def __init__(self, family: prometheus_client.Metric, samples: list[Sample]) -> None:
+        """Initialize the samples."""
+        self._family = family
+        self._samples = samples
+
+    def collect(self) -> Iterator[prometheus_client.Metric]:
+        """Collect the metric family with the samples."""
+        family = self._family
+        metric = prometheus_client.Metric(
+            family.name, family.documentation, family.type, family.unit
+        )
+        metric.samples = self._samples
+        yield metric
+
+
+def _split_sections(rendered: bytes) -> dict[bytes, bytes]:
+    """Split a rendered metric family into its sample lines by section header.
+
+    The text format renders the created timestamps of counters in a section
+    of their own after the other samples.
+    """
+    sections: dict[bytes, bytes] = {}
+    header: list[bytes] = []
+    lines: list[bytes] = []
+    for line in rendered.split(b"\n")[:-1]:
+        if line.startswith(b"#"):
+            if lines:
+                sections[b"".join(header)] = b"".join(lines)
+                header, lines = [], []
+            header.append(line + b"\n")
+        else:
+            lines.append(line + b"\n")
+    sections[b"".join(header)] = b"".join(lines)
+    return sections
+
+
+class _ExpositionCache:
+    """Rendered metric families in one exposition format.
+
+    The samples of each entity are rendered on their own. Only the entities
+    changed since the last render are rendered again, the others are served
+    from the bytes rendered before.
+    """
+
+    def __init__(self, openmetrics: bool) -> None:
+        """Initialize the cache."""
+        self.openmetrics = openmetrics
+        self.families: dict[str, bytes] = {}
+        # Sections of the rendered samples of each entity per family
+        self.entities: dict[str, dict[str, dict[bytes, bytes]]] = {}
+        # Entities changed since the last render per family, None if the
+        # whole family changed
+        self.changed: dict[str, set[str] | None] = {}
+        # Held for a whole scrape so overlapping scrapes do not store
+        # families out of order or assemble a partially rendered cache
+        self.render_lock = threading.Lock()
+
+    def mark_changed(self, name: str, entity_id: str | None) -> None:
+        """Mark the samples of an entity in a family as changed."""
+        if entity_id is None:
+            self.changed[name] = None
+        elif (entity_ids := self.changed.setdefault(name, set())) is not None:
+            entity_ids.add(entity_id)
+
+    def render(self, collectors: Iterable[Collector]) -> bytes:
+        """Render collectors without the trailing EOF of OpenMetrics."""
+        if not self.openmetrics:
+            return prometheus_client.generate_latest(_Collectors(collectors))
+        body = openmetrics_exposition.generate_latest(_Collectors(collectors))
+        return body.removesuffix(OPENMETRICS_EOF)
+
+    def render_family(
+        self, name: str, metric: MetricWrapperBase, entity_ids: set[str] | None
+    ) -> None:
+        """Render the samples of the changed entities of a family again."""
+        family = cast(list[prometheus_client.Metric], metric.collect())[0]
+        samples: dict[str, list[Sample]] = {}
+        for sample in family.samples:
+            entity_id = sample.labels["entity"]
+            if entity_ids is None or entity_id in entity_ids:
+                samples.setdefault(entity_id, []).append(sample)
+
+        if entity_ids is None:
+            entities = self.entities[name] = {}
+        else:
+            entities = self.entities.setdefault(name, {})
+        for entity_id in samples if entity_ids is None else entity_ids:
+            if entity_id in samples:
+                entities[entity_id] = _split_sections(
+                    self.render((_Samples(family, samples[entity_id]),))
+                )
+            else:
+                entities.pop(entity_id, None)
+
+        # The header of the family is rendered even if it has no samples
+        empty = self.render((_Samples(family, []),))
+        sections: dict[bytes, list[bytes]] = {
+            header: [] for header in _split_sections(empty)
+        }
+        for entity_sections in entities.values():
+            for header, lines in entity_sections.items():
+                sections.setdefault(header, []).append(lines)
+        self.families[name] = b"".join(
+            header + b"".join(lines) for header, lines in sections.items()
+        )
+
+
 class PrometheusMetrics:
     """Model all of the metrics which should be exposed to Prometheus."""
 
@@ -179,6 +308,15 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics: dict[str, MetricWrapperBase] = {}
         self._climate_units = climate_units
+        # State changes are handled in the executor, the lock makes sure
+        # a family is only marked as changed once its update is complete
+        self._lock = threading.Lock()
+        # The entity whose state is being handled, the metrics updated for
+        # it are marked as changed for this entity only
+        self._entity_id: str | None = None
+        self._exposition_caches = {
+            openmetrics: _ExpositionCache(openmetrics) for openmetrics in (False, True)
+        }
 
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
         """Handle new messages from the bus."""
@@ -197,6 +335,15 @@ class PrometheusMetrics:
         self.handle_state(state)
 
     def handle_state(self, state: State) -> None:
+        """Add/update a state in Prometheus."""
+        with self._lock:
+            self._entity_id = state.entity_id
+            try:
+                self._handle_state(state)
+            finally:
+                self._entity_id = None
+
+    def _handle_state(self, state: State) -> None:
         """Add/update a state in Prometheus."""
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
@@ -258,7 +405,14 @@ class PrometheusMetrics:
         self, entity_id: str, friendly_name: str | None = None
     ) -> None:
         """Remove labelsets matching the given entity id from all metrics."""
-        for metric in self._metrics.values():
+        with self._lock:
+            self._remove_labelsets_locked(entity_id, friendly_name)
+
+    def _remove_labelsets_locked(
+        self, entity_id: str, friendly_name: str | None
+    ) -> None:
+        """Remove labelsets matching the given entity id from all metrics."""
+        for name, metric in self._metrics.items():
             for sample in cast(list[prometheus_client.Metric], metric.collect())[
                 0
             ].samples:
@@ -272,6 +426,7 @@ class PrometheusMetrics:
                     )
                     with suppress(KeyError):
                         metric.remove(*sample.labels.values())
+                    self._mark_changed(name, entity_id)
 
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
@@ -298,20 +453,62 @@ class PrometheusMetrics:
         if extra_labels is not None:
             labels.extend(extra_labels)
 
+        # Every update goes through here before it changes the metric
+        self._mark_changed(metric, self._entity_id)
         try:
             return cast(_MetricBaseT, self._metrics[metric])
         except KeyError:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
+            # The metrics are rendered from the exposition caches instead
+            # of the registry so they are not registered
             self._metrics[metric] = factory(
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
+                registry=None,
             )
             return cast(_MetricBaseT, self._metrics[metric])
 
+    def _mark_changed(self, metric: str, entity_id: str | None) -> None:
+        """Mark the samples of an entity to be rendered again on the next scrape.
+
+        The whole metric family is rendered again if entity_id is None.
+        """
+        for cache in self._exposition_caches.values():
+            cache.mark_changed(metric, entity_id)
+
+    def render(self, openmetrics: bool) -> bytes:
+        """Render the exposition of all metrics.
+
+        This method is called from the executor.
+        """
+        cache = self._exposition_caches[openmetrics]
+        with cache.render_lock:
+            with self._lock:
+                changed, cache.changed = cache.changed, {}
+                metrics = {name: self._metrics[name] for name in changed}
+            try:
+                for name, metric in metrics.items():
+                    cache.render_family(name, metric, changed[name])
+                    del changed[name]
+            finally:
+                if changed:
+                    # Render the entities that failed on the next scrape
+                    with self._lock:
+                        for name, entity_ids in changed.items():
+                            for entity_id in entity_ids or (None,):
+                                cache.mark_changed(name, entity_id)
+
+            # Collectors registered by others, like the process and platform
+            # collectors, are cheap and rendered on every scrape
+            parts = [cache.render((prometheus_client.REGISTRY,))]
+            parts.extend(cache.families.values())
+        if openmetrics:
+            parts.append(OPENMETRICS_EOF)
+        return b"".join(parts)
+
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
         return "".join(
@@ -717,21 +914,61 @@ class PrometheusMetrics:
         metric.labels(**self._labels(state)).set(value)
 
 
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Return if gzip is an acceptable content coding.
+
+    A coding with a quality value of 0 is not acceptable.
+    """
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() != "gzip":
+            continue
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
 class PrometheusView(HomeAssistantView):
     """Handle Prometheus requests."""
 
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, metrics: PrometheusMetrics, requires_auth: bool) -> None:
         """Initialize Prometheus view."""
+        self.metrics = metrics
         self.requires_auth = requires_auth
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
+        hass = request.app[KEY_HASS]
+        openmetrics = "application/openmetrics-text" in request.headers.get(
+            hdrs.ACCEPT, ""
+        )
+        compress = _accepts_gzip(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+        body = await hass.async_add_executor_job(self._render, openmetrics, compress)
+
+        headers: dict[str, str] = {}
+        if compress:
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
+        if openmetrics:
+            headers[hdrs.CONTENT_TYPE] = openmetrics_exposition.CONTENT_TYPE_LATEST
+            return web.Response(body=body, headers=headers)
         return web.Response(
-            body=prometheus_client.generate_latest(prometheus_client.REGISTRY),
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
+            body=body, content_type=CONTENT_TYPE_TEXT_PLAIN, headers=headers
         )
+
+    def _render(self, openmetrics: bool, compress: bool) -> bytes:
+        """Render the metrics, compressing them if requested."""
+        body = self.metrics.render(openmetrics)
+        if compress:
+            return gzip.compress(body, compresslevel=1)
+        return body
@@ -53,6 +53,8 @@ DEFAULT_COMMIT_INTERVAL = 5
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
+CONF_INCREMENTAL_PURGE = "incremental_purge"
+CONF_PURGE_BY_TIME_WINDOW = "purge_by_time_window"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
@@ -95,6 +97,8 @@ CONFIG_SCHEMA = vol.Schema(
                 {
                     vol.Optional(CONF_AUTO_PURGE, default=True): cv.boolean,
                     vol.Optional(CONF_AUTO_REPACK, default=True): cv.boolean,
+                    vol.Optional(CONF_INCREMENTAL_PURGE, default=False): cv.boolean,
+                    vol.Optional(CONF_PURGE_BY_TIME_WINDOW, default=False): cv.boolean,
                     vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
@@ -138,6 +142,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     entity_filter = convert_include_exclude_filter(conf).get_filter()
     auto_purge = conf[CONF_AUTO_PURGE]
     auto_repack = conf[CONF_AUTO_REPACK]
+    incremental_purge = conf[CONF_INCREMENTAL_PURGE]
+    purge_by_time_window = conf[CONF_PURGE_BY_TIME_WINDOW]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
@@ -154,6 +160,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass=hass,
         auto_purge=auto_purge,
         auto_repack=auto_repack,
+        incremental_purge=incremental_purge,
+        purge_by_time_window=purge_by_time_window,
         keep_days=keep_days,
         commit_interval=commit_interval,
         uri=db_url,
@@ -162,6 +170,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
     )
+    if incremental_purge:
+        await instance.async_load_purge_cursor()
     instance.async_initialize()
     instance.async_register()
     instance.start()
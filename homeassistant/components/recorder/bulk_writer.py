@@ -0,0 +1,198 @@
+"""Bulk writer for rows generated from state_changed events."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Final, cast
+
+from sqlalchemy import Insert, Table, insert
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm.session import Session
+
+from .db_schema import StateAttributes, States, StatesMeta
+
+# The columns written for each new row in the states table of the
+# current schema. The unused legacy columns are left out as they
+# default to NULL.
+STATES_INSERT_COLUMNS: Final = (
+    "state",
+    "last_changed_ts",
+    "last_reported_ts",
+    "last_updated_ts",
+    "old_state_id",
+    "attributes_id",
+    "origin_idx",
+    "context_id_bin",
+    "context_user_id_bin",
+    "context_parent_id_bin",
+    "metadata_id",
+    "entity_id",
+)
+
+
+@lru_cache
+def _insert_returning_primary_key(table: Table) -> Insert:
+    """Return an insert statement that returns the primary key in parameter order."""
+    return insert(table).returning(
+        *table.primary_key.columns, sort_by_parameter_order=True
+    )
+
+
+def dialect_supports_bulk_writes(dialect: Dialect) -> bool:
+    """Return if the dialect can return ids in order from an executemany insert.
+
+    This is the case for SQLite 3.35+, PostgreSQL and MariaDB 10.5+.
+    """
+    return bool(dialect.insert_executemany_returning_sort_by_parameter_order)
+
+
+class StatesBulkWriter:
+    """Collect the rows for state_changed events and write them in bulk.
+
+    The ORM flushes States one at a time because the old_state
+    relationship points back at the states table. Instead, the rows
+    for a commit interval are collected here and written with one
+    executemany insert per table. The primary keys are returned in
+    parameter order and assigned back to the pending objects so the
+    table managers can pick them up in post_commit_pending.
+
+    States that link to an old state pending in the same commit
+    interval are written in generations so the old_state_id is
+    always known at insert time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk writer."""
+        self.enabled = False
+        self._states_meta: list[StatesMeta] = []
+        self._state_attributes: list[StateAttributes] = []
+        self._states: list[States] = []
+        self._assigned: list[tuple[StatesMeta | StateAttributes | States, str]] = []
+
+    def add_states_meta(self, states_meta: StatesMeta) -> None:
+        """Add a pending StatesMeta row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._states_meta.append(states_meta)
+
+    def add_state_attributes(self, state_attributes: StateAttributes) -> None:
+        """Add a pending StateAttributes row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._state_attributes.append(state_attributes)
+
+    def add_state(self, state: States) -> None:
+        """Add a pending States row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._states.append(state)
+
+    def write(self, session: Session) -> None:
+        """Write all pending rows in the current transaction.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._states_meta and not self._state_attributes and not self._states:
+            return
+        with session.no_autoflush:
+            if states_meta := self._states_meta:
+                self._write_states_meta(session, states_meta)
+            if state_attributes := self._state_attributes:
+                self._write_state_attributes(session, state_attributes)
+            if states := self._states:
+                self._write_states(session, states)
+
+    def _write_states_meta(self, session: Session, rows: list[StatesMeta]) -> None:
+        """Write the pending StatesMeta rows."""
+        result = session.execute(
+            _insert_returning_primary_key(cast(Table, rows[0].__table__)),
+            [{"entity_id": row.entity_id} for row in rows],
+        )
+        for row, metadata_id in zip(rows, result.scalars(), strict=True):
+            row.metadata_id = metadata_id
+            self._assigned.append((row, "metadata_id"))
+
+    def _write_state_attributes(
+        self, session: Session, rows: list[StateAttributes]
+    ) -> None:
+        """Write the pending StateAttributes rows."""
+        result = session.execute(
+            _insert_returning_primary_key(cast(Table, rows[0].__table__)),
+            [{"hash": row.hash, "shared_attrs": row.shared_attrs} for row in rows],
+        )
+        for row, attributes_id in zip(rows, result.scalars(), strict=True):
+            row.attributes_id = attributes_id
+            self._assigned.append((row, "attributes_id"))
+
+    def _write_states(self, session: Session, rows: list[States]) -> None:
+        """Write the pending States rows one generation at a time."""
+        stmt = _insert_returning_primary_key(cast(Table, rows[0].__table__))
+        for generation in _states_generations(rows):
+            params: list[dict[str, Any]] = []
+            for row in generation:
+                if (old_state := row.old_state) is not None:
+                    row.old_state_id = old_state.state_id
+                if (state_attributes := row.state_attributes) is not None:
+                    row.attributes_id = state_attributes.attributes_id
+                if (states_meta := row.states_meta_rel) is not None:
+                    row.metadata_id = states_meta.metadata_id
+                params.append(
+                    {column: getattr(row, column) for column in STATES_INSERT_COLUMNS}
+                )
+            result = session.execute(stmt, params)
+            for row, state_id in zip(generation, result.scalars(), strict=True):
+                row.state_id = state_id
+                self._assigned.append((row, "state_id"))
+
+    def rollback(self) -> None:
+        """Forget the ids assigned by a write that was not committed.
+
+        The pending rows are kept so the write can be retried.
+        """
+        for row, primary_key in self._assigned:
+            setattr(row, primary_key, None)
+        self._assigned.clear()
+
+    def clear(self) -> None:
+        """Clear all pending rows after a commit or reset.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._states_meta.clear()
+        self._state_attributes.clear()
+        self._states.clear()
+        self._assigned.clear()
+
+
+def _states_generations(rows: list[States]) -> list[list[States]]:
+    """Split pending states into generations by their old_state chains.
+
+    The first generation links to no pending state, the second links
+    to a state in the first generation, and so on. An old state that
+    was never added on its own is still written, the same as the
+    save-update cascade of the old_state relationship would.
+    """
+    generations: list[list[States]] = []
+    depths: dict[int, int] = {}
+    for row in rows:
+        chain: list[States] = []
+        node: States | None = row
+        while node is not None and id(node) not in depths and node.state_id is None:
+            chain.append(node)
+            node = node.old_state
+        depth = depths[id(node)] + 1 if node is not None and id(node) in depths else 0
+        for link in reversed(chain):
+            depths[id(link)] = depth
+            if depth == len(generations):
+                generations.append([])
+            generations[depth].append(link)
+            depth += 1
+    return generations
@@ -39,6 +39,21 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 
 DEFAULT_MAX_BIND_VARS = 4000
 
+# The incremental purge deletes at most this many states and events
+# per slice and skips slices while the recorder backlog is at or
+# above INCREMENTAL_PURGE_MAX_BACKLOG so it never competes with
+# recording events.
+INCREMENTAL_PURGE_MAX_ROWS = 500
+INCREMENTAL_PURGE_MAX_BACKLOG = 100
+# Slices are run every commit interval, or with this interval
+# when the commit interval is 0.
+INCREMENTAL_PURGE_INTERVAL = 5
+# The cursor of the oldest surviving row is persisted so a restart
+# does not have to query for it again.
+PURGE_CURSOR_STORAGE_KEY = "recorder.purge_cursor"
+PURGE_CURSOR_STORAGE_VERSION = 1
+PURGE_CURSOR_SAVE_DELAY = 60
+
 DB_WORKER_PREFIX = "DbWorker"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
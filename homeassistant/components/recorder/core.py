@@ -37,15 +37,20 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
 )
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
-from . import migration, statistics
+from . import migration, purge, statistics
+from .bulk_writer import StatesBulkWriter, dialect_supports_bulk_writes
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
     ESTIMATED_QUEUE_ITEM_SIZE,
+    INCREMENTAL_PURGE_INTERVAL,
+    INCREMENTAL_PURGE_MAX_BACKLOG,
+    INCREMENTAL_PURGE_MAX_ROWS,
     KEEPALIVE_TIME,
     LAST_REPORTED_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
@@ -54,6 +59,9 @@ from .const import (
     MAX_QUEUE_BACKLOG_MIN_VALUE,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    PURGE_CURSOR_SAVE_DELAY,
+    PURGE_CURSOR_STORAGE_KEY,
+    PURGE_CURSOR_STORAGE_VERSION,
     QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
@@ -103,6 +111,7 @@ from .tasks import (
     EntityIDPostMigrationTask,
     EventIdMigrationTask,
     ImportStatisticsTask,
+    IncrementalPurgeTask,
     KeepAliveTask,
     PerodicCleanupTask,
     PurgeTask,
@@ -167,6 +176,8 @@ class Recorder(threading.Thread):
         hass: HomeAssistant,
         auto_purge: bool,
         auto_repack: bool,
+        incremental_purge: bool,
+        purge_by_time_window: bool,
         keep_days: int,
         commit_interval: int,
         uri: str,
@@ -182,6 +193,8 @@ class Recorder(threading.Thread):
         self.thread_id: int | None = None
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
+        self.incremental_purge = incremental_purge
+        self.purge_by_time_window = purge_by_time_window
         self.keep_days = keep_days
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
@@ -220,6 +233,7 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.states_bulk_writer = StatesBulkWriter()
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -231,10 +245,19 @@ class Recorder(threading.Thread):
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
+        # The timestamp of the oldest surviving state or event as far
+        # as the incremental purge knows, persisted between restarts
+        self.purge_cursor: float | None = None
+        self._purge_cursor_store: Store[dict[str, float]] = Store(
+            hass, PURGE_CURSOR_STORAGE_VERSION, PURGE_CURSOR_STORAGE_KEY
+        )
+        self._incremental_purge_queued = False
+
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
         self._keep_alive_listener: CALLBACK_TYPE | None = None
         self._commit_listener: CALLBACK_TYPE | None = None
+        self._incremental_purge_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
@@ -357,6 +380,38 @@ class Recorder(threading.Thread):
         ):
             self.queue_task(COMMIT_TASK)
 
+    @callback
+    def _async_incremental_purge(self, now: datetime) -> None:
+        """Queue a slice of the incremental purge."""
+        if (
+            self._event_listener
+            and not self._database_lock_task
+            and not self._incremental_purge_queued
+            and self.backlog < INCREMENTAL_PURGE_MAX_BACKLOG
+        ):
+            self._incremental_purge_queued = True
+            purge_before = now - timedelta(days=self.keep_days)
+            self.queue_task(IncrementalPurgeTask(purge_before))
+
+    async def async_load_purge_cursor(self) -> None:
+        """Load the persisted cursor of the incremental purge."""
+        if data := await self._purge_cursor_store.async_load():
+            self.purge_cursor = data.get("cursor")
+
+    @callback
+    def _async_save_purge_cursor(self) -> None:
+        """Save the cursor of the incremental purge."""
+        self._purge_cursor_store.async_delay_save(
+            self._purge_cursor_data, PURGE_CURSOR_SAVE_DELAY
+        )
+
+    @callback
+    def _purge_cursor_data(self) -> dict[str, float]:
+        """Return the data of the incremental purge cursor to store."""
+        if self.purge_cursor is None:
+            return {}
+        return {"cursor": self.purge_cursor}
+
     @callback
     def async_add_executor_job(
         self, target: Callable[..., T], *args: Any
@@ -435,6 +490,9 @@ class Recorder(threading.Thread):
         if self._commit_listener:
             self._commit_listener()
             self._commit_listener = None
+        if self._incremental_purge_listener:
+            self._incremental_purge_listener()
+            self._incremental_purge_listener = None
         if self._nightly_listener:
             self._nightly_listener()
             self._nightly_listener = None
@@ -551,6 +609,20 @@ class Recorder(threading.Thread):
         self.queue_task(ADJUST_LRU_SIZE_TASK)
         self.async_periodic_statistics()
 
+    def _incremental_purge(self, purge_before: datetime) -> None:
+        """Purge a slice of the database unless the recorder is falling behind."""
+        self._incremental_purge_queued = False
+        if self.backlog >= INCREMENTAL_PURGE_MAX_BACKLOG:
+            return
+        cursor = self.purge_cursor
+        purge.purge_old_data_slice(
+            self,
+            purge_before,
+            min(INCREMENTAL_PURGE_MAX_ROWS, self.max_bind_vars),
+        )
+        if self.purge_cursor != cursor:
+            self.hass.add_job(self._async_save_purge_cursor)
+
     def _adjust_lru_size(self) -> None:
         """Trigger the LRU adjustment.
 
@@ -666,6 +738,16 @@ class Recorder(threading.Thread):
                 name="Recorder commit",
             )
 
+        # Purge in small slices all day long, the nightly purge
+        # still runs to clean up everything the slices leave behind
+        if self.auto_purge and self.incremental_purge:
+            self._incremental_purge_listener = async_track_time_interval(
+                self.hass,
+                self._async_incremental_purge,
+                timedelta(seconds=self.commit_interval or INCREMENTAL_PURGE_INTERVAL),
+                name="Recorder incremental purge",
+            )
+
         # Run nightly tasks at 4:12am
         self._nightly_listener = async_track_time_change(
             self.hass, self.async_nightly_tasks, hour=4, minute=12, second=0
@@ -713,6 +795,32 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_states_meta(self, session: Session, states_meta: StatesMeta) -> None:
+        """Add a StatesMeta to the bulk writer or the session."""
+        if self.states_bulk_writer.enabled:
+            self._event_session_has_pending_writes = True
+            self.states_bulk_writer.add_states_meta(states_meta)
+        else:
+            self._add_to_session(session, states_meta)
+
+    def _add_state_attributes(
+        self, session: Session, state_attributes: StateAttributes
+    ) -> None:
+        """Add a StateAttributes to the bulk writer or the session."""
+        if self.states_bulk_writer.enabled:
+            self._event_session_has_pending_writes = True
+            self.states_bulk_writer.add_state_attributes(state_attributes)
+        else:
+            self._add_to_session(session, state_attributes)
+
+    def _add_state(self, session: Session, dbstate: States) -> None:
+        """Add a States to the bulk writer or the session."""
+        if self.states_bulk_writer.enabled:
+            self._event_session_has_pending_writes = True
+            self.states_bulk_writer.add_state(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
+
     def _run(self) -> None:
         """Start processing events to save."""
         self.thread_id = threading.get_ident()
@@ -777,6 +885,7 @@ class Recorder(threading.Thread):
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
         self._adjust_lru_size()
+        self._setup_states_bulk_writer()
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
         self._run_event_loop()
 
@@ -844,6 +953,17 @@ class Recorder(threading.Thread):
         # and not the old ones as soon as the API is available.
         self.hass.add_job(self.async_set_db_ready)
 
+    def _setup_states_bulk_writer(self) -> None:
+        """Enable the bulk writer if the database can return ids in order.
+
+        The bulk writer only knows the columns of the current schema.
+        """
+        assert self.engine is not None
+        self.states_bulk_writer.enabled = (
+            self.schema_version == SCHEMA_VERSION
+            and dialect_supports_bulk_writes(self.engine.dialect)
+        )
+
     def _run_event_loop(self) -> None:
         """Run the event loop for the recorder."""
         # Use a session for the event read loop
@@ -1131,7 +1251,7 @@ class Recorder(threading.Thread):
         else:
             states_meta = StatesMeta(entity_id=entity_id)
             states_meta_manager.add_pending(states_meta)
-            self._add_to_session(session, states_meta)
+            self._add_states_meta(session, states_meta)
             dbstate.states_meta_rel = states_meta
 
         # Map the event data to the StateAttributes table
@@ -1156,10 +1276,10 @@ class Recorder(threading.Thread):
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
             state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
+            self._add_state_attributes(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_state(session, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1197,26 +1317,35 @@ class Recorder(threading.Thread):
     def _commit_event_session(self) -> None:
         assert self.event_session is not None
         session = self.event_session
+        states_bulk_writer = self.states_bulk_writer
         self._commits_without_expire += 1
 
-        if (
-            pending_last_reported
-            := self.states_manager.get_pending_last_reported_timestamp()
-        ) and self.schema_version >= LAST_REPORTED_SCHEMA_VERSION:
-            with session.no_autoflush:
-                session.execute(
-                    update(States),
-                    [
-                        {
-                            "state_id": state_id,
-                            "last_reported_ts": last_reported_timestamp,
-                        }
-                        for state_id, last_reported_timestamp in pending_last_reported.items()
-                    ],
-                )
-        session.commit()
+        try:
+            states_bulk_writer.write(session)
+            if (
+                pending_last_reported
+                := self.states_manager.get_pending_last_reported_timestamp()
+            ) and self.schema_version >= LAST_REPORTED_SCHEMA_VERSION:
+                with session.no_autoflush:
+                    session.execute(
+                        update(States),
+                        [
+                            {
+                                "state_id": state_id,
+                                "last_reported_ts": last_reported_timestamp,
+                            }
+                            for state_id, last_reported_timestamp in pending_last_reported.items()
+                        ],
+                    )
+            session.commit()
+        except Exception:
+            # The ids assigned by the bulk writer are only valid
+            # once the transaction has been committed
+            states_bulk_writer.rollback()
+            raise
 
         self._event_session_has_pending_writes = False
+        states_bulk_writer.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1253,6 +1382,7 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self.states_bulk_writer.clear()
 
         if not self.event_session:
             return
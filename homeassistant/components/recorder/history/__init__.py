@@ -2,34 +2,39 @@
 
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import Generator, MutableMapping
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import HomeAssistant, State
+import homeassistant.util.dt as dt_util
 
 from ... import recorder
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
+    downsample_compressed_states,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    stream_significant_states as _modern_stream_significant_states,
 )
 
 # These are the APIs of this package
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "downsample_compressed_states",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
+    "stream_significant_states",
 ]
 
 
@@ -182,3 +187,61 @@ def state_changes_during_period(
         limit,
         include_start_time_state,
     )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+    buckets: int | None = None,
+) -> Generator[dict[str, list[dict[str, Any]]], None, None]:
+    """Stream significant states during a time period in chunks."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        # The legacy schema is only used until the migration
+        # finishes so the results are not streamed
+        if states := get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ):
+            if buckets:
+                start_time_ts = start_time.timestamp()
+                end_time_ts = (end_time or dt_util.utcnow()).timestamp()
+                states = {
+                    entity_id: list(
+                        downsample_compressed_states(
+                            cast(list[dict[str, Any]], entity_states),
+                            start_time_ts,
+                            end_time_ts,
+                            buckets,
+                        )
+                    )
+                    for entity_id, entity_states in states.items()
+                }
+            yield cast(dict[str, list[dict[str, Any]]], states)
+        return
+    yield from _modern_stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        chunk_size,
+        buckets,
+    )
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from collections.abc import Callable, Generator, Iterable, Iterator, MutableMapping
 from datetime import datetime
-from itertools import groupby
+from itertools import chain, groupby, islice
+import math
 from operator import itemgetter
 from typing import Any, cast
 
@@ -21,6 +22,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -228,6 +230,195 @@ def get_significant_states_with_session(
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = query
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        cast(list[str], entity_ids),
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+    buckets: int | None = None,
+) -> Generator[dict[str, list[dict[str, Any]]], None, None]:
+    """Stream significant states in the compressed state format in chunks.
+
+    Each chunk holds at most chunk_size states. Long time windows are
+    read from the database with yield_per so only the rows for the
+    chunks being built are held in memory at any time. The states of
+    an entity can be split over consecutive chunks.
+
+    If buckets is passed the states of each entity are downsampled
+    with downsample_compressed_states before they are chunked.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return
+        stmt, entity_id_to_metadata_id, start_time_ts = query
+        chunk: dict[str, list[dict[str, Any]]] = {}
+        chunk_states = 0
+        for entity_id, entity_states in _sorted_states_to_entity_states(
+            execute_stmt_lambda_element(
+                session, stmt, start_time, end_time, orm_rows=False
+            ),
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            True,
+            no_attributes,
+        ):
+            entity_states_iter = iter(entity_states)
+            if buckets:
+                entity_states_iter = downsample_compressed_states(
+                    cast(Iterable[dict[str, Any]], entity_states_iter),
+                    start_time.timestamp(),
+                    (end_time or dt_util.utcnow()).timestamp(),
+                    buckets,
+                )
+            while batch := list(islice(entity_states_iter, chunk_size - chunk_states)):
+                chunk.setdefault(entity_id, []).extend(
+                    cast(list[dict[str, Any]], batch)
+                )
+                chunk_states += len(batch)
+                if chunk_states == chunk_size:
+                    yield chunk
+                    chunk = {}
+                    chunk_states = 0
+        if chunk:
+            yield chunk
+
+
+def downsample_compressed_states(
+    states: Iterable[dict[str, Any]],
+    start_time_ts: float,
+    end_time_ts: float,
+    buckets: int,
+) -> Generator[dict[str, Any], None, None]:
+    """Downsample the compressed states of an entity to time buckets.
+
+    The time window is split into the given number of buckets and
+    only the states with the minimum and the maximum numeric value
+    of each bucket are kept, in the order they happened. The first
+    state, which carries the attributes, the last state and all
+    non-numeric states such as unavailable are always kept so gaps
+    and the current value are preserved.
+
+    States must be sorted by last_updated.
+    """
+    states_iter = iter(states)
+    if (first_state := next(states_iter, None)) is None:
+        return
+    yield first_state
+    if (bucket_width := (end_time_ts - start_time_ts) / buckets) <= 0:
+        yield from states_iter
+        return
+
+    bucket: int | None = None
+    min_value = max_value = 0.0
+    min_state = max_state = last_state = first_state
+    for state in states_iter:
+        try:
+            value = float(state[COMPRESSED_STATE_STATE])
+        except ValueError:
+            value = math.nan
+        if not math.isfinite(value):
+            if bucket is not None:
+                yield from _bucket_states(min_state, max_state)
+                bucket = None
+            yield state
+            last_state = state
+            continue
+        state_bucket = int(
+            (state[COMPRESSED_STATE_LAST_UPDATED] - start_time_ts) // bucket_width
+        )
+        if state_bucket != bucket:
+            if bucket is not None:
+                yield from _bucket_states(min_state, max_state)
+            bucket = state_bucket
+            min_value = max_value = value
+            min_state = max_state = state
+        elif value < min_value:
+            min_value = value
+            min_state = state
+        elif value > max_value:
+            max_value = value
+            max_state = state
+        last_state = state
+
+    if bucket is not None:
+        yield from _bucket_states(min_state, max_state)
+        if last_state is not min_state and last_state is not max_state:
+            yield last_state
+
+
+def _bucket_states(
+    min_state: dict[str, Any], max_state: dict[str, Any]
+) -> tuple[dict[str, Any], ...]:
+    """Return the min and max states of a bucket in the order they happened."""
+    if min_state is max_state:
+        return (min_state,)
+    if (
+        min_state[COMPRESSED_STATE_LAST_UPDATED]
+        <= max_state[COMPRESSED_STATE_LAST_UPDATED]
+    ):
+        return (min_state, max_state)
+    return (max_state, min_state)
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], float | None] | None:
+    """Build the statement to fetch significant states.
+
+    Returns the statement, the metadata_ids of the entity_ids and
+    the start time timestamp to use for the start time states, or
+    None if none of the entity_ids have been recorded.
+    """
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
@@ -238,7 +429,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -276,14 +467,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        stmt,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
@@ -693,6 +880,45 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
+    # Set all entity IDs to empty lists in result set to maintain the order
+    result: dict[str, list[State | dict[str, Any]]] = {
+        entity_id: [] for entity_id in entity_ids
+    }
+    for entity_id, entity_states in _sorted_states_to_entity_states(
+        states,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes,
+    ):
+        result[entity_id].extend(entity_states)
+
+    if descending:
+        for ent_results in result.values():
+            ent_results.reverse()
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_entity_states(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+) -> Generator[tuple[str, Iterable[State | dict[str, Any]]], None, None]:
+    """Convert SQL results into the states of each entity.
+
+    States must be sorted by entity_id and last_updated
+
+    The states of each entity are converted lazily and must be
+    consumed before moving on to the next entity.
+    """
     field_map = _FIELD_MAP
     state_class: Callable[
         [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
@@ -707,10 +933,6 @@ def _sorted_states_to_dict(
         attr_time = LAST_CHANGED_KEY
         attr_state = STATE_KEY
 
-    # Set all entity IDs to empty lists in result set to maintain the order
-    result: dict[str, list[State | dict[str, Any]]] = {
-        entity_id: [] for entity_id in entity_ids
-    }
     metadata_id_to_entity_id: dict[int, str] = {}
     metadata_id_to_entity_id = {
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
@@ -733,45 +955,43 @@ def _sorted_states_to_dict(
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
         attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
         if (
             not minimal_response
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
         ):
-            ent_results.extend(
-                state_class(
-                    db_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    db_state[state_idx],
-                    db_state[last_updated_ts_idx],
-                    False,
-                )
-                for db_state in group
+            yield (
+                entity_id,
+                (
+                    state_class(
+                        db_state,
+                        attr_cache,
+                        start_time_ts,
+                        entity_id,
+                        db_state[state_idx],
+                        db_state[last_updated_ts_idx],
+                        False,
+                    )
+                    for db_state in group
+                ),
             )
             continue
 
-        prev_state: str | None = None
         # With minimal response we only provide a native
         # State for the first and last response. All the states
         # in-between only provide the "state" and the
         # "last_changed".
-        if not ent_results:
-            if (first_state := next(group, None)) is None:
-                continue
-            prev_state = first_state[state_idx]
-            ent_results.append(
-                state_class(
-                    first_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    prev_state,  # type: ignore[arg-type]
-                    first_state[last_updated_ts_idx],
-                    no_attributes,
-                )
-            )
+        if (first_state := next(group, None)) is None:
+            continue
+        prev_state: str = first_state[state_idx]
+        first_entity_state = state_class(
+            first_state,
+            attr_cache,
+            start_time_ts,
+            entity_id,
+            prev_state,
+            first_state[last_updated_ts_idx],
+            no_attributes,
+        )
 
         #
         # minimal_response only makes sense with last_updated == last_updated
@@ -782,30 +1002,37 @@ def _sorted_states_to_dict(
         # changes so we can filter out duplicate states
         if compressed_state_format:
             # Compressed state format uses the timestamp directly
-            ent_results.extend(
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: row[last_updated_ts_idx],
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
+            yield (
+                entity_id,
+                chain(
+                    (first_entity_state,),
+                    (
+                        {
+                            attr_state: (prev_state := state),
+                            attr_time: row[last_updated_ts_idx],
+                        }
+                        for row in group
+                        if (state := row[state_idx]) != prev_state
+                    ),
+                ),
             )
             continue
 
         # Non-compressed state format returns an ISO formatted string
         _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
-            {
-                attr_state: (prev_state := state),
-                attr_time: _utc_from_timestamp(row[last_updated_ts_idx]).isoformat(),
-            }
-            for row in group
-            if (state := row[state_idx]) != prev_state
+        yield (
+            entity_id,
+            chain(
+                (first_entity_state,),
+                (
+                    {
+                        attr_state: (prev_state := state),
+                        attr_time: _utc_from_timestamp(
+                            row[last_updated_ts_idx]
+                        ).isoformat(),
+                    }
+                    for row in group
+                    if (state := row[state_idx]) != prev_state
+                ),
+            ),
         )
-
-    if descending:
-        for ent_results in result.values():
-            ent_results.reverse()
-
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
@@ -6,11 +6,13 @@ from collections.abc import Callable
 from datetime import datetime
 from itertools import zip_longest
 import logging
+import math
 import time
 from typing import TYPE_CHECKING
 
 from sqlalchemy.orm.session import Session
 
+from .const import SupportedDialect
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
@@ -20,14 +22,20 @@ from .queries import (
     data_ids_exist_in_events_with_fast_in_distinct,
     delete_event_data_rows,
     delete_event_rows,
+    delete_event_rows_before,
     delete_event_types_rows,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
     delete_states_meta_rows,
     delete_states_rows,
+    delete_states_rows_before,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
+    delete_statistics_short_term_rows_before,
     disconnect_states_rows,
+    disconnect_states_rows_before,
+    find_attributes_ids_of_states_before,
+    find_data_ids_of_events_before,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
@@ -35,11 +43,21 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_nth_oldest_event_ts,
+    find_nth_oldest_short_term_statistics_ts,
+    find_nth_oldest_state_ts,
+    find_oldest_event_ts,
+    find_oldest_short_term_statistics_ts,
+    find_oldest_state_and_event_ts,
+    find_oldest_state_ts,
     find_short_term_statistics_to_purge,
+    find_state_ids_before,
+    find_state_ids_before_linked_to_newer_states,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
 from .repack import repack_database
+from .statistics import get_statistics_during_period_cache
 from .util import chunked_or_all, retryable_database_job, session_scope
 
 if TYPE_CHECKING:
@@ -51,6 +69,13 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# With purge_by_time_window, PostgreSQL and MySQL purge the states, events
+# and short term statistics in windows of at most an hour and at most
+# max_bind_vars rows, starting at the oldest row, with range deletes on the
+# time indices instead of selecting the ids to delete first. Each batch
+# purges one window.
+PURGE_WINDOW_SECONDS = 3600
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -69,61 +94,133 @@ def purge_old_data(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
-    with session_scope(session=instance.get_session()) as session:
-        # Purge a max of max_bind_vars, based on the oldest states or events record
-        has_more_to_purge = False
-        if instance.use_legacy_events_index and _purging_legacy_format(session):
-            _LOGGER.debug(
-                "Purge running in legacy format as there are states with event_id"
-                " remaining"
-            )
-            has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
-        else:
-            _LOGGER.debug(
-                "Purge running in new format as there are NO states with event_id"
-                " remaining"
-            )
-            # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
-            )
-            has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
-            )
-
-        statistics_runs = _select_statistics_runs_to_purge(
-            session, purge_before, instance.max_bind_vars
-        )
-        short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before, instance.max_bind_vars
-        )
-        if statistics_runs:
-            _purge_statistics_runs(session, statistics_runs)
-
-        if short_term_statistics:
-            _purge_short_term_statistics(session, short_term_statistics)
+    purged_short_term_statistics = False
+    try:
+        with session_scope(session=instance.get_session()) as session:
+            # Purge a max of max_bind_vars, based on the oldest states or events record
+            has_more_to_purge = False
+            if instance.use_legacy_events_index and _purging_legacy_format(session):
+                _LOGGER.debug(
+                    "Purge running in legacy format as there are states with event_id"
+                    " remaining"
+                )
+                has_more_to_purge |= _purge_legacy_format(
+                    instance, session, purge_before
+                )
+            else:
+                _LOGGER.debug(
+                    "Purge running in new format as there are NO states with event_id"
+                    " remaining"
+                )
+                # Once we are done purging legacy rows, we use the new method
+                if _purge_by_time_window(instance):
+                    has_more_to_purge |= _purge_states_by_time_window(
+                        instance, session, states_batch_size, purge_before
+                    )
+                    has_more_to_purge |= _purge_events_by_time_window(
+                        instance, session, events_batch_size, purge_before
+                    )
+                else:
+                    has_more_to_purge |= _purge_states_and_attributes_ids(
+                        instance, session, states_batch_size, purge_before
+                    )
+                    has_more_to_purge |= _purge_events_and_data_ids(
+                        instance, session, events_batch_size, purge_before
+                    )
 
-        if has_more_to_purge or statistics_runs or short_term_statistics:
-            # Return false, as we might not be done yet.
-            _LOGGER.debug("Purging hasn't fully completed yet")
-            return False
+            statistics_runs = _select_statistics_runs_to_purge(
+                session, purge_before, instance.max_bind_vars
+            )
+            if statistics_runs:
+                _purge_statistics_runs(session, statistics_runs)
+
+            if _purge_by_time_window(instance):
+                (
+                    has_more_short_term_statistics,
+                    purged_short_term_statistics,
+                ) = _purge_short_term_statistics_by_time_window(
+                    session, instance.max_bind_vars, purge_before
+                )
+                has_more_to_purge |= has_more_short_term_statistics
+            elif short_term_statistics := _select_short_term_statistics_to_purge(
+                session, purge_before, instance.max_bind_vars
+            ):
+                _purge_short_term_statistics(session, short_term_statistics)
+                purged_short_term_statistics = True
+                has_more_to_purge = True
+
+            if has_more_to_purge or statistics_runs:
+                # Return false, as we might not be done yet.
+                _LOGGER.debug("Purging hasn't fully completed yet")
+                return False
+
+            if apply_filter and _purge_filtered_data(instance, session) is False:
+                _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
+                return False
+
+            # This purge cycle is finished, clean up old event types and
+            # recorder runs
+            if instance.event_type_manager.active:
+                _purge_old_event_types(instance, session)
+
+            if instance.states_meta_manager.active:
+                _purge_old_entity_ids(instance, session)
+
+            _purge_old_recorder_runs(instance, session, purge_before)
+    except BaseException:
+        # The deletes were not committed, the cached results are still valid
+        purged_short_term_statistics = False
+        raise
+    finally:
+        if purged_short_term_statistics:
+            # The cached results may include the purged rows, they are
+            # invalidated once the deletes are committed
+            get_statistics_during_period_cache(instance.hass).invalidate(None, None)
+    if repack:
+        repack_database(instance)
+    return True
 
-        if apply_filter and _purge_filtered_data(instance, session) is False:
-            _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
-            return False
 
-        # This purge cycle is finished, clean up old event types and
-        # recorder runs
-        if instance.event_type_manager.active:
-            _purge_old_event_types(instance, session)
+@retryable_database_job("incremental purge")
+def purge_old_data_slice(
+    instance: Recorder, purge_before: datetime, max_rows: int
+) -> bool:
+    """Purge one slice of at most max_rows states and events older than purge_before.
 
-        if instance.states_meta_manager.active:
-            _purge_old_entity_ids(instance, session)
+    The timestamp of the oldest surviving state or event is kept in
+    instance.purge_cursor so slices are skipped without a query until
+    rows become old enough to purge. Legacy rows, statistics and the
+    cleanup of unused metadata are left to purge_old_data.
 
-        _purge_old_recorder_runs(instance, session, purge_before)
-    if repack:
-        repack_database(instance)
-    return True
+    Returns True if there is nothing left to purge before purge_before.
+    """
+    purge_before_ts = purge_before.timestamp()
+    if (cursor := instance.purge_cursor) is not None and cursor >= purge_before_ts:
+        return True
+    with session_scope(session=instance.get_session()) as session:
+        if instance.use_legacy_events_index and _purging_legacy_format(session):
+            _LOGGER.debug("Incremental purge waiting for the legacy rows to be purged")
+            return True
+        state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
+            session, purge_before, max_rows
+        )
+        _purge_state_ids(instance, session, state_ids)
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+        event_ids, data_ids = _select_event_data_ids_to_purge(
+            session, purge_before, max_rows
+        )
+        _purge_event_ids(session, event_ids)
+        _purge_unused_data_ids(instance, session, data_ids)
+        oldest_state_ts, oldest_event_ts = session.execute(
+            find_oldest_state_and_event_ts()
+        ).one()
+    # New rows are always recorded after purge_before so it is
+    # a safe lower bound once the tables are empty
+    instance.purge_cursor = min(
+        (ts for ts in (oldest_state_ts, oldest_event_ts) if ts is not None),
+        default=purge_before_ts,
+    )
+    return len(state_ids) < max_rows and len(event_ids) < max_rows
 
 
 def _purging_legacy_format(session: Session) -> bool:
@@ -243,6 +340,166 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _purge_by_time_window(instance: Recorder) -> bool:
+    """Return if the database is purged in time windows."""
+    return instance.purge_by_time_window and instance.dialect_name in (
+        SupportedDialect.MYSQL,
+        SupportedDialect.POSTGRESQL,
+    )
+
+
+def _next_window_end(
+    oldest_ts: float | None, nth_oldest_ts: float | None, purge_before: datetime
+) -> float | None:
+    """Return the end of the next time window to purge.
+
+    The window ends an hour after the oldest row, at the row after the
+    max_bind_vars oldest rows or at purge_before, whichever comes first.
+    Returns None if there is nothing older than purge_before.
+    """
+    purge_before_ts = purge_before.timestamp()
+    if oldest_ts is None or oldest_ts >= purge_before_ts:
+        return None
+    window_end = min(oldest_ts + PURGE_WINDOW_SECONDS, purge_before_ts)
+    if nth_oldest_ts is None:
+        return window_end
+    # Rows with the same timestamp as the oldest row are always purged
+    # together, otherwise the window would be empty
+    return min(window_end, max(nth_oldest_ts, math.nextafter(oldest_ts, math.inf)))
+
+
+def _purge_states_by_time_window(
+    instance: Recorder,
+    session: Session,
+    states_batch_size: int,
+    purge_before: datetime,
+) -> bool:
+    """Purge states and linked attributes ids one time window per batch.
+
+    Returns true if there are more states to purge.
+    """
+    has_remaining_states_to_purge = True
+    attributes_ids_batch: set[int] = set()
+    max_bind_vars = instance.max_bind_vars
+    for _ in range(states_batch_size):
+        window_end = _next_window_end(
+            session.execute(find_oldest_state_ts()).scalar(),
+            session.execute(find_nth_oldest_state_ts(max_bind_vars)).scalar(),
+            purge_before,
+        )
+        if window_end is None:
+            has_remaining_states_to_purge = False
+            break
+        attributes_ids_batch |= {
+            attributes_id
+            for (attributes_id,) in session.execute(
+                find_attributes_ids_of_states_before(window_end)
+            )
+            if attributes_id is not None
+        }
+        # Newer states linking to a state in the window are disconnected by
+        # id since MySQL cannot update a table with a subquery on itself,
+        # there is at most one linked state per entity. The links inside
+        # the window are removed before the delete to satisfy the foreign
+        # key checks that MySQL runs for every row.
+        linked_state_ids = {
+            state_id
+            for (state_id,) in session.execute(
+                find_state_ids_before_linked_to_newer_states(window_end)
+            )
+        }
+        for state_ids_chunk in chunked_or_all(linked_state_ids, max_bind_vars):
+            session.execute(disconnect_states_rows(state_ids_chunk))
+        session.execute(disconnect_states_rows_before(window_end))
+        # Evict the committed states in the window so the next state
+        # of the entity does not link to a purged state
+        purged_committed_state_ids: set[int] = set()
+        for state_ids_chunk in chunked_or_all(
+            instance.states_manager.committed_state_ids(), max_bind_vars
+        ):
+            purged_committed_state_ids.update(
+                state_id
+                for (state_id,) in session.execute(
+                    find_state_ids_before(state_ids_chunk, window_end)
+                )
+            )
+        deleted_rows = session.execute(delete_states_rows_before(window_end))
+        _LOGGER.debug("Deleted %s states", deleted_rows.rowcount)
+        instance.states_manager.evict_purged_state_ids(purged_committed_state_ids)
+        if window_end == purge_before.timestamp():
+            has_remaining_states_to_purge = False
+            break
+
+    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    _LOGGER.debug(
+        "After purging states and attributes_ids remaining=%s",
+        has_remaining_states_to_purge,
+    )
+    return has_remaining_states_to_purge
+
+
+def _purge_events_by_time_window(
+    instance: Recorder,
+    session: Session,
+    events_batch_size: int,
+    purge_before: datetime,
+) -> bool:
+    """Purge events and linked data ids one time window per batch.
+
+    Returns true if there are more events to purge.
+    """
+    has_remaining_events_to_purge = True
+    data_ids_batch: set[int] = set()
+    for _ in range(events_batch_size):
+        window_end = _next_window_end(
+            session.execute(find_oldest_event_ts()).scalar(),
+            session.execute(find_nth_oldest_event_ts(instance.max_bind_vars)).scalar(),
+            purge_before,
+        )
+        if window_end is None:
+            has_remaining_events_to_purge = False
+            break
+        data_ids_batch |= {
+            data_id
+            for (data_id,) in session.execute(
+                find_data_ids_of_events_before(window_end)
+            )
+            if data_id is not None
+        }
+        deleted_rows = session.execute(delete_event_rows_before(window_end))
+        _LOGGER.debug("Deleted %s events", deleted_rows.rowcount)
+        if window_end == purge_before.timestamp():
+            has_remaining_events_to_purge = False
+            break
+
+    _purge_unused_data_ids(instance, session, data_ids_batch)
+    _LOGGER.debug(
+        "After purging events and data_ids remaining=%s",
+        has_remaining_events_to_purge,
+    )
+    return has_remaining_events_to_purge
+
+
+def _purge_short_term_statistics_by_time_window(
+    session: Session, max_rows: int, purge_before: datetime
+) -> tuple[bool, bool]:
+    """Purge one time window of short term statistics.
+
+    Returns a tuple of whether there are more short term statistics to purge
+    and whether any were deleted.
+    """
+    window_end = _next_window_end(
+        session.execute(find_oldest_short_term_statistics_ts()).scalar(),
+        session.execute(find_nth_oldest_short_term_statistics_ts(max_rows)).scalar(),
+        purge_before,
+    )
+    if window_end is None:
+        return False, False
+    deleted_rows = session.execute(delete_statistics_short_term_rows_before(window_end))
+    _LOGGER.debug("Deleted %s short term statistics", deleted_rows.rowcount)
+    return window_end < purge_before.timestamp(), deleted_rows.rowcount > 0
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
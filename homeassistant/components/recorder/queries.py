@@ -10,6 +10,7 @@ from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
 from .db_schema import (
+    OLD_STATE,
     EventData,
     Events,
     EventTypes,
@@ -636,6 +637,147 @@ def find_states_to_purge(
     )
 
 
+def find_oldest_state_ts() -> StatementLambdaElement:
+    """Find the timestamp of the oldest state."""
+    return lambda_stmt(lambda: select(func.min(States.last_updated_ts)))
+
+
+def find_oldest_event_ts() -> StatementLambdaElement:
+    """Find the timestamp of the oldest event."""
+    return lambda_stmt(lambda: select(func.min(Events.time_fired_ts)))
+
+
+def find_oldest_short_term_statistics_ts() -> StatementLambdaElement:
+    """Find the start timestamp of the oldest short term statistics."""
+    return lambda_stmt(lambda: select(func.min(StatisticsShortTerm.start_ts)))
+
+
+def find_nth_oldest_state_ts(offset: int) -> StatementLambdaElement:
+    """Find the timestamp of the state after the offset oldest states."""
+    return lambda_stmt(
+        lambda: select(States.last_updated_ts)
+        .filter(States.last_updated_ts.is_not(None))
+        .order_by(States.last_updated_ts)
+        .offset(offset)
+        .limit(1)
+    )
+
+
+def find_nth_oldest_event_ts(offset: int) -> StatementLambdaElement:
+    """Find the timestamp of the event after the offset oldest events."""
+    return lambda_stmt(
+        lambda: select(Events.time_fired_ts)
+        .filter(Events.time_fired_ts.is_not(None))
+        .order_by(Events.time_fired_ts)
+        .offset(offset)
+        .limit(1)
+    )
+
+
+def find_nth_oldest_short_term_statistics_ts(
+    offset: int,
+) -> StatementLambdaElement:
+    """Find the start timestamp of the statistics after the offset oldest."""
+    return lambda_stmt(
+        lambda: select(StatisticsShortTerm.start_ts)
+        .order_by(StatisticsShortTerm.start_ts)
+        .offset(offset)
+        .limit(1)
+    )
+
+
+def find_attributes_ids_of_states_before(purge_before: float) -> StatementLambdaElement:
+    """Find the attributes ids of states older than purge_before."""
+    return lambda_stmt(
+        lambda: select(distinct(States.attributes_id)).filter(
+            States.last_updated_ts < purge_before
+        )
+    )
+
+
+def find_data_ids_of_events_before(purge_before: float) -> StatementLambdaElement:
+    """Find the data ids of events older than purge_before."""
+    return lambda_stmt(
+        lambda: select(distinct(Events.data_id)).filter(
+            Events.time_fired_ts < purge_before
+        )
+    )
+
+
+def find_state_ids_before_linked_to_newer_states(
+    purge_before: float,
+) -> StatementLambdaElement:
+    """Find states older than purge_before that newer states link to."""
+    return lambda_stmt(
+        lambda: select(OLD_STATE.state_id)
+        .select_from(States)
+        .join(OLD_STATE, States.old_state_id == OLD_STATE.state_id)
+        .filter(OLD_STATE.last_updated_ts < purge_before)
+        .filter(States.last_updated_ts >= purge_before)
+    )
+
+
+def find_state_ids_before(
+    state_ids: Iterable[int], purge_before: float
+) -> StatementLambdaElement:
+    """Find which of the state ids are older than purge_before."""
+    return lambda_stmt(
+        lambda: select(States.state_id)
+        .filter(States.state_id.in_(state_ids))
+        .filter(States.last_updated_ts < purge_before)
+    )
+
+
+def disconnect_states_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Disconnect states rows older than purge_before."""
+    return lambda_stmt(
+        lambda: update(States)
+        .filter(States.last_updated_ts < purge_before)
+        .filter(States.old_state_id.is_not(None))
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete states rows older than purge_before."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .filter(States.last_updated_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_event_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete events rows older than purge_before."""
+    return lambda_stmt(
+        lambda: delete(Events)
+        .filter(Events.time_fired_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_statistics_short_term_rows_before(
+    purge_before: float,
+) -> StatementLambdaElement:
+    """Delete statistics_short_term rows older than purge_before."""
+    return lambda_stmt(
+        lambda: delete(StatisticsShortTerm)
+        .filter(StatisticsShortTerm.start_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_oldest_state_and_event_ts() -> StatementLambdaElement:
+    """Find the timestamps of the oldest state and the oldest event."""
+    return lambda_stmt(
+        lambda: select(
+            select(func.min(States.last_updated_ts)).scalar_subquery(),
+            select(func.min(Events.time_fired_ts)).scalar_subquery(),
+        )
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
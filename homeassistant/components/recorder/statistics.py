@@ -11,8 +11,10 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
+import threading
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
+from lru import LRU
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
@@ -147,6 +149,10 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_DURING_PERIOD_CACHE = "recorder_statistics_during_period_cache"
+
+# The number of statistics_during_period results to keep in memory
+STATISTICS_DURING_PERIOD_CACHE_SIZE = 64
 
 
 def mean(values: list[float]) -> float | None:
@@ -190,6 +196,119 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+_StatisticsDuringPeriodKey = tuple[
+    datetime,  # start_time
+    datetime | None,  # end_time
+    frozenset[str],  # statistic_ids
+    str,  # period
+    frozenset[tuple[str, str]] | None,  # units
+    frozenset[str],  # types
+    str,  # time zone the period is aligned in
+    # the state units the statistics are displayed in by default
+    frozenset[tuple[str, str | None]],
+]
+
+
+@dataclasses.dataclass(slots=True)
+class _StatisticsDuringPeriodCacheEntry:
+    """A cached statistics_during_period result."""
+
+    statistic_ids: frozenset[str]
+    # The end of the time range the result was aligned to, or None
+    # if the result includes all statistics after the start time
+    end_time: datetime | None
+    result: dict[str, list[StatisticsRow]]
+
+
+class StatisticsDuringPeriodCache:
+    """Cache for statistics_during_period results.
+
+    The same periods are requested over and over again by
+    dashboards. The results are kept until a write to the
+    statistics tables touches one of their statistic_ids at or
+    before the end of their time range.
+
+    Lookups happen in the executor while writes happen in the
+    recorder thread, so all access is guarded by a lock. A result
+    is only stored if no write was committed while it was
+    being queried.
+    """
+
+    __slots__ = ("_entries", "_generation", "_lock")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: LRU[
+            _StatisticsDuringPeriodKey, _StatisticsDuringPeriodCacheEntry
+        ] = LRU(STATISTICS_DURING_PERIOD_CACHE_SIZE)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Return the generation which changes every time the cache is invalidated."""
+        return self._generation
+
+    def get(
+        self, key: _StatisticsDuringPeriodKey
+    ) -> dict[str, list[StatisticsRow]] | None:
+        """Return a copy of a cached result."""
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return None
+            result = entry.result
+        # Callers are allowed to modify the rows they get
+        return {
+            statistic_id: [row.copy() for row in rows]
+            for statistic_id, rows in result.items()
+        }
+
+    def set(
+        self,
+        key: _StatisticsDuringPeriodKey,
+        generation: int,
+        end_time: datetime | None,
+        result: dict[str, list[StatisticsRow]],
+    ) -> None:
+        """Cache a result queried at generation."""
+        entry = _StatisticsDuringPeriodCacheEntry(
+            key[2],
+            end_time,
+            {
+                statistic_id: [row.copy() for row in rows]
+                for statistic_id, rows in result.items()
+            },
+        )
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = entry
+
+    def invalidate(
+        self, statistic_ids: Iterable[str] | None, start_time: datetime | None
+    ) -> None:
+        """Invalidate the results affected by a committed write.
+
+        statistic_ids is None if the write may have touched any statistic.
+        start_time is the start of the first modified period or None if
+        the whole time range may have been touched. Results with a time
+        range ending at or before start_time are kept.
+        """
+        ids = None if statistic_ids is None else set(statistic_ids)
+        with self._lock:
+            self._generation += 1
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if (ids is None or not ids.isdisjoint(entry.statistic_ids))
+                and (
+                    start_time is None
+                    or entry.end_time is None
+                    or start_time < entry.end_time
+                )
+            ]:
+                del self._entries[key]
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -477,6 +596,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    get_statistics_during_period_cache(instance.hass).invalidate(None, None)
     return True
 
 
@@ -497,6 +617,11 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
             instance, session, start, fire_events
         )
 
+    # Compiling the hourly statistics can touch any statistic_id
+    get_statistics_during_period_cache(instance.hass).invalidate(
+        None, start.replace(minute=0)
+    )
+
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
         # statistics meta data into the cache in a fresh session to ensure that the
@@ -724,6 +849,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_statistics_during_period_cache(instance.hass).invalidate(statistic_ids, None)
 
 
 def update_statistics_metadata(
@@ -749,6 +875,10 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    statistic_ids = {statistic_id}
+    if isinstance(new_statistic_id, str):
+        statistic_ids.add(new_statistic_id)
+    get_statistics_during_period_cache(instance.hass).invalidate(statistic_ids, None)
 
 
 async def async_list_statistic_ids(
@@ -1643,6 +1773,43 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _align_time_range_with_period(
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+) -> tuple[datetime, datetime | None]:
+    """Align start_time and end_time with the period."""
+    if period == "day":
+        start_time = dt_util.as_local(start_time).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        start_time = start_time.replace()
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = end_local.replace(
+                hour=0, minute=0, second=0, microsecond=0
+            ) + timedelta(days=1)
+    elif period == "week":
+        start_local = dt_util.as_local(start_time)
+        start_time = start_local.replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=start_local.weekday())
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = (
+                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
+                - timedelta(days=end_local.weekday())
+                + timedelta(days=7)
+            )
+    elif period == "month":
+        start_time = dt_util.as_local(start_time).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        if end_time is not None:
+            end_time = _find_month_end_time(dt_util.as_local(end_time))
+    return start_time, end_time
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1681,34 +1848,7 @@ def _statistics_during_period_with_session(
         metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
 
     # Align start_time and end_time with the period
-    if period == "day":
-        start_time = dt_util.as_local(start_time).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        start_time = start_time.replace()
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = end_local.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ) + timedelta(days=1)
-    elif period == "week":
-        start_local = dt_util.as_local(start_time)
-        start_time = start_local.replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ) - timedelta(days=start_local.weekday())
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = (
-                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
-                - timedelta(days=end_local.weekday())
-                + timedelta(days=7)
-            )
-    elif period == "month":
-        start_time = dt_util.as_local(start_time).replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        if end_time is not None:
-            end_time = _find_month_end_time(dt_util.as_local(end_time))
+    start_time, end_time = _align_time_range_with_period(start_time, end_time, period)
 
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
@@ -1768,8 +1908,45 @@ def statistics_during_period(
     If end_time is omitted, returns statistics newer than or equal to start_time.
     If statistic_ids is omitted, returns statistics for all statistics ids.
     """
+    if not statistic_ids:
+        # The statistics for all statistic_ids are not cached since
+        # new statistic_ids can show up at any time
+        with session_scope(hass=hass, read_only=True) as session:
+            return _statistics_during_period_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                statistic_ids,
+                period,
+                units,
+                types,
+            )
+
+    cache = get_statistics_during_period_cache(hass)
+    key: _StatisticsDuringPeriodKey = (
+        start_time,
+        end_time,
+        frozenset(statistic_ids),
+        period,
+        frozenset(units.items()) if units is not None else None,
+        frozenset(types),
+        str(dt_util.DEFAULT_TIME_ZONE),
+        frozenset(
+            (
+                statistic_id,
+                state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                if (state := hass.states.get(statistic_id))
+                else None,
+            )
+            for statistic_id in statistic_ids
+        ),
+    )
+    if (result := cache.get(key)) is not None:
+        return result
+    generation = cache.generation
     with session_scope(hass=hass, read_only=True) as session:
-        return _statistics_during_period_with_session(
+        result = _statistics_during_period_with_session(
             hass,
             session,
             start_time,
@@ -1779,6 +1956,13 @@ def statistics_during_period(
             units,
             types,
         )
+    cache.set(
+        key,
+        generation,
+        _align_time_range_with_period(start_time, end_time, period)[1],
+        result,
+    )
+    return result
 
 
 def _get_last_statistics_stmt(
@@ -2287,6 +2471,14 @@ def _import_statistics_with_session(
     return True
 
 
+@singleton(DATA_STATISTICS_DURING_PERIOD_CACHE)
+def get_statistics_during_period_cache(
+    hass: HomeAssistant,
+) -> StatisticsDuringPeriodCache:
+    """Get the statistics_during_period cache."""
+    return StatisticsDuringPeriodCache()
+
+
 @singleton(DATA_SHORT_TERM_STATISTICS_RUN_CACHE)
 def get_short_term_statistics_run_cache(
     hass: HomeAssistant,
@@ -2354,16 +2546,24 @@ def import_statistics(
 ) -> bool:
     """Process an import_statistics job."""
 
+    statistics = list(statistics)
     with session_scope(
         session=instance.get_session(),
         exception_filter=filter_unique_constraint_integrity_error(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
+        imported = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
 
+    if statistics:
+        get_statistics_during_period_cache(instance.hass).invalidate(
+            {metadata["statistic_id"]},
+            min(stat["start"] for stat in statistics).replace(minute=0),
+        )
+    return imported
+
 
 @retryable_database_job("adjust_statistics")
 def adjust_statistics(
@@ -2404,6 +2604,9 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+    get_statistics_during_period_cache(instance.hass).invalidate(
+        {statistic_id}, start_time.replace(minute=0)
+    )
     return True
 
 
@@ -2472,6 +2675,8 @@ def change_statistics_unit(
             session, statistic_id, new_unit
         )
 
+    get_statistics_during_period_cache(instance.hass).invalidate({statistic_id}, None)
+
 
 @callback
 def async_change_statistics_unit(
@@ -115,6 +115,9 @@ class PurgeTask(RecorderTask):
         ):
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
+            # Rows recorded while the clock was off may be older than the
+            # cursor of the incremental purge, let it find the oldest again
+            instance.purge_cursor = None
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
             # tasks happen after a vacuum.
@@ -126,6 +129,18 @@ class PurgeTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class IncrementalPurgeTask(RecorderTask):
+    """Object to store information about an incremental purge slice."""
+
+    purge_before: datetime
+
+    def run(self, instance: Recorder) -> None:
+        """Purge a slice of the database."""
+        # pylint: disable-next=[protected-access]
+        instance._incremental_purge(self.purge_before)
+
+
 @dataclass(slots=True)
 class PurgeEntitiesTask(RecorderTask):
     """Object to store entity information about purge task."""
@@ -6,7 +6,7 @@ from collections import defaultdict
 from collections.abc import Iterable
 from enum import StrEnum
 import logging
-from typing import Any
+from typing import Any, TypeAlias
 
 import voluptuous as vol
 
@@ -23,6 +23,7 @@ from homeassistant.helpers.entity import (
     EntityInfo,
     entity_sources as get_entity_sources,
 )
+from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.typing import ConfigType
 
 DOMAIN = "search"
@@ -50,12 +51,112 @@ class ItemType(StrEnum):
     SCRIPT_BLUEPRINT = "script_blueprint"
 
 
+# The item types referenced by automations and scripts and the properties
+# of their entities which hold the references
+REFERENCE_PROPERTIES = {
+    ItemType.AREA: "referenced_areas",
+    ItemType.DEVICE: "referenced_devices",
+    ItemType.ENTITY: "referenced_entities",
+    ItemType.FLOOR: "referenced_floors",
+    ItemType.LABEL: "referenced_labels",
+}
+
+ReferencingEntity: TypeAlias = automation.BaseAutomationEntity | script.BaseScriptEntity
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Search component."""
     websocket_api.async_register_command(hass, websocket_search_related)
     return True
 
 
+class ReferenceIndex:
+    """Reverse index of the items referenced by the entities of a domain.
+
+    Automations and scripts are replaced by new entities when they are
+    reloaded. The index is brought up to date before each search by
+    re-indexing only the entities which were added or replaced since.
+    """
+
+    def __init__(self, hass: HomeAssistant, domain: str, blueprint: ItemType) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self.domain = domain
+        self.blueprint = blueprint
+        self._indexed: dict[
+            str, tuple[ReferencingEntity, list[tuple[ItemType, str]]]
+        ] = {}
+        self._referenced_by: defaultdict[tuple[ItemType, str], set[str]] = (
+            defaultdict(set)
+        )
+
+    @callback
+    def async_update(self) -> None:
+        """Re-index the entities which changed since the last update."""
+        component: EntityComponent[ReferencingEntity] | None = self.hass.data.get(
+            self.domain
+        )
+        entities = (
+            {entity.entity_id: entity for entity in component.entities}
+            if component is not None
+            else {}
+        )
+        for entity_id in self._indexed.keys() - entities.keys():
+            self._async_remove(entity_id)
+
+        for entity_id, entity in entities.items():
+            if (indexed := self._indexed.get(entity_id)) is not None:
+                if indexed[0] is entity:
+                    continue
+                self._async_remove(entity_id)
+            self._async_add(entity_id, entity)
+
+    @callback
+    def _async_add(self, entity_id: str, entity: ReferencingEntity) -> None:
+        """Index the references of an entity."""
+        references = [
+            (item_type, item_id)
+            for item_type, property_name in REFERENCE_PROPERTIES.items()
+            for item_id in getattr(entity, property_name)
+        ]
+        if (blueprint := entity.referenced_blueprint) is not None:
+            references.append((self.blueprint, blueprint))
+
+        for reference in references:
+            self._referenced_by[reference].add(entity_id)
+        self._indexed[entity_id] = (entity, references)
+
+    @callback
+    def _async_remove(self, entity_id: str) -> None:
+        """Remove the references of an entity from the index."""
+        _, references = self._indexed.pop(entity_id)
+        for reference in references:
+            referenced_by = self._referenced_by[reference]
+            referenced_by.discard(entity_id)
+            if not referenced_by:
+                del self._referenced_by[reference]
+
+    @callback
+    def async_referenced_by(self, item_type: ItemType, item_id: str) -> set[str]:
+        """Return the entities referencing an item."""
+        return self._referenced_by.get((item_type, item_id), set())
+
+
+@callback
+def async_get_reference_indexes(
+    hass: HomeAssistant,
+) -> tuple[ReferenceIndex, ReferenceIndex]:
+    """Return the up to date reference indexes of automations and scripts."""
+    if (indexes := hass.data.get(DOMAIN)) is None:
+        indexes = hass.data[DOMAIN] = (
+            ReferenceIndex(hass, automation.DOMAIN, ItemType.AUTOMATION_BLUEPRINT),
+            ReferenceIndex(hass, script.DOMAIN, ItemType.SCRIPT_BLUEPRINT),
+        )
+    for index in indexes:
+        index.async_update()
+    return indexes
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "search/related",
@@ -92,6 +193,7 @@ class Searcher:
         self._device_registry = dr.async_get(hass)
         self._entity_registry = er.async_get(hass)
         self._entity_sources = entity_sources
+        self._automations, self._scripts = async_get_reference_indexes(hass)
         self.results: defaultdict[ItemType, set[str]] = defaultdict(set)
 
     @callback
@@ -130,11 +232,14 @@ class Searcher:
 
         # Automations referencing this area
         self._add(
-            ItemType.AUTOMATION, automation.automations_with_area(self.hass, area_id)
+            ItemType.AUTOMATION,
+            self._automations.async_referenced_by(ItemType.AREA, area_id),
         )
 
         # Scripts referencing this area
-        self._add(ItemType.SCRIPT, script.scripts_with_area(self.hass, area_id))
+        self._add(
+            ItemType.SCRIPT, self._scripts.async_referenced_by(ItemType.AREA, area_id)
+        )
 
         # Entity in this area, will extend this with the entities of the devices in this area
         entity_entries = er.async_entries_for_area(self._entity_registry, area_id)
@@ -150,11 +255,14 @@ class Searcher:
             # Automations referencing this device
             self._add(
                 ItemType.AUTOMATION,
-                automation.automations_with_device(self.hass, device.id),
+                self._automations.async_referenced_by(ItemType.DEVICE, device.id),
             )
 
             # Scripts referencing this device
-            self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device.id))
+            self._add(
+                ItemType.SCRIPT,
+                self._scripts.async_referenced_by(ItemType.DEVICE, device.id),
+            )
 
             # Entities of this device
             for entity_entry in er.async_entries_for_device(
@@ -176,13 +284,17 @@ class Searcher:
             # Automations referencing this entity
             self._add(
                 ItemType.AUTOMATION,
-                automation.automations_with_entity(self.hass, entity_entry.entity_id),
+                self._automations.async_referenced_by(
+                    ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Scripts referencing this entity
             self._add(
                 ItemType.SCRIPT,
-                script.scripts_with_entity(self.hass, entity_entry.entity_id),
+                self._scripts.async_referenced_by(
+                    ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Groups that have this entity as a member
@@ -272,7 +384,9 @@ class Searcher:
         """Find results for an automation blueprint."""
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_blueprint(self.hass, blueprint_path),
+            self._automations.async_referenced_by(
+                ItemType.AUTOMATION_BLUEPRINT, blueprint_path
+            ),
         )
 
     @callback
@@ -303,11 +417,14 @@ class Searcher:
         # Automations referencing this device
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_device(self.hass, device_id),
+            self._automations.async_referenced_by(ItemType.DEVICE, device_id),
         )
 
         # Scripts referencing this device
-        self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._scripts.async_referenced_by(ItemType.DEVICE, device_id),
+        )
 
         # Entities of this device
         for entity_entry in er.async_entries_for_device(
@@ -330,11 +447,14 @@ class Searcher:
         # Automations referencing this entity
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, entity_id),
+            self._automations.async_referenced_by(ItemType.ENTITY, entity_id),
         )
 
         # Scripts referencing this entity
-        self._add(ItemType.SCRIPT, script.scripts_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._scripts.async_referenced_by(ItemType.ENTITY, entity_id),
+        )
 
         # Groups that have this entity as a member
         self._add(ItemType.GROUP, group.groups_with_entity(self.hass, entity_id))
@@ -351,11 +471,13 @@ class Searcher:
         # Automations referencing this floor
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_floor(self.hass, floor_id),
+            self._automations.async_referenced_by(ItemType.FLOOR, floor_id),
         )
 
         # Scripts referencing this floor
-        self._add(ItemType.SCRIPT, script.scripts_with_floor(self.hass, floor_id))
+        self._add(
+            ItemType.SCRIPT, self._scripts.async_referenced_by(ItemType.FLOOR, floor_id)
+        )
 
         for area_entry in ar.async_entries_for_floor(self._area_registry, floor_id):
             self._add(ItemType.AREA, area_entry.id)
@@ -371,12 +493,13 @@ class Searcher:
         # Automations referencing this group
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, group_entity_id),
+            self._automations.async_referenced_by(ItemType.ENTITY, group_entity_id),
         )
 
         # Scripts referencing this group
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, group_entity_id)
+            ItemType.SCRIPT,
+            self._scripts.async_referenced_by(ItemType.ENTITY, group_entity_id),
         )
 
         # Scenes that reference this group
@@ -411,11 +534,13 @@ class Searcher:
         # Automations referencing this label
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_label(self.hass, label_id),
+            self._automations.async_referenced_by(ItemType.LABEL, label_id),
         )
 
         # Scripts referencing this label
-        self._add(ItemType.SCRIPT, script.scripts_with_label(self.hass, label_id))
+        self._add(
+            ItemType.SCRIPT, self._scripts.async_referenced_by(ItemType.LABEL, label_id)
+        )
 
     @callback
     def _async_search_person(self, person_entity_id: str) -> None:
@@ -428,12 +553,13 @@ class Searcher:
         # Automations referencing this person
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, person_entity_id),
+            self._automations.async_referenced_by(ItemType.ENTITY, person_entity_id),
         )
 
         # Scripts referencing this person
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, person_entity_id)
+            ItemType.SCRIPT,
+            self._scripts.async_referenced_by(ItemType.ENTITY, person_entity_id),
         )
 
         # Add all member entities of this person
@@ -452,12 +578,13 @@ class Searcher:
         # Automations referencing this scene
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, scene_entity_id),
+            self._automations.async_referenced_by(ItemType.ENTITY, scene_entity_id),
         )
 
         # Scripts referencing this scene
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, scene_entity_id)
+            ItemType.SCRIPT,
+            self._scripts.async_referenced_by(ItemType.ENTITY, scene_entity_id),
         )
 
         # Add all entities in this scene
@@ -529,7 +656,10 @@ class Searcher:
     def _async_search_script_blueprint(self, blueprint_path: str) -> None:
         """Find results for a script blueprint."""
         self._add(
-            ItemType.SCRIPT, script.scripts_with_blueprint(self.hass, blueprint_path)
+            ItemType.SCRIPT,
+            self._scripts.async_referenced_by(
+                ItemType.SCRIPT_BLUEPRINT, blueprint_path
+            ),
         )
 
     @callback
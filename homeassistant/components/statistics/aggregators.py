@@ -0,0 +1,255 @@
+"""Incrementally maintained aggregates over the statistics sample buffer."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Callable, Iterable
+from datetime import datetime
+import math
+
+Sample = tuple[float, datetime]
+
+
+class SampleAggregator(ABC):
+    """Aggregate over the samples in the buffer.
+
+    Samples are added at the end of the buffer and removed from the front,
+    the same way the buffer itself is updated. Aggregators that accumulate
+    floating point rounding errors set drifts so the sensor periodically
+    rebuilds them from the buffer. They are also rebuilt when an infinite
+    or nan sample is removed, since it cannot be subtracted again.
+    """
+
+    drifts = False
+
+    @abstractmethod
+    def add(self, value: float, age: datetime, last: Sample | None) -> None:
+        """Add a sample after the current newest sample last."""
+
+    @abstractmethod
+    def remove(self, value: float, age: datetime, first: Sample | None) -> None:
+        """Remove the oldest sample, first is the oldest sample afterwards."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all samples."""
+
+    def rebuild(self, samples: Iterable[Sample]) -> None:
+        """Recalculate the aggregate from all samples in the buffer."""
+        self.clear()
+        last: Sample | None = None
+        for sample in samples:
+            self.add(*sample, last)
+            last = sample
+
+
+class SumAggregator(SampleAggregator):
+    """Running sum, mean and sum of squared deviations (Welford)."""
+
+    drifts = True
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self.count = 0
+        self.sum: float = 0
+        self.mean: float = 0
+        self._m2: float = 0
+
+    def add(self, value: float, age: datetime, last: Sample | None) -> None:
+        """Add a sample."""
+        self.count += 1
+        self.sum += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def remove(self, value: float, age: datetime, first: Sample | None) -> None:
+        """Remove the oldest sample."""
+        if self.count == 1:
+            self.clear()
+            return
+        self.count -= 1
+        self.sum -= value
+        old_mean = self.mean
+        self.mean = (old_mean * (self.count + 1) - value) / self.count
+        self._m2 = max(self._m2 - (value - old_mean) * (value - self.mean), 0)
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self.count = 0
+        self.sum = 0
+        self.mean = 0
+        self._m2 = 0
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two samples."""
+        return self._m2 / (self.count - 1)
+
+
+class PairAggregator(SampleAggregator):
+    """Running sum of a term calculated from each pair of adjacent samples."""
+
+    drifts = True
+
+    def __init__(self, term: Callable[[Sample, Sample], float]) -> None:
+        """Initialize the aggregator."""
+        self._term = term
+        self.total: float = 0
+
+    def add(self, value: float, age: datetime, last: Sample | None) -> None:
+        """Add a sample."""
+        if last is not None:
+            self.total += self._term(last, (value, age))
+
+    def remove(self, value: float, age: datetime, first: Sample | None) -> None:
+        """Remove the oldest sample."""
+        if first is None:
+            self.total = 0
+        else:
+            self.total -= self._term((value, age), first)
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self.total = 0
+
+
+class ExtremesAggregator(SampleAggregator):
+    """Minimum and maximum kept in monotonic queues.
+
+    The front of each queue holds the oldest occurrence of the extreme value.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self._added = 0
+        self._removed = 0
+        self._max: deque[tuple[int, float, datetime]] = deque()
+        self._min: deque[tuple[int, float, datetime]] = deque()
+
+    def add(self, value: float, age: datetime, last: Sample | None) -> None:
+        """Add a sample."""
+        entry = (self._added, value, age)
+        self._added += 1
+        while self._max and self._max[-1][1] < value:
+            self._max.pop()
+        self._max.append(entry)
+        while self._min and self._min[-1][1] > value:
+            self._min.pop()
+        self._min.append(entry)
+
+    def remove(self, value: float, age: datetime, first: Sample | None) -> None:
+        """Remove the oldest sample."""
+        if self._max[0][0] == self._removed:
+            self._max.popleft()
+        if self._min[0][0] == self._removed:
+            self._min.popleft()
+        self._removed += 1
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self._added = self._removed = 0
+        self._max.clear()
+        self._min.clear()
+
+    @property
+    def max(self) -> Sample:
+        """Return the maximum value and the age of its oldest occurrence."""
+        return self._max[0][1:]
+
+    @property
+    def min(self) -> Sample:
+        """Return the minimum value and the age of its oldest occurrence."""
+        return self._min[0][1:]
+
+
+class SortedAggregator(SampleAggregator):
+    """Sorted copy of the values for order statistics.
+
+    Nan values cannot be ordered, so they are only counted and the
+    order statistics are nan while the buffer holds any of them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self.values: list[float] = []
+        self._nan_count = 0
+
+    def add(self, value: float, age: datetime, last: Sample | None) -> None:
+        """Add a sample."""
+        if math.isnan(value):
+            self._nan_count += 1
+            return
+        insort(self.values, value)
+
+    def remove(self, value: float, age: datetime, first: Sample | None) -> None:
+        """Remove the oldest sample."""
+        if math.isnan(value):
+            self._nan_count -= 1
+            return
+        del self.values[bisect_left(self.values, value)]
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self.values.clear()
+        self._nan_count = 0
+
+    @property
+    def median(self) -> float:
+        """Return the median like statistics.median."""
+        if self._nan_count:
+            return math.nan
+        values = self.values
+        middle = len(values) // 2
+        if len(values) % 2:
+            return values[middle]
+        return (values[middle - 1] + values[middle]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile like statistics.quantiles with method exclusive."""
+        if self._nan_count:
+            return math.nan
+        values = self.values
+        count = len(values)
+        position = percentile * (count + 1)
+        index = min(max(position // 100, 1), count - 1)
+        delta = position - index * 100
+        return (values[index - 1] * (100 - delta) + values[index] * delta) / 100
+
+
+class CircularAggregator(SampleAggregator):
+    """Running sums of the sine and cosine of values in degrees."""
+
+    drifts = True
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self.sin_sum: float = 0
+        self.cos_sum: float = 0
+
+    @staticmethod
+    def _terms(value: float) -> tuple[float, float]:
+        """Return the sine and cosine of a value, nan if it is not finite."""
+        if not math.isfinite(value):
+            return math.nan, math.nan
+        radians = math.radians(value)
+        return math.sin(radians), math.cos(radians)
+
+    def add(self, value: float, age: datetime, last: Sample | None) -> None:
+        """Add a sample."""
+        sin, cos = self._terms(value)
+        self.sin_sum += sin
+        self.cos_sum += cos
+
+    def remove(self, value: float, age: datetime, first: Sample | None) -> None:
+        """Remove the oldest sample."""
+        sin, cos = self._terms(value)
+        self.sin_sum -= sin
+        self.cos_sum -= cos
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self.sin_sum = 0
+        self.cos_sum = 0
@@ -8,7 +8,6 @@ import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -54,6 +53,15 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .aggregators import (
+    CircularAggregator,
+    ExtremesAggregator,
+    PairAggregator,
+    Sample,
+    SampleAggregator,
+    SortedAggregator,
+    SumAggregator,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -180,6 +188,69 @@ STATS_BINARY_PERCENTAGE = {
     STAT_MEAN,
 }
 
+
+def _term_area_linear(first: Sample, second: Sample) -> float:
+    """Return the area under the line between two samples."""
+    return 0.5 * (first[0] + second[0]) * (second[1] - first[1]).total_seconds()
+
+
+def _term_area_step(first: Sample, second: Sample) -> float:
+    """Return the area under the step from the first to the second sample."""
+    return first[0] * (second[1] - first[1]).total_seconds()
+
+
+def _term_difference(first: Sample, second: Sample) -> float:
+    """Return the absolute difference between two samples."""
+    return abs(second[0] - first[0])
+
+
+def _term_difference_nonnegative(first: Sample, second: Sample) -> float:
+    """Return the difference between two samples, counting resets from zero."""
+    return second[0] - first[0] if second[0] >= first[0] else second[0]
+
+
+def _term_binary_on_seconds(first: Sample, second: Sample) -> float:
+    """Return the seconds a binary source was on between two samples."""
+    return (second[1] - first[1]).total_seconds() if first[0] is True else 0
+
+
+# Numeric statistics calculated from incrementally maintained aggregates
+# instead of the whole buffer on every update
+STATS_NUMERIC_SUM_AGGREGATED = {
+    STAT_AVERAGE_TIMELESS,
+    STAT_DISTANCE_95P,
+    STAT_DISTANCE_99P,
+    STAT_MEAN,
+    STAT_STANDARD_DEVIATION,
+    STAT_SUM,
+    STAT_TOTAL,
+    STAT_VARIANCE,
+}
+STATS_NUMERIC_PAIR_TERMS = {
+    STAT_AVERAGE_LINEAR: _term_area_linear,
+    STAT_AVERAGE_STEP: _term_area_step,
+    STAT_NOISINESS: _term_difference,
+    STAT_SUM_DIFFERENCES: _term_difference,
+    STAT_SUM_DIFFERENCES_NONNEGATIVE: _term_difference_nonnegative,
+}
+STATS_NUMERIC_EXTREMES_AGGREGATED = {
+    STAT_DATETIME_VALUE_MAX,
+    STAT_DATETIME_VALUE_MIN,
+    STAT_DISTANCE_ABSOLUTE,
+    STAT_VALUE_MAX,
+    STAT_VALUE_MIN,
+}
+STATS_NUMERIC_SORTED_AGGREGATED = {
+    STAT_MEDIAN,
+    STAT_PERCENTILE,
+}
+STATS_BINARY_SUM_AGGREGATED = {
+    STAT_AVERAGE_TIMELESS,
+    STAT_COUNT_BINARY_OFF,
+    STAT_COUNT_BINARY_ON,
+    STAT_MEAN,
+}
+
 CONF_STATE_CHARACTERISTIC = "state_characteristic"
 CONF_SAMPLES_MAX_BUFFER_SIZE = "sampling_size"
 CONF_MAX_AGE = "max_age"
@@ -320,6 +391,20 @@ class StatisticsSensor(SensorEntity):
         self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
         self.attributes: dict[str, StateType] = {}
 
+        self._sums = SumAggregator()
+        self._pairs = PairAggregator(
+            _term_binary_on_seconds
+            if self.is_binary
+            else STATS_NUMERIC_PAIR_TERMS.get(state_characteristic, _term_difference)
+        )
+        self._extremes = ExtremesAggregator()
+        self._sorted = SortedAggregator()
+        self._circular = CircularAggregator()
+        self._aggregators: list[SampleAggregator] = self._aggregators_for(
+            state_characteristic
+        )
+        self._removals_since_rebuild = 0
+
         self._state_characteristic_fn: Callable[[], StateType | datetime] = (
             self._callable_characteristic_fn(self._state_characteristic)
         )
@@ -369,10 +454,9 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self._append_sample(new_state.state == "on", new_state.last_updated)
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                self._append_sample(float(new_state.state), new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -385,6 +469,55 @@ class StatisticsSensor(SensorEntity):
 
         self._unit_of_measurement = self._derive_unit_of_measurement(new_state)
 
+    def _aggregators_for(self, characteristic: str) -> list[SampleAggregator]:
+        """Return the aggregators a characteristic is calculated from."""
+        if self.is_binary:
+            if characteristic in STATS_BINARY_SUM_AGGREGATED:
+                return [self._sums]
+            if characteristic == STAT_AVERAGE_STEP:
+                return [self._pairs]
+            return []
+        if characteristic in STATS_NUMERIC_SUM_AGGREGATED:
+            return [self._sums]
+        if characteristic in STATS_NUMERIC_PAIR_TERMS:
+            return [self._pairs]
+        if characteristic in STATS_NUMERIC_EXTREMES_AGGREGATED:
+            return [self._extremes]
+        if characteristic in STATS_NUMERIC_SORTED_AGGREGATED:
+            return [self._sorted]
+        if characteristic == STAT_MEAN_CIRCULAR:
+            return [self._circular]
+        return []
+
+    def _append_sample(self, value: float, age: datetime) -> None:
+        """Add a sample to the buffer, dropping the oldest one if it is full."""
+        if len(self.states) == self.states.maxlen:
+            self._pop_oldest_sample()
+        last = (self.states[-1], self.ages[-1]) if self.states else None
+        self.states.append(value)
+        self.ages.append(age)
+        for aggregator in self._aggregators:
+            aggregator.add(value, age, last)
+
+    def _pop_oldest_sample(self) -> None:
+        """Remove the oldest sample from the buffer."""
+        value = self.states.popleft()
+        age = self.ages.popleft()
+        first = (self.states[0], self.ages[0]) if self.states else None
+        for aggregator in self._aggregators:
+            aggregator.remove(value, age, first)
+
+        # Rebuild aggregates that accumulate rounding errors once every
+        # buffer length of removals, which keeps the cost per sample constant.
+        # An infinite or nan sample left them infinite or nan, so they are
+        # rebuilt right away once it is removed.
+        self._removals_since_rebuild += 1
+        if not math.isfinite(value) or self._removals_since_rebuild > len(self.states):
+            self._removals_since_rebuild = 0
+            for aggregator in self._aggregators:
+                if aggregator.drifts:
+                    aggregator.rebuild(zip(self.states, self.ages))
+
     def _derive_unit_of_measurement(self, new_state: State) -> str | None:
         base_unit: str | None = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         unit: str | None
@@ -496,8 +629,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._pop_oldest_sample()
 
     def _next_to_purge_timestamp(self) -> datetime | None:
         """Find the timestamp when the next purge would occur."""
@@ -641,27 +773,14 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._pairs.total / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._pairs.total / age_range_seconds
         return None
 
     def _stat_average_timeless(self) -> StateType:
@@ -699,12 +818,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return self._extremes.max[1]
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return self._extremes.min[1]
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -719,24 +838,24 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            return self._extremes.max[0] - self._extremes.min[0]
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return self._sums.sum / self._sums.count
         return None
 
     def _stat_mean_circular(self) -> StateType:
         if len(self.states) > 0:
-            sin_sum = sum(math.sin(math.radians(x)) for x in self.states)
-            cos_sum = sum(math.cos(math.radians(x)) for x in self.states)
+            sin_sum = self._circular.sin_sum
+            cos_sum = self._circular.cos_sum
             return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            return self._sorted.median
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -746,35 +865,27 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            return self._sorted.percentile(self._percentile)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return math.sqrt(self._sums.variance)
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return self._sums.sum
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            diff_sum = sum(
-                abs(j - i) for i, j in zip(list(self.states), list(self.states)[1:])
-            )
-            return diff_sum
+            return self._pairs.total
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            diff_sum_nn = sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:])
-            )
-            return diff_sum_nn
+            return self._pairs.total
         return None
 
     def _stat_total(self) -> StateType:
@@ -782,29 +893,25 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return self._extremes.max[0]
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return self._extremes.min[0]
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return self._sums.variance
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return 100 / age_range_seconds * on_seconds
+            return 100 / age_range_seconds * self._pairs.total
         return None
 
     def _stat_binary_average_timeless(self) -> StateType:
@@ -814,10 +921,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return self._sums.sum
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - self._sums.sum
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -827,5 +934,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * self._sums.sum
         return None
@@ -485,6 +485,8 @@ class TemplateEntity(Entity):
             self._handle_results,
             log_fn=log_fn,
             has_super_template=has_availability_template,
+            # Previews report the errors of the first render through log_fn
+            defer_render=log_fn is None,
         )
         self.async_on_remove(result_info.async_remove)
         self._template_result_info = result_info
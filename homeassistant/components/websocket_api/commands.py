@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Iterable
 from functools import lru_cache, partial
 import json
 import logging
@@ -51,6 +52,7 @@ from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     Integration,
     IntegrationNotFound,
+    async_get_import_timings,
     async_get_integration,
     async_get_integration_descriptions,
     async_get_integrations,
@@ -82,6 +84,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_import_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -306,16 +309,13 @@ async def handle_call_service(
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
-) -> list[State]:
+) -> Iterable[State]:
     user = connection.user
+    snapshot = hass.states.async_snapshot()
     if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
-        return hass.states.async_all()
+        return snapshot.states()
     entity_perm = connection.user.permissions.check_entity
-    return [
-        state
-        for state in hass.states.async_all()
-        if entity_perm(state.entity_id, POLICY_READ)
-    ]
+    return [state for state in snapshot if entity_perm(state.entity_id, POLICY_READ)]
 
 
 @callback
@@ -361,12 +361,85 @@ def _send_handle_get_states_response(
     )
 
 
+class _StateDiffCoalescer:
+    """Merge state changes per entity while a client is falling behind.
+
+    As long as the connection has fewer than PENDING_MSG_COALESCE_THRESHOLD
+    messages waiting to be written, every state change is sent as its own
+    diff. Once the client falls behind, the changes are merged per entity
+    and sent as a single message once the queue has drained, so a slow
+    client ends up with the latest states instead of being disconnected.
+    """
+
+    __slots__ = ("_connection", "_msg_id", "_pending", "_flush_handle")
+
+    def __init__(self, connection: ActiveConnection, msg_id: int) -> None:
+        """Initialize the coalescer."""
+        self._connection = connection
+        self._msg_id = msg_id
+        # entity_id -> (last state sent to the client, latest state)
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_send_state_diff(self, event: Event[EventStateChangedData]) -> None:
+        """Send or merge a state changed event."""
+        event_data = event.data
+        entity_id = event_data["entity_id"]
+        new_state = event_data["new_state"]
+        if pending := self._pending:
+            # Already behind, keep merging until the next flush
+            if entity_id in pending:
+                pending[entity_id] = (pending[entity_id][0], new_state)
+            else:
+                pending[entity_id] = (event_data["old_state"], new_state)
+            return
+        connection = self._connection
+        if connection.pending_messages() < const.PENDING_MSG_COALESCE_THRESHOLD:
+            connection.send_message(
+                messages.cached_state_diff_message(self._msg_id, event)
+            )
+            return
+        pending[entity_id] = (event_data["old_state"], new_state)
+        self._async_schedule_flush()
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Schedule sending the merged state changes."""
+        self._flush_handle = self._connection.hass.loop.call_later(
+            const.COALESCE_FLUSH_INTERVAL, self._async_flush
+        )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the merged state changes if the client has caught up."""
+        self._flush_handle = None
+        connection = self._connection
+        if connection.pending_messages() >= const.PENDING_MSG_COALESCE_THRESHOLD:
+            self._async_schedule_flush()
+            return
+        pending = self._pending
+        self._pending = {}
+        connection.send_message(
+            messages.coalesced_state_diff_message(self._msg_id, pending)
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel a scheduled flush."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending.clear()
+
+
 @callback
 def _forward_entity_changes(
     send_message: Callable[[str | bytes | dict[str, Any] | Callable[[], str]], None],
     entity_ids: set[str],
     user: User,
     msg_id: int,
+    coalescer: _StateDiffCoalescer | None,
     event: Event[EventStateChangedData],
 ) -> None:
     """Forward entity state changed events to websocket."""
@@ -382,6 +455,9 @@ def _forward_entity_changes(
         and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
     ):
         return
+    if coalescer is not None:
+        coalescer.async_send_state_diff(event)
+        return
     send_message(messages.cached_state_diff_message(msg_id, event))
 
 
@@ -390,6 +466,7 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce", default=False): bool,
     }
 )
 def handle_subscribe_entities(
@@ -401,7 +478,8 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+    coalescer = _StateDiffCoalescer(connection, msg["id"]) if msg["coalesce"] else None
+    unsub = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
         partial(
             _forward_entity_changes,
@@ -409,9 +487,21 @@ def handle_subscribe_entities(
             entity_ids,
             connection.user,
             msg["id"],
+            coalescer,
         ),
         run_immediately=True,
     )
+    if coalescer is None:
+        connection.subscriptions[msg["id"]] = unsub
+    else:
+
+        @callback
+        def _async_unsub() -> None:
+            """Stop forwarding state changes and drop merged ones."""
+            unsub()
+            coalescer.async_cancel()
+
+        connection.subscriptions[msg["id"]] = _async_unsub
     connection.send_result(msg["id"])
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -548,6 +638,21 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/import_info"})
+def handle_integration_import_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration import timings command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"module": module, "seconds": seconds}
+            for module, seconds in async_get_import_timings(hass).items()
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -30,6 +30,15 @@ MessageHandler = Callable[[HomeAssistant, "ActiveConnection", dict[str, Any]], N
 BinaryHandler = Callable[[HomeAssistant, "ActiveConnection", bytes], None]
 
 
+def _no_pending_messages() -> int:
+    """Return the pending message count of a connection without a queue."""
+    return 0
+
+
+def _no_compression(level: int) -> None:
+    """Ignore the compression level of a connection without compression."""
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -37,6 +46,8 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "pending_messages",
+        "set_compression_level",
         "user",
         "refresh_token_id",
         "subscriptions",
@@ -59,6 +70,12 @@ class ActiveConnection:
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        # Returns the number of messages waiting to be written to the client,
+        # replaced by the websocket handler once the connection is authenticated
+        self.pending_messages: Callable[[], int] = _no_pending_messages
+        # Changes the deflate level of permessage-deflate, replaced by the
+        # websocket handler once the connection is authenticated
+        self.set_compression_level: Callable[[int], None] = _no_compression
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
@@ -79,6 +96,8 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        if (level := features.get(const.FEATURE_COMPRESSION_LEVEL)) is not None:
+            self.set_compression_level(int(level))
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
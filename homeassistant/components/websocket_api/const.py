@@ -26,6 +26,12 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
 MAX_PENDING_MSG: Final = 4096
+# Once this many messages are pending, subscribe_entities subscriptions
+# with coalescing enabled merge state changes per entity instead of
+# queueing a message for every change.
+PENDING_MSG_COALESCE_THRESHOLD: Final = 256
+# Seconds between attempts to flush merged state changes to the client.
+COALESCE_FLUSH_INTERVAL: Final = 0.5
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
@@ -51,3 +57,5 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+# Deflate level (0-9) used for permessage-deflate once negotiated
+FEATURE_COMPRESSION_LEVEL = "compression_level"
@@ -9,6 +9,7 @@ import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 
@@ -37,6 +38,13 @@ from .util import describe_request
 if TYPE_CHECKING:
     from .connection import ActiveConnection
 
+try:
+    # Not part of the public aiohttp API, the compression level
+    # requested by a client is ignored if they are not available
+    from aiohttp.compression_utils import ZLibCompressor
+    from aiohttp.http_websocket import WEBSOCKET_MAX_SYNC_CHUNK_SIZE
+except ImportError:
+    ZLibCompressor = None  # type: ignore[assignment,misc]
 
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
@@ -256,6 +264,36 @@ class WebSocketHandler:
         )
         self._cancel()
 
+    @callback
+    def _set_compression_level(self, level: int) -> None:
+        """Set the deflate level used for messages sent to the client.
+
+        aiohttp always compresses with Z_BEST_SPEED and does not let the
+        level be chosen when the response is prepared, so the compressor of
+        the writer is replaced. The client keeps inflating the same stream
+        since the previous compressor ended its last message with a sync flush.
+
+        The writer is private to aiohttp, if it does not look as expected
+        the level of aiohttp is kept.
+        """
+        writer = getattr(self._wsock, "_writer", None)
+        if writer is None or not getattr(writer, "compress", 0):
+            # The client did not negotiate permessage-deflate
+            return
+        if ZLibCompressor is None or not hasattr(writer, "_compressobj"):
+            self._logger.debug(
+                "%s: Compression level is not supported", self.description
+            )
+            return
+        level = min(max(level, zlib.Z_NO_COMPRESSION), zlib.Z_BEST_COMPRESSION)
+        self._logger.debug("%s: Compression level %s", self.description, level)
+        # pylint: disable-next=protected-access
+        writer._compressobj = ZLibCompressor(
+            level=level,
+            wbits=-writer.compress,
+            max_sync_chunk_size=WEBSOCKET_MAX_SYNC_CHUNK_SIZE,
+        )
+
     @callback
     def _cancel(self) -> None:
         """Cancel the connection."""
@@ -338,6 +376,8 @@ class WebSocketHandler:
             # We only start the writer queue after the auth phase is completed
             # since there is no need to queue messages before the auth phase
             self._connection = connection
+            connection.pending_messages = self._message_queue.__len__
+            connection.set_compression_level = self._set_compression_level
             self._writer_task = create_eager_task(self._writer(send_bytes_text))
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -13,6 +13,7 @@ from collections.abc import (
     Collection,
     Coroutine,
     Iterable,
+    Iterator,
     KeysView,
     Mapping,
     ValuesView,
@@ -45,6 +46,7 @@ from typing import (
     overload,
 )
 from urllib.parse import urlparse
+import weakref
 
 from typing_extensions import TypeVar
 import voluptuous as vol
@@ -1332,11 +1334,21 @@ EMPTY_LIST: list[Any] = []
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_indexed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType[Any]]] = {}
+        # event_type -> index key -> index value -> listeners
+        self._indexed_listeners: dict[
+            str, dict[str, dict[str, list[_FilterableJobType[Any]]]]
+        ] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -1356,7 +1368,18 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, indexes in self._indexed_listeners.items():
+            # A listener is indexed under each of its values
+            # but must only be counted once
+            indexed_jobs = {
+                id(filterable_job)
+                for index in indexes.values()
+                for listeners in index.values()
+                for filterable_job in listeners
+            }
+            counts[event_type] = counts.get(event_type, 0) + len(indexed_jobs)
+        return counts
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1423,6 +1446,13 @@ class EventBus:
         else:
             aliased_listeners = EMPTY_LIST
         listeners = listeners + match_all_listeners + aliased_listeners
+        if self._indexed_listeners and event_data is not None:
+            if indexes := self._indexed_listeners.get(event_type):
+                listeners += self._async_indexed_listeners(indexes, event_data)
+            if event_type == EVENT_STATE_CHANGED and (
+                indexes := self._indexed_listeners.get(EVENT_STATE_REPORTED)
+            ):
+                listeners += self._async_indexed_listeners(indexes, event_data)
         if not listeners:
             return
 
@@ -1517,6 +1547,121 @@ class EventBus:
             ),
         )
 
+    @callback
+    def _async_indexed_listeners(
+        self,
+        indexes: dict[str, dict[str, list[_FilterableJobType[Any]]]],
+        event_data: Mapping[str, Any],
+    ) -> list[_FilterableJobType[Any]]:
+        """Return the indexed listeners matching the event data.
+
+        This method must be run in the event loop.
+        """
+        matched: list[_FilterableJobType[Any]] = []
+        for index_key, index in indexes.items():
+            if (value := event_data.get(index_key)) is None:
+                continue
+            try:
+                if listeners := index.get(value):
+                    matched += listeners
+            except TypeError:
+                # The value is not hashable so it cannot match
+                continue
+        return matched
+
+    @callback
+    def async_listen_indexed(
+        self,
+        event_type: str,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        index_key: str,
+        index_values: str | Iterable[str],
+        event_filter: Callable[[_DataT], bool] | None = None,
+        run_immediately: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type that match an index.
+
+        The listener is only called for events where the value of
+        index_key in the event data is one of index_values, for example
+        index_key "entity_id" and index_values ["light.kitchen"].
+
+        Unlike an event_filter, the index is resolved with a dict
+        lookup when the event is fired so the cost of firing an
+        event does not grow with the number of indexed listeners
+        that do not match it.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback, is called for the events matching the index.
+
+        If run_immediately is passed:
+          - callbacks will be run right away instead of using call_soon.
+          - coroutine functions will be scheduled eagerly.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError(
+                f"Indexed listeners are not supported for event {event_type}"
+            )
+        if event_type == EVENT_STATE_REPORTED and not run_immediately:
+            raise HomeAssistantError(
+                f"Run immediately must be set to True for event {event_type}"
+            )
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        if isinstance(index_values, str):
+            index_values = (index_values,)
+        values = tuple(dict.fromkeys(index_values))
+        filterable_job: _FilterableJobType[Any] = (
+            HassJob(listener, f"listen {event_type} {index_key}"),
+            event_filter,
+            run_immediately,
+        )
+        index = self._indexed_listeners.setdefault(event_type, {}).setdefault(
+            index_key, {}
+        )
+        for value in values:
+            index.setdefault(value, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_indexed_listener,
+            event_type,
+            index_key,
+            values,
+            filterable_job,
+        )
+
+    @callback
+    def _async_remove_indexed_listener(
+        self,
+        event_type: str,
+        index_key: str,
+        index_values: tuple[str, ...],
+        filterable_job: _FilterableJobType[Any],
+    ) -> None:
+        """Remove an indexed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            indexes = self._indexed_listeners[event_type]
+            index = indexes[index_key]
+            for value in index_values:
+                listeners = index[value]
+                listeners.remove(filterable_job)
+                if not listeners:
+                    del index[value]
+        except (KeyError, ValueError):
+            # KeyError if the index did not exist
+            # ValueError if listener did not exist within the index
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+        if not index:
+            del indexes[index_key]
+        if not indexes:
+            del self._indexed_listeners[event_type]
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJobType[Any]
@@ -1855,6 +2000,81 @@ class State:
         )
 
 
+class StatesSnapshot:
+    """Immutable snapshot of all states at a version of the state machine.
+
+    The snapshot reads the lazily built views of the state machine
+    until a state is added, replaced or removed. If the snapshot is
+    still referenced at that point, the views it needs are frozen
+    into the snapshot. The views of domains that did not change are
+    shared between snapshots.
+
+    Snapshots must only be read in the event loop.
+    """
+
+    __slots__ = ("version", "_container", "_states", "_domain_states", "__weakref__")
+
+    def __init__(self, version: int, container: States) -> None:
+        """Initialize the snapshot."""
+        self.version = version
+        self._container: States | None = container
+        self._states: tuple[State, ...] = ()
+        self._domain_states: dict[str, tuple[State, ...]] = {}
+
+    def __iter__(self) -> Iterator[State]:
+        """Iterate over all states."""
+        return iter(self.states())
+
+    def __len__(self) -> int:
+        """Return the number of states."""
+        if (container := self._container) is not None:
+            return len(container)
+        return len(self._states)
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return f"<StatesSnapshot version={self.version} states={len(self)}>"
+
+    def freeze(self) -> None:
+        """Copy the views of the container before it changes."""
+        if (container := self._container) is None:
+            return
+        self._states = container.states_view()
+        self._domain_states = {
+            domain: container.domain_view(domain) for domain in container.domains()
+        }
+        self._container = None
+
+    def states(
+        self, domain_filter: str | Iterable[str] | None = None
+    ) -> tuple[State, ...]:
+        """Return the states matching the filter."""
+        if domain_filter is None:
+            if (container := self._container) is not None:
+                return container.states_view()
+            return self._states
+
+        if isinstance(domain_filter, str):
+            return self._domain_view(domain_filter.lower())
+
+        states: tuple[State, ...] = ()
+        for domain in domain_filter:
+            states += self._domain_view(domain.lower())
+        return states
+
+    def _domain_view(self, domain: str) -> tuple[State, ...]:
+        """Return the states of a domain."""
+        if (container := self._container) is not None:
+            return container.domain_view(domain)
+        return self._domain_states.get(domain, ())
+
+    def domains(self) -> tuple[str, ...]:
+        """Return the domains that have states."""
+        if (container := self._container) is not None:
+            return tuple(container.domains())
+        return tuple(self._domain_states)
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
@@ -1866,6 +2086,12 @@ class States(UserDict[str, State]):
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        # The version is bumped on every change. The views are built
+        # lazily and only the views of the changed domain are dropped.
+        self._version = 0
+        self._snapshot: weakref.ref[StatesSnapshot] | None = None
+        self._states_view: tuple[State, ...] | None = None
+        self._domain_views: dict[str, tuple[State, ...]] = {}
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -1873,15 +2099,61 @@ class States(UserDict[str, State]):
 
     def __setitem__(self, key: str, entry: State) -> None:
         """Add an item."""
+        self._async_invalidate_views(entry.domain)
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
+        self._async_invalidate_views(entry.domain)
         del self._domain_index[entry.domain][entry.entity_id]
         super().__delitem__(key)
 
+    def _async_invalidate_views(self, domain: str) -> None:
+        """Detach the snapshot and drop the views of a domain.
+
+        Must be called before the states change.
+        """
+        if (snapshot_ref := self._snapshot) is not None:
+            self._snapshot = None
+            if (snapshot := snapshot_ref()) is not None:
+                snapshot.freeze()
+        self._version += 1
+        self._states_view = None
+        self._domain_views.pop(domain, None)
+
+    def snapshot(self) -> StatesSnapshot:
+        """Return an immutable snapshot of the states.
+
+        The same snapshot is returned until the states change
+        as long as it is referenced.
+        """
+        if self._snapshot is not None and (snapshot := self._snapshot()) is not None:
+            return snapshot
+        snapshot = StatesSnapshot(self._version, self)
+        self._snapshot = weakref.ref(snapshot)
+        return snapshot
+
+    def states_view(self) -> tuple[State, ...]:
+        """Return all states, built only once per change."""
+        if (view := self._states_view) is None:
+            view = self._states_view = tuple(self.data.values())
+        return view
+
+    def domain_view(self, key: str) -> tuple[State, ...]:
+        """Return the states of a domain, built only once per domain change."""
+        if (view := self._domain_views.get(key)) is None:
+            # Avoid polluting _domain_index with non-existing domains
+            if not (domain_index := self._domain_index.get(key)):
+                return ()
+            view = self._domain_views[key] = tuple(domain_index.values())
+        return view
+
+    def domains(self) -> Iterator[str]:
+        """Return the domains that have states."""
+        return (domain for domain, index in self._domain_index.items() if index)
+
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
         # Avoid polluting _domain_index with non-existing domains
@@ -1981,6 +2253,18 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_snapshot(self) -> StatesSnapshot:
+        """Return an immutable snapshot of all states.
+
+        The views of the snapshot are built lazily and only rebuilt for
+        the domains that changed, which makes it cheap for bulk readers
+        that would otherwise copy the states with async_all.
+
+        This method must be run in the event loop.
+        """
+        return self._states.snapshot()
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
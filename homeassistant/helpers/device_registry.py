@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import UserDict
-from collections.abc import Mapping, ValuesView
+from collections.abc import Iterable, Mapping, ValuesView
 from enum import StrEnum
 from functools import lru_cache, partial
 import logging
@@ -45,7 +45,7 @@ DATA_REGISTRY = "device_registry"
 EVENT_DEVICE_REGISTRY_UPDATED = "device_registry_updated"
 STORAGE_KEY = "core.device_registry"
 STORAGE_VERSION_MAJOR = 1
-STORAGE_VERSION_MINOR = 5
+STORAGE_VERSION_MINOR = 6
 
 CLEANUP_DELAY = 10
 
@@ -434,6 +434,8 @@ class DeviceRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
                 # Introduced in 2024.3
                 for device in old_data["devices"]:
                     device["labels"] = device.get("labels", [])
+            # Version 1.6 saves changed devices to a journal next to the data,
+            # the data itself is unchanged
 
         if old_major_version > 1:
             raise NotImplementedError
@@ -519,6 +521,7 @@ class DeviceRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_key="id",
         )
 
     @callback
@@ -945,6 +948,13 @@ class DeviceRegistry(BaseRegistry):
         self.deleted_devices = deleted_devices
         self._device_data = devices.data
 
+    def _entries_to_save(self) -> dict[str, Iterable[Any]]:
+        """Return the entries of the device registry per collection in the store."""
+        return {
+            "devices": self.devices.values(),
+            "deleted_devices": self.deleted_devices.values(),
+        }
+
     @callback
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of device registry to store in a file."""
@@ -67,7 +67,7 @@ EVENT_ENTITY_REGISTRY_UPDATED = "entity_registry_updated"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_VERSION_MAJOR = 1
-STORAGE_VERSION_MINOR = 14
+STORAGE_VERSION_MINOR = 15
 STORAGE_KEY = "core.entity_registry"
 
 CLEANUP_INTERVAL = 3600 * 24
@@ -505,6 +505,9 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
             for entity in data["entities"]:
                 entity["categories"] = {}
 
+        # Version 1.15 saves changed entities to a journal next to the data,
+        # the data itself is unchanged
+
         if old_major_version > 1:
             raise NotImplementedError
         return data
@@ -635,6 +638,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_key="id",
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -1236,6 +1240,13 @@ class EntityRegistry(BaseRegistry):
         self.entities = entities
         self._entities_data = entities.data
 
+    def _entries_to_save(self) -> dict[str, Iterable[Any]]:
+        """Return the entries of the entity registry per collection in the store."""
+        return {
+            "entities": self.entities.values(),
+            "deleted_entities": self.deleted_entities.values(),
+        }
+
     @callback
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of entity registry to store in a file."""
@@ -963,6 +963,7 @@ class TrackTemplateResultInfo:
         self,
         strict: bool = False,
         log_fn: Callable[[int, str], None] | None = None,
+        defer_render: bool = False,
     ) -> None:
         """Activation of template tracking."""
         block_render = False
@@ -993,6 +994,16 @@ class TrackTemplateResultInfo:
                 continue
             template = track_template_.template
             variables = track_template_.variables
+            # Templates that only reference literal entity ids or domains
+            # can be tracked without rendering them until the first refresh
+            if (
+                defer_render
+                and (info := template.async_static_render_info(strict, log_fn))
+                is not None
+            ):
+                self._info[template] = info
+                continue
+
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict, log_fn=log_fn
             )
@@ -1289,6 +1300,7 @@ def async_track_template_result(
     strict: bool = False,
     log_fn: Callable[[int, str], None] | None = None,
     has_super_template: bool = False,
+    defer_render: bool = False,
 ) -> TrackTemplateResultInfo:
     """Add a listener that fires when the result of a template changes.
 
@@ -1320,6 +1332,11 @@ def async_track_template_result(
     has_super_template
         When set to True, the first template will block rendering of other
         templates if it doesn't render as True.
+    defer_render
+        When set to True, templates that only reference literal entity ids or
+        domains are not rendered until the first refresh. Their listeners are
+        set up from the template source instead. Use this when the returned
+        info is refreshed right away.
 
     Returns
     -------
@@ -1327,7 +1344,7 @@ def async_track_template_result(
 
     """
     tracker = TrackTemplateResultInfo(hass, track_templates, action, has_super_template)
-    tracker.async_setup(strict=strict, log_fn=log_fn)
+    tracker.async_setup(strict=strict, log_fn=log_fn, defer_render=defer_render)
     return tracker
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import CoreState, HomeAssistant, callback
@@ -19,6 +20,8 @@ class BaseRegistry(ABC):
 
     hass: HomeAssistant
     _store: Store
+    # collection -> entry id -> entry, as last written to the store
+    _saved_entries: dict[str, dict[str, Any]]
 
     @callback
     def async_schedule_save(self) -> None:
@@ -26,7 +29,48 @@ class BaseRegistry(ABC):
         # Schedule the save past startup to avoid writing
         # the file while the system is starting.
         delay = SAVE_DELAY if self.hass.state is CoreState.running else SAVE_DELAY_LONG
-        self._store.async_delay_save(self._data_to_save, delay)
+        if self._store.journal_key is None or self._entries_to_save() is None:
+            self._store.async_delay_save(self._data_to_save, delay)
+            return
+        self._store.async_delay_save_changes(
+            self._all_data_to_save, self._changes_to_save, delay
+        )
+
+    def _entries_to_save(self) -> dict[str, Iterable[Any]] | None:
+        """Return the entries of the registry per collection in the store.
+
+        Only used when the store has a journal. Entries must have an id and
+        an as_storage_fragment, and be replaced instead of mutated on change.
+        Registries that return None always save all data.
+        """
+        return None
+
+    def _all_data_to_save(self) -> dict[str, Any]:
+        """Return data of registry to store in a file and track what is saved."""
+        self._saved_entries = {
+            collection: {entry.id: entry for entry in entries}
+            for collection, entries in (self._entries_to_save() or {}).items()
+        }
+        return self._data_to_save()
+
+    def _changes_to_save(self) -> list[tuple[str, str, Any]]:
+        """Return the entries that changed since they were saved."""
+        saved_entries = self._saved_entries
+        changes: list[tuple[str, str, Any]] = []
+        for collection, entries in (self._entries_to_save() or {}).items():
+            saved = saved_entries.get(collection, {})
+            current = {entry.id: entry for entry in entries}
+            changes.extend(
+                (collection, entry_id, entry.as_storage_fragment)
+                for entry_id, entry in current.items()
+                if saved.get(entry_id) is not entry
+            )
+            changes.extend(
+                (collection, entry_id, None)
+                for entry_id in saved.keys() - current.keys()
+            )
+            saved_entries[collection] = current
+        return changes
 
     @callback
     @abstractmethod
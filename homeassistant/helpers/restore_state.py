@@ -25,6 +25,7 @@ DATA_RESTORE_STATE = "restore_state"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
+STORAGE_JOURNAL_KEY = "core.restore_state_journal"
 STORAGE_VERSION = 1
 
 # How long between periodically saving the current states to disk
@@ -33,6 +34,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long between rewriting all states and clearing the journal, must be
+# well below STATE_EXPIRATION as only a full dump refreshes last_seen
+STATE_COMPACT_INTERVAL = timedelta(hours=24)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -95,6 +100,14 @@ class StoredState:
         )
 
 
+def _persisted_data(
+    stored_state: StoredState,
+) -> tuple[State, dict[str, Any] | None]:
+    """Return what is compared to find out if a stored state has changed."""
+    extra_data = stored_state.extra_data
+    return (stored_state.state, extra_data.as_dict() if extra_data else None)
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     restore_state = RestoreStateData(hass)
@@ -137,8 +150,18 @@ class RestoreStateData:
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        # States that changed since the last full dump are written to a
+        # separate journal so periodic dumps scale with the number of changes
+        self.journal_store = Store[list[dict[str, Any]]](
+            hass, STORAGE_VERSION, STORAGE_JOURNAL_KEY, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # entity_id -> (state, extra data) as last written to storage
+        self._persisted: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        self._journal: dict[str, StoredState] = {}
+        self._journal_stored = False
+        self._last_compaction: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -170,6 +193,28 @@ class RestoreStateData:
             }
             _LOGGER.debug("Created cache with %s", list(self.last_states))
 
+        try:
+            journal = await self.journal_store.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading last states journal", exc_info=exc)
+            journal = None
+
+        if journal is None:
+            return
+        self._journal_stored = True
+        last_states = self.last_states
+        for item in journal:
+            if not valid_entity_id(entity_id := item["state"]["entity_id"]):
+                continue
+            stored_state = StoredState.from_dict(item)
+            # The journal is only cleared after a full dump has been saved,
+            # skip entries that are older than the full dump
+            if (
+                existing := last_states.get(entity_id)
+            ) is None or existing.last_seen <= stored_state.last_seen:
+                last_states[entity_id] = stored_state
+        _LOGGER.debug("Applied %s journal entries", len(journal))
+
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
         """Get the set of states which should be stored.
@@ -217,15 +262,80 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        stored_states = self.async_get_stored_states()
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [stored_state.as_dict() for stored_state in stored_states]
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        self._last_compaction = dt_util.utcnow()
+        self._persisted = {
+            stored_state.state.entity_id: _persisted_data(stored_state)
+            for stored_state in stored_states
+        }
+        self._journal = {}
+        if not self._journal_stored:
+            return
+        try:
+            await self.journal_store.async_remove()
+        except (HomeAssistantError, OSError) as exc:
+            _LOGGER.error("Error removing last states journal", exc_info=exc)
+        else:
+            self._journal_stored = False
+
+    async def async_dump_journal(self) -> None:
+        """Save the states that changed since they were last saved.
+
+        Falls back to a full dump when the journal has grown to half the
+        size of the stored states or STATE_COMPACT_INTERVAL has passed.
+        """
+        if (
+            self._last_compaction is None
+            or dt_util.utcnow() - self._last_compaction >= STATE_COMPACT_INTERVAL
+        ):
+            await self.async_dump_states()
+            return
+
+        stored_states = self.async_get_stored_states()
+        persisted = self._persisted
+        changed: list[tuple[StoredState, tuple[State, dict[str, Any] | None]]] = []
+        for stored_state in stored_states:
+            state, extra_data = persisted_data = _persisted_data(stored_state)
+            # State objects are replaced whenever the state changes
+            previous = persisted.get(state.entity_id)
+            if (
+                previous is None
+                or previous[0] is not state
+                or previous[1] != extra_data
+            ):
+                changed.append((stored_state, persisted_data))
+
+        if not changed:
+            _LOGGER.debug("No changed states to dump")
+            return
+
+        journal = self._journal
+        for stored_state, _ in changed:
+            journal[stored_state.state.entity_id] = stored_state
+        if len(journal) * 2 > len(stored_states):
+            await self.async_dump_states()
+            return
+
+        _LOGGER.debug("Dumping %s changed states", len(changed))
+        try:
+            await self.journal_store.async_save(
+                [stored_state.as_dict() for stored_state in journal.values()]
+            )
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
+            return
+
+        self._journal_stored = True
+        for stored_state, persisted_data in changed:
+            persisted[stored_state.state.entity_id] = persisted_data
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -234,22 +344,25 @@ class RestoreStateData:
         async def _async_dump_states(*_: Any) -> None:
             await self.async_dump_states()
 
+        async def _async_dump_journal(*_: Any) -> None:
+            await self.async_dump_journal()
+
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
         self.hass.async_create_task(_async_dump_states(), "RestoreStateData dump")
 
-        # Dump states periodically
+        # Dump changed states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_journal,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            await self.async_dump_journal()
 
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
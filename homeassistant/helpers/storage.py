@@ -31,6 +31,7 @@ from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
@@ -52,6 +53,11 @@ STORAGE_MANAGER = "storage_manager"
 
 MANAGER_CLEANUP_DELAY = 60
 
+# Changed records are appended to this file next to the data of a store
+# with a journal until it is time to write all data again
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_MAX_RECORDS = 1000
+
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
 
@@ -252,8 +258,14 @@ class Store(Generic[_T]):
         minor_version: int = 1,
         read_only: bool = False,
         config_dir: str | None = None,
+        journal_key: str | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        When journal_key is set, the data is a dict of lists of records that
+        are identified by their journal_key field, and changed records can
+        be saved with async_delay_save_changes.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -269,12 +281,23 @@ class Store(Generic[_T]):
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass, config_dir)
+        self.journal_key = journal_key
+        # Id of the data written in full by this instance that the journal
+        # belongs to, None until data has been written in full.
+        self._journal_id: str | None = None
+        self._journal_records = 0
+        self._journal_data_func: Callable[[], _T] | None = None
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -316,6 +339,8 @@ class Store(Generic[_T]):
             # If we didn't generate data yet, do it now.
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
+            # All data is written once it has been generated
+            data.pop("changes_func", None)
 
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
@@ -386,6 +411,13 @@ class Store(Generic[_T]):
             if data == {}:
                 return None
 
+            if self.journal_key is not None and (
+                journal_id := data.get("journal_id")
+            ):
+                await self.hass.async_add_executor_job(
+                    self._apply_journal, data["data"], journal_id
+                )
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -462,6 +494,25 @@ class Store(Generic[_T]):
         # We use call_later directly here to avoid a circular import
         self._async_reschedule_delayed_write(next_when)
 
+    @callback
+    def async_delay_save_changes(
+        self,
+        data_func: Callable[[], _T],
+        changes_func: Callable[[], list[tuple[str, str, Any]]],
+        delay: float = 0,
+    ) -> None:
+        """Save changed records with an optional delay.
+
+        changes_func returns (collection, record id, record) tuples for the
+        records that changed since they were last written, with a record of
+        None for removed ones. It is only used once all data has been written
+        by data_func, which is used again every JOURNAL_MAX_RECORDS records.
+        """
+        self._journal_data_func = data_func
+        self.async_delay_save(data_func, delay)
+        if self._data is not None:
+            self._data["changes_func"] = changes_func
+
     @callback
     def _async_reschedule_delayed_write(self, when: float) -> None:
         """Reschedule a delayed write."""
@@ -515,6 +566,18 @@ class Store(Generic[_T]):
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if self._journal_id is not None and self._journal_records:
+            # Leave all data in the main file after a clean stop, so it can be
+            # read without the journal, for example by an older release
+            if self._data is None:
+                self._data = {
+                    "version": self.version,
+                    "minor_version": self.minor_version,
+                    "key": self.key,
+                    "data_func": self._journal_data_func,
+                }
+            else:
+                self._data.pop("changes_func", None)
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -539,6 +602,10 @@ class Store(Generic[_T]):
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal_id is not None and self._journal_records:
+                # Compact the journal into the data on the final write
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -546,9 +613,24 @@ class Store(Generic[_T]):
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        changes_func = data.pop("changes_func", None)
         if "data_func" in data:
+            if (
+                changes_func is not None
+                and self._journal_id is not None
+                and self._journal_records < JOURNAL_MAX_RECORDS
+            ):
+                self._append_journal(changes_func())
+                return
             data["data"] = data.pop("data_func")()
 
+        if self.journal_key is not None:
+            # A journal left behind by an earlier write must not
+            # be applied to this data when it is loaded
+            self._journal_id = None
+            self._journal_records = 0
+            data["journal_id"] = journal_id = ulid_now()
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -558,6 +640,90 @@ class Store(Generic[_T]):
             atomic_writes=self._atomic_writes,
         )
 
+        if self.journal_key is not None:
+            with suppress(FileNotFoundError):
+                os.unlink(self.journal_path)
+            # Changes can only be tracked from data written by async_delay_save_changes
+            if changes_func is not None:
+                self._journal_id = journal_id
+                self._journal_records = 0
+
+    def _append_journal(self, changes: list[tuple[str, str, Any]]) -> None:
+        """Append changed records to the journal."""
+        if not changes:
+            return
+        lines: list[bytes] = []
+        if not self._journal_records:
+            lines.append(json_helper.json_bytes({"journal_id": self._journal_id}))
+        try:
+            lines.extend(
+                json_helper.json_bytes({"c": collection, "k": record_id, "v": record})
+                for collection, record_id, record in changes
+            )
+        except TypeError as error:
+            self._journal_id = None
+            raise json_util.SerializationError(
+                f"Failed to serialize journal records for {self.key}: {error}"
+            ) from error
+        _LOGGER.debug(
+            "Appending %s records for %s to %s",
+            len(changes),
+            self.key,
+            self.journal_path,
+        )
+        try:
+            fd = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o600 if self._private else 0o644,
+            )
+            with open(fd, "wb") as fdesc:
+                fdesc.write(b"\n".join(lines) + b"\n")
+                fdesc.flush()
+                os.fsync(fdesc.fileno())
+        except OSError as error:
+            # Write all data the next time
+            self._journal_id = None
+            raise WriteError(error) from error
+        self._journal_records += len(changes)
+
+    def _apply_journal(self, collections: dict[str, Any], journal_id: str) -> None:
+        """Apply the records of the journal to the loaded data."""
+        try:
+            with open(self.journal_path, "rb") as fdesc:
+                lines = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return
+        try:
+            header = json_util.json_loads(lines[0]) if lines else None
+        except json_util.JSON_DECODE_EXCEPTIONS:
+            header = None
+        if not isinstance(header, dict) or header.get("journal_id") != journal_id:
+            _LOGGER.debug("Ignoring outdated journal for %s", self.key)
+            return
+
+        journal_key = self.journal_key
+        merged: dict[str, dict[str, Any]] = {}
+        for line in lines[1:]:
+            try:
+                record = json_util.json_loads(line)
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                # The last record can be incomplete if writing it was interrupted
+                _LOGGER.warning("Ignoring incomplete journal record for %s", self.key)
+                break
+            collection = record["c"]
+            if (records := merged.get(collection)) is None:
+                records = merged[collection] = {
+                    item[journal_key]: item for item in collections.get(collection, [])
+                }
+            if record["v"] is None:
+                records.pop(record["k"], None)
+            else:
+                records[record["k"]] = record["v"]
+        for collection, records in merged.items():
+            collections[collection] = list(records.values())
+        _LOGGER.debug("Applied %s journal records for %s", len(lines) - 1, self.key)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -570,3 +736,8 @@ class Store(Generic[_T]):
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self.journal_key is not None:
+            self._journal_id = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
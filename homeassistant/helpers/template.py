@@ -26,6 +26,7 @@ from typing import (
     Any,
     Concatenate,
     Literal,
+    NamedTuple,
     NoReturn,
     ParamSpec,
     TypeVar,
@@ -33,7 +34,6 @@ from typing import (
     overload,
 )
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
@@ -160,6 +160,12 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
+# The compiled code of templates is kept in an LRU cache that is shared
+# by all Template instances using the same environment. Unlike a weak
+# cache, the code survives the Template instances that created it, so
+# identical templates are not compiled again after a reload.
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
@@ -720,6 +726,42 @@ class Template:
         render_info._freeze()
         return render_info
 
+    @callback
+    def async_static_render_info(
+        self,
+        strict: bool = False,
+        log_fn: Callable[[int, str], None] | None = None,
+    ) -> RenderInfo | None:
+        """Collect an entity filter from the template source without rendering it.
+
+        Returns None if the template can not be analyzed and has to be
+        rendered to know what it depends on.
+        """
+        assert self.hass and _render_info.get() is None
+
+        if self.is_static:
+            return None
+
+        try:
+            if not self._compiled:
+                self._ensure_compiled(strict=strict, log_fn=log_fn)
+            env: TemplateEnvironment | None = self.hass.data.get(_ENVIRONMENT)
+            if env is None:
+                env = self.hass.data[_ENVIRONMENT] = TemplateEnvironment(self.hass)
+            dependencies = env.template_dependencies(self.template)
+        except (TemplateError, jinja2.TemplateError):
+            return None
+
+        if dependencies is None:
+            return None
+
+        render_info = RenderInfo(self)
+        render_info.entities = dependencies.entities
+        render_info.domains = dependencies.domains
+        # pylint: disable-next=protected-access
+        render_info._freeze()
+        return render_info
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -1166,11 +1208,13 @@ def _state_generator(
     # We do not want to expose this method in the public API though to
     # ensure it does not get misused.
     #
+    # The view of a domain is only rebuilt when a state of the domain
+    # changes, so iterating it does not copy the states on every render.
     container: Iterable[State]
     if domain is None:
         container = states._states.values()  # pylint: disable=protected-access
     else:
-        container = states.async_all(domain)
+        container = states.async_snapshot().states(domain)
     for state in container:
         yield _template_state_no_collect(hass, state)
 
@@ -2635,6 +2679,165 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+# Names that make a template depend on states or the time in ways
+# that can only be known by rendering it
+_RENDER_DEPENDENT_NAMES = {
+    "closest",
+    "distance",
+    "expand",
+    "has_value",
+    "is_state",
+    "is_state_attr",
+    "now",
+    "relative_time",
+    "state_attr",
+    "state_translated",
+    "states",
+    "this",
+    "today_at",
+    "utcnow",
+}
+# Functions, filters and tests that only depend on the state of the
+# entity passed as their first argument
+_STATIC_ENTITY_FUNCTIONS = {
+    "has_value",
+    "is_state",
+    "is_state_attr",
+    "state_attr",
+    "state_translated",
+    "states",
+}
+_STATIC_ENTITY_FILTERS = {"has_value", "state_attr", "state_translated", "states"}
+_STATIC_ENTITY_TESTS = {"has_value", "is_state", "is_state_attr"}
+
+
+class TemplateDependencies(NamedTuple):
+    """Entities and domains a template depends on."""
+
+    entities: frozenset[str]
+    domains: frozenset[str]
+
+
+def _const_str(node: jinja2.nodes.Node | None) -> str | None:
+    """Return the value of a constant string node."""
+    if isinstance(node, jinja2.nodes.Const) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _states_key(node: jinja2.nodes.Node) -> str | None:
+    """Return the attribute or item name of a states lookup."""
+    if isinstance(node, jinja2.nodes.Getattr):
+        return node.attr
+    if isinstance(node, jinja2.nodes.Getitem):
+        return _const_str(node.arg)
+    return None
+
+
+def _is_states_name(node: jinja2.nodes.Node) -> bool:
+    """Return if the node loads the states global."""
+    return isinstance(node, jinja2.nodes.Name) and node.name == "states"
+
+
+def _collect_template_dependencies(
+    node: jinja2.nodes.Node, entities: set[str], domains: set[str]
+) -> bool:
+    """Collect the entities and domains a template node depends on.
+
+    Returns False if the node depends on states or the time in ways
+    that can not be known without rendering the template.
+    """
+    if isinstance(
+        node,
+        (
+            jinja2.nodes.Import,
+            jinja2.nodes.FromImport,
+            jinja2.nodes.Include,
+            jinja2.nodes.Extends,
+        ),
+    ):
+        return False
+
+    if isinstance(node, jinja2.nodes.Name):
+        return node.name not in _RENDER_DEPENDENT_NAMES
+
+    arguments: list[jinja2.nodes.Node] | None = None
+    entity_id: str | None = None
+    if isinstance(node, jinja2.nodes.Call):
+        if (
+            isinstance(node.node, jinja2.nodes.Name)
+            and node.node.name in _STATIC_ENTITY_FUNCTIONS
+        ):
+            if not node.args:
+                return False
+            entity_id = _const_str(node.args[0])
+            arguments = [*node.args[1:], *node.kwargs]
+    elif isinstance(node, (jinja2.nodes.Filter, jinja2.nodes.Test)):
+        if isinstance(node, jinja2.nodes.Filter):
+            static_names = _STATIC_ENTITY_FILTERS
+        else:
+            static_names = _STATIC_ENTITY_TESTS
+        if node.name in static_names:
+            entity_id = _const_str(node.node)
+            arguments = [*node.args, *node.kwargs]
+        elif node.name in _RENDER_DEPENDENT_NAMES:
+            return False
+    elif (key := _states_key(node)) is not None:
+        parent = node.node  # type: ignore[attr-defined]
+        if _is_states_name(parent):
+            # states.sensor or states['sensor.temperature']
+            if valid_entity_id(key):
+                entities.add(key)
+                return True
+            if valid_domain(key):
+                domains.add(key)
+                return True
+            return False
+        if (
+            (domain := _states_key(parent)) is not None
+            and _is_states_name(parent.node)  # type: ignore[attr-defined]
+            and valid_domain(domain)
+        ):
+            # states.sensor.temperature
+            if valid_entity_id(entity_id := f"{domain}.{key}"):
+                entities.add(entity_id)
+                return True
+            return False
+
+    if arguments is not None:
+        if (
+            entity_id is None
+            or not valid_entity_id(entity_id)
+            or node.dyn_args is not None  # type: ignore[attr-defined]
+            or node.dyn_kwargs is not None  # type: ignore[attr-defined]
+        ):
+            return False
+        entities.add(entity_id)
+        children: Iterable[jinja2.nodes.Node] = arguments
+    else:
+        children = node.iter_child_nodes()
+
+    return all(
+        _collect_template_dependencies(child, entities, domains) for child in children
+    )
+
+
+def template_dependencies(
+    node: jinja2.nodes.Template,
+) -> TemplateDependencies | None:
+    """Extract the entities and domains a parsed template depends on.
+
+    Only templates that reference states by literal entity ids or domains,
+    and do not depend on the time, can be analyzed without rendering them.
+    Returns None for all other templates.
+    """
+    entities: set[str] = set()
+    domains: set[str] = set()
+    if not _collect_template_dependencies(node, entities, domains):
+        return None
+    return TemplateDependencies(frozenset(entities), frozenset(domains))
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2648,9 +2851,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | str | None
-        ] = weakref.WeakValueDictionary()
+        self.template_cache: LRU[str | jinja2.nodes.Template, CodeType | str] = LRU(
+            COMPILED_TEMPLATE_CACHE_SIZE
+        )
+        self.template_dependencies_cache: LRU[str, TemplateDependencies | None] = LRU(
+            COMPILED_TEMPLATE_CACHE_SIZE
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2996,5 +3202,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         return cached
 
+    def template_dependencies(self, source: str) -> TemplateDependencies | None:
+        """Return the entities and domains a template source depends on.
+
+        The result of the analysis is cached the same way as the compiled code.
+        """
+        if source in self.template_dependencies_cache:
+            return self.template_dependencies_cache[source]
+        dependencies = self.template_dependencies_cache[source] = template_dependencies(
+            self.parse(source)
+        )
+        return dependencies
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
@@ -5,12 +5,14 @@ from __future__ import annotations
 from abc import abstractmethod
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Generator
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
-from random import randint
 from time import monotonic
 from typing import Any, Generic, Protocol
 import urllib.error
+import weakref
+import zlib
 
 import aiohttp
 import requests
@@ -26,12 +28,20 @@ from homeassistant.exceptions import (
 )
 from homeassistant.util.dt import utcnow
 
-from . import entity, event
+from . import entity
 from .debounce import Debouncer
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+# Scheduled refreshes of the coordinators of an integration share this limit
+# so refreshes that line up do not all hit the network and the event loop at
+# the same time. The limit is per integration so refreshes of one integration
+# that hang do not hold up the polling of other integrations.
+MAX_CONCURRENT_SCHEDULED_REFRESHES = 20
+
+DATA_POLLING_SCHEDULER = "update_coordinator_polling_scheduler"
+
 _DataT = TypeVar("_DataT", default=dict[str, Any])
 _BaseDataUpdateCoordinatorT = TypeVar(
     "_BaseDataUpdateCoordinatorT", bound="BaseDataUpdateCoordinatorProtocol"
@@ -47,6 +57,116 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+@dataclass(slots=True)
+class RefreshStats:
+    """Latency and failure statistics of the refreshes of a coordinator."""
+
+    refreshes: int = 0
+    failures: int = 0
+    last_duration: float | None = None
+    max_duration: float = 0
+    total_duration: float = 0
+
+    @callback
+    def async_record(self, duration: float, success: bool) -> None:
+        """Record a finished refresh."""
+        self.refreshes += 1
+        if not success:
+            self.failures += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self.total_duration += duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary version of the statistics."""
+        return {
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_duration": self.last_duration,
+            "max_duration": self.max_duration,
+            "average_duration": (
+                self.total_duration / self.refreshes if self.refreshes else None
+            ),
+        }
+
+
+class _PollingScheduler:
+    """Shared state for the scheduled refreshes of all coordinators."""
+
+    def __init__(self) -> None:
+        """Initialize the polling scheduler."""
+        self.semaphores: dict[str, asyncio.Semaphore] = {}
+        self.coordinators: weakref.WeakSet[DataUpdateCoordinator[Any]] = (
+            weakref.WeakSet()
+        )
+
+    def semaphore(self, integration: str) -> asyncio.Semaphore:
+        """Return the semaphore limiting the refreshes of an integration."""
+        if (semaphore := self.semaphores.get(integration)) is None:
+            semaphore = self.semaphores[integration] = asyncio.Semaphore(
+                MAX_CONCURRENT_SCHEDULED_REFRESHES
+            )
+        return semaphore
+
+    def offset_occurrence(self, key: str) -> int:
+        """Return the lowest occurrence of a refresh offset key not in use.
+
+        Coordinators with the same logger, config entry and name are told
+        apart by an occurrence number. Only live coordinators hold one, so a
+        reloaded coordinator gets its previous slot back.
+        """
+        in_use = {
+            coordinator._offset_occurrence
+            for coordinator in self.coordinators
+            if coordinator._offset_key == key and not coordinator._shutdown_requested
+        }
+        occurrence = 0
+        while occurrence in in_use:
+            occurrence += 1
+        return occurrence
+
+
+@callback
+def _async_get_polling_scheduler(hass: HomeAssistant) -> _PollingScheduler:
+    """Return the polling scheduler."""
+    scheduler: _PollingScheduler | None = hass.data.get(DATA_POLLING_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_POLLING_SCHEDULER] = _PollingScheduler()
+    return scheduler
+
+
+def _refresh_phase(key: str) -> float:
+    """Return a stable phase to stagger refreshes by, as a fraction of the interval.
+
+    The phase is derived from the key so a coordinator keeps its slot
+    across restarts, while coordinators with the same update interval are
+    spread over the whole interval.
+    """
+    return zlib.crc32(key.encode()) / 2**32
+
+
+@callback
+def async_get_refresh_stats(
+    hass: HomeAssistant, entry_id: str
+) -> list[dict[str, Any]]:
+    """Return the refresh statistics of the coordinators of a config entry."""
+    if (scheduler := hass.data.get(DATA_POLLING_SCHEDULER)) is None:
+        return []
+    return [
+        {
+            "name": coordinator.name,
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            **coordinator.refresh_stats.as_dict(),
+        }
+        for coordinator in scheduler.coordinators
+        if coordinator.config_entry and coordinator.config_entry.entry_id == entry_id
+    ]
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -94,11 +214,24 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # when it was already checked during setup.
         self.data: _DataT = None  # type: ignore[assignment]
 
-        # Pick a random microsecond in range 0.05..0.50 to stagger the refreshes
-        # and avoid a thundering herd.
-        self._microsecond = (
-            randint(event.RANDOM_MICROSECOND_MIN, event.RANDOM_MICROSECOND_MAX) / 10**6
+        self.refresh_stats = RefreshStats()
+        polling_scheduler = _async_get_polling_scheduler(hass)
+        self._refresh_semaphore = polling_scheduler.semaphore(
+            self.config_entry.domain if self.config_entry else logger.name
         )
+        # Pick a stable phase within the update interval to stagger the
+        # refreshes and avoid a thundering herd.
+        self._offset_key = (
+            f"{logger.name}-"
+            f"{self.config_entry.entry_id if self.config_entry else ''}-{name}"
+        )
+        self._offset_occurrence = polling_scheduler.offset_occurrence(
+            self._offset_key
+        )
+        self._refresh_phase = _refresh_phase(
+            f"{self._offset_key}-{self._offset_occurrence}"
+        )
+        polling_scheduler.coordinators.add(self)
 
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
         self._unsub_refresh: CALLBACK_TYPE | None = None
@@ -228,8 +361,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         hass = self.hass
         loop = hass.loop
 
+        # Refresh on the phase of the coordinator within the interval, which is
+        # at most one interval from now.
+        interval = self._update_interval_seconds
+        now = loop.time()
         next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+            now + interval - (now - self._refresh_phase * interval) % interval
         )
         self._unsub_refresh = loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
@@ -255,7 +392,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self._async_refresh(log_failures=True, scheduled=True)
+        async with self._refresh_semaphore:
+            await self._async_refresh(log_failures=True, scheduled=True)
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
@@ -304,9 +442,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._shutdown_requested or scheduled and self.hass.is_stopping:
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
-            start = monotonic()
-
+        start = monotonic()
         auth_failed = False
         previous_update_success = self.last_update_success
         previous_data = self.data
@@ -391,11 +527,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
-            if log_timing:
+            duration = monotonic() - start
+            self.refresh_stats.async_record(duration, self.last_update_success)
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
                     self.name,
-                    monotonic() - start,
+                    duration,
                     self.last_update_success,
                 )
             if not auth_failed and self._listeners and not self.hass.is_stopping:
@@ -66,10 +66,15 @@ _LOGGER = logging.getLogger(__name__)
 #
 # This list can be extended by calling async_register_preload_platform
 #
+# Platforms that are only needed when the user asks for them, like
+# diagnostics and repairs, are left out of this list. The integrations
+# consuming them process them on first use, which registers them for
+# preloading from then on. The import timings returned by
+# async_get_import_timings show which platforms are worth preloading.
+#
 BASE_PRELOAD_PLATFORMS = [
     "config",
     "config_flow",
-    "diagnostics",
     "energy",
     "group",
     "logbook",
@@ -77,7 +82,6 @@ BASE_PRELOAD_PLATFORMS = [
     "intent",
     "media_source",
     "recorder",
-    "repairs",
     "system_health",
     "trigger",
 ]
@@ -101,6 +105,7 @@ DATA_INTEGRATIONS = "integrations"
 DATA_MISSING_PLATFORMS = "missing_platforms"
 DATA_CUSTOM_COMPONENTS = "custom_components"
 DATA_PRELOAD_PLATFORMS = "preload_platforms"
+DATA_IMPORT_TIMINGS = "import_timings"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -241,6 +246,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMINGS] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -617,6 +623,13 @@ async def async_get_mqtt(hass: HomeAssistant) -> dict[str, list[str]]:
     return mqtt
 
 
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, float]:
+    """Return how long importing each component and platform module took."""
+    import_timings: dict[str, float] = hass.data[DATA_IMPORT_TIMINGS]
+    return import_timings.copy()
+
+
 @callback
 def async_register_preload_platform(hass: HomeAssistant, platform_name: str) -> None:
     """Register a platform to be preloaded."""
@@ -746,6 +759,8 @@ class Integration:
 
         platforms_to_preload: list[str] = hass.data[DATA_PRELOAD_PLATFORMS]
         self._platforms_to_preload = platforms_to_preload
+        import_timings: dict[str, float] = hass.data[DATA_IMPORT_TIMINGS]
+        self._import_timings = import_timings
         self._component_future: asyncio.Future[ComponentProtocol] | None = None
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         cache: dict[str, ModuleType | ComponentProtocol] = hass.data[DATA_COMPONENTS]
@@ -1034,6 +1049,7 @@ class Integration:
         """Return the component."""
         cache = self._cache
         domain = self.domain
+        start = time.perf_counter()
         try:
             cache[domain] = cast(
                 ComponentProtocol, importlib.import_module(self.pkg_path)
@@ -1049,6 +1065,8 @@ class Integration:
             )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
 
+        self._import_timings[domain] = time.perf_counter() - start
+
         if preload_platforms:
             for platform_name in self.platforms_exists(self._platforms_to_preload):
                 with suppress(ImportError):
@@ -1231,6 +1249,7 @@ class Integration:
         """
         full_name = f"{self.domain}.{platform_name}"
         cache: dict[str, ModuleType] = self.hass.data[DATA_COMPONENTS]
+        start = time.perf_counter()
         try:
             cache[full_name] = self._import_platform(platform_name)
         except ImportError as ex:
@@ -1254,6 +1273,7 @@ class Integration:
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
 
+        self._import_timings[full_name] = time.perf_counter() - start
         return cache[full_name]
 
     def _import_platform(self, platform_name: str) -> ModuleType:
@@ -7,19 +7,22 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+from itertools import chain
 import json
 import logging
 from timeit import default_timer as timer
 from typing import TypeVar
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -121,6 +124,73 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_with_filtered_listeners(hass):
+    """Fire 100k events with 10k listeners that filter on entity_id."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(10**4):
+        entity_id = f"light.kitchen{idx}"
+
+        @core.callback
+        def event_filter(event_data, entity_id=entity_id):
+            """Filter event."""
+            return event_data["entity_id"] == entity_id
+
+        hass.bus.async_listen(event_name, listener, event_filter=event_filter)
+
+    event_data = {"entity_id": "light.kitchen0"}
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(event_name, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def fire_events_with_indexed_listeners(hass):
+    """Fire 100k events with 10k listeners indexed by entity_id."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(10**4):
+        hass.bus.async_listen_indexed(
+            event_name, listener, "entity_id", f"light.kitchen{idx}"
+        )
+
+    event_data = {"entity_id": "light.kitchen0"}
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(event_name, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -315,6 +385,285 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_state_changed_events(hass):
+    """Replay 100k state changes for 4000 entities into the recorder."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import recorder as recorder_helper
+
+    entity_count = 4000
+    events_to_fire = 10**5
+
+    recorder_helper.async_initialize_recorder(hass)
+    instance = hass.data[recorder.DATA_INSTANCE] = recorder.Recorder(
+        hass,
+        auto_purge=False,
+        auto_repack=False,
+        incremental_purge=False,
+        purge_by_time_window=False,
+        keep_days=1,
+        commit_interval=1,
+        uri="sqlite://",
+        db_max_retries=1,
+        db_retry_wait=0,
+        entity_filter=lambda entity_id: True,
+        exclude_event_types=set(),
+    )
+    instance.async_initialize()
+    instance.async_register()
+    instance.start()
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await instance.async_db_ready
+    await instance.async_recorder_ready.wait()
+
+    old_states = {}
+    events = []
+    for idx in range(events_to_fire):
+        entity_id = f"sensor.power_{idx % entity_count}"
+        new_state = core.State(
+            entity_id, str(idx), {"unit_of_measurement": "W", "device_class": "power"}
+        )
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_states.get(entity_id),
+                    "new_state": new_state,
+                },
+            )
+        )
+        old_states[entity_id] = new_state
+
+    start = timer()
+
+    # Commit in intervals of 2000 events to emulate bursts of
+    # state changes arriving inside the commit interval
+    for idx, event in enumerate(events, 1):
+        instance.queue_task(event)
+        if idx % 2000 == 0:
+            instance.queue_task(recorder.tasks.CommitTask())
+    await instance.async_block_till_done()
+
+    runtime = timer() - start
+    print(f"Recorded {events_to_fire / runtime:.0f} events/s")
+    return runtime
+
+
+@benchmark
+async def mqtt_wildcard_subscriptions(hass):
+    """Match 100k messages against 3000 wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    device_count = 1000
+    messages_to_match = 10**5
+    job = core.HassJob(lambda msg: None)
+
+    # The wildcard subscriptions of a zigbee2mqtt and Tasmota setup with
+    # MQTT discovery, device triggers and entities with JSON attributes
+    subscription_topics = [
+        "homeassistant/+/+/config",
+        "homeassistant/+/+/+/config",
+        "tasmota/discovery/+/config",
+        "tasmota/discovery/+/sensors",
+    ]
+    for idx in range(device_count):
+        subscription_topics.extend(
+            (
+                f"zigbee2mqtt/device_{idx}/+",
+                f"zigbee2mqtt/device_{idx}/action/+",
+                f"tele/tasmota_{idx}/#",
+            )
+        )
+    trie = SubscriptionTrie()
+    for topic in subscription_topics:
+        trie.add(Subscription(topic, job))
+
+    # Tens of thousands of distinct topics that devices publish on
+    topics = []
+    for idx in range(device_count):
+        topics.extend(
+            (
+                f"zigbee2mqtt/device_{idx}",
+                f"zigbee2mqtt/device_{idx}/availability",
+                f"zigbee2mqtt/device_{idx}/action",
+                f"zigbee2mqtt/device_{idx}/action/single",
+                f"zigbee2mqtt/device_{idx}/set/brightness",
+                f"homeassistant/sensor/0x00158d000{idx:07x}/linkquality/config",
+                f"homeassistant/light/0x00158d000{idx:07x}/light/config",
+                f"tele/tasmota_{idx}/STATE",
+                f"tele/tasmota_{idx}/SENSOR",
+                f"stat/tasmota_{idx}/RESULT",
+                f"tasmota/discovery/{idx:012X}/config",
+                f"tasmota/discovery/{idx:012X}/sensors",
+            )
+        )
+    size = len(topics)
+
+    start = timer()
+
+    for idx in range(messages_to_match):
+        trie.matches(topics[idx % size])
+
+    return timer() - start
+
+
+@benchmark
+async def websocket_compression(hass):
+    """Compare bytes on the wire and CPU cost of deflating websocket messages."""
+    # pylint: disable-next=import-outside-toplevel
+    import zlib
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.json import json_bytes
+
+    entity_count = 5000
+    states = [
+        core.State(
+            f"sensor.power_{idx}",
+            str(idx),
+            {
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "state_class": "measurement",
+                "friendly_name": f"Power {idx}",
+            },
+        )
+        for idx in range(entity_count)
+    ]
+    # The initial subscribe_entities event followed by a diff per entity
+    messages = [
+        b"".join(
+            (
+                b'{"id":1,"type":"event","event":{"a":{',
+                b",".join(state.as_compressed_state_json for state in states),
+                b"}}}",
+            )
+        )
+    ]
+    messages.extend(
+        json_bytes(
+            {
+                "id": 1,
+                "type": "event",
+                "event": {"c": {state.entity_id: {"+": {"s": "1", "lc": 1.0}}}},
+            }
+        )
+        for state in states
+    )
+    uncompressed = sum(len(message) for message in messages)
+    print(f"uncompressed: {uncompressed} bytes")
+
+    start = timer()
+    for level in (zlib.Z_BEST_SPEED, 6, zlib.Z_BEST_COMPRESSION):
+        # permessage-deflate with context takeover as negotiated by browsers
+        compressobj = zlib.compressobj(level=level, wbits=-zlib.MAX_WBITS)
+        level_start = timer()
+        compressed = sum(
+            len(compressobj.compress(message) + compressobj.flush(zlib.Z_SYNC_FLUSH))
+            for message in messages
+        )
+        print(
+            f"level {level}: {compressed} bytes "
+            f"({compressed / uncompressed:.1%}) in {timer() - level_start:.3f}s"
+        )
+    return timer() - start
+
+
+@benchmark
+async def resolve_integrations_startup_plan(hass):
+    """Resolve the dependency tree of default_config with and without a plan."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import loader
+
+    hass.data[loader.DATA_CUSTOM_COMPONENTS] = {}
+
+    async def _resolve(planned):
+        # Reset the manifest cache like a fresh start
+        loader.async_setup(hass)
+        resolved = {}
+        rounds = 0
+        to_get = {"default_config", *planned}
+        start = timer()
+        while to_get:
+            rounds += 1
+            integrations = await loader.async_get_integrations(hass, to_get)
+            resolved.update(integrations)
+            to_get = {
+                dep
+                for integration in integrations.values()
+                if isinstance(integration, loader.Integration)
+                for dep in chain(
+                    integration.dependencies, integration.after_dependencies
+                )
+            } - resolved.keys()
+        return timer() - start, rounds, resolved.keys()
+
+    cold, cold_rounds, planned = await _resolve(())
+    warm, warm_rounds, _ = await _resolve(planned)
+    print(f"{len(planned)} manifests")
+    print(f"without plan: {cold_rounds} rounds in {cold:.3f}s")
+    print(f"with plan: {warm_rounds} rounds in {warm:.3f}s")
+    return cold + warm
+
+
+@benchmark
+async def statistics_sensor_updates(hass):
+    """Measure the cost of a statistics sensor update for growing buffers."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.statistics.sensor import StatisticsSensor
+
+    updates = 10000
+    start = timer()
+    for characteristic in (
+        "mean",
+        "standard_deviation",
+        "median",
+        "value_max",
+        "average_linear",
+    ):
+        for buffer_size in (100, 1000, 10000):
+            sensor = StatisticsSensor(
+                "sensor.power",
+                "power",
+                None,
+                characteristic,
+                buffer_size,
+                None,
+                False,
+                2,
+                50,
+            )
+            last_updated = dt_util.utcnow()
+            states = [
+                core.State(
+                    "sensor.power",
+                    str(1000 + idx % 97),
+                    last_updated=last_updated + timedelta(seconds=idx),
+                )
+                for idx in range(buffer_size + updates)
+            ]
+            # pylint: disable-next=protected-access
+            add_state, update_value = sensor._add_state_to_queue, sensor._update_value
+            for state in states[:buffer_size]:
+                add_state(state)
+
+            characteristic_start = timer()
+            for state in states[buffer_size:]:
+                add_state(state)
+                update_value()
+            per_update = (timer() - characteristic_start) / updates
+            print(
+                f"{characteristic} with {buffer_size} samples: "
+                f"{per_update * 10**6:.2f}us per update"
+            )
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -1365,6 +1365,7 @@ def mock_storage(
         _LOGGER.debug("Writing data to %s: %s", store.key, data_to_write)
         raise_contains_mocks(data_to_write)
 
+        data_to_write.pop("changes_func", None)
         if "data_func" in data_to_write:
             data_to_write["data"] = data_to_write.pop("data_func")()
 
@@ -1,14 +1,19 @@
 """Test the Diagnostics integration."""
 
+from datetime import timedelta
 from http import HTTPStatus
-from unittest.mock import AsyncMock, Mock
+import logging
+from unittest.mock import ANY, AsyncMock, Mock
 
 import pytest
 
+from homeassistant.components.diagnostics.const import DOMAIN
 from homeassistant.components.websocket_api.const import TYPE_RESULT
+from homeassistant.config_entries import current_entry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import async_get
 from homeassistant.helpers.system_info import async_get_system_info
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.setup import async_setup_component
 
 from . import _get_diagnostics_for_config_entry, _get_diagnostics_for_device
@@ -79,6 +84,20 @@ async def test_websocket(
     }
 
 
+async def test_platforms_processed_on_first_use(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test diagnostics platforms are only processed when first requested."""
+    assert hass.data[DOMAIN].platforms == {}
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "diagnostics/list"})
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    assert "fake_integration" in hass.data[DOMAIN].platforms
+
+
 async def test_download_diagnostics(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
@@ -162,3 +181,37 @@ async def test_failure_scenarios(
         f"/api/diagnostics/config_entry/{config_entry.entry_id}/device/fake_id"
     )
     assert response.status == HTTPStatus.NOT_FOUND
+
+
+async def test_download_diagnostics_includes_coordinators(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test download diagnostics includes the refresh stats of coordinators."""
+    config_entry = MockConfigEntry(domain="fake_integration")
+    config_entry.add_to_hass(hass)
+    current_entry.set(config_entry)
+    coordinator = DataUpdateCoordinator(
+        hass,
+        logging.getLogger(__name__),
+        name="fake",
+        update_method=AsyncMock(return_value={}),
+        update_interval=timedelta(seconds=30),
+    )
+    current_entry.set(None)
+    await coordinator.async_refresh()
+
+    diagnostics = await _get_diagnostics_for_config_entry(
+        hass, hass_client, config_entry
+    )
+    assert diagnostics["data_update_coordinators"] == [
+        {
+            "name": "fake",
+            "update_interval": 30.0,
+            "refreshes": 1,
+            "failures": 0,
+            "last_duration": ANY,
+            "max_duration": ANY,
+            "average_duration": ANY,
+        }
+    ]
+    assert diagnostics["data"] == {"config_entry": "info"}
@@ -524,6 +524,215 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends historical states in chunks."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    sensor_one_first_updated = hass.states.get("sensor.one").last_updated
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    sensor_one_second_updated = hass.states.get("sensor.one").last_updated
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    sensor_one_third_updated = hass.states.get("sensor.one").last_updated
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.two", "off", attributes={"any": "attr"})
+    sensor_two_last_updated = hass.states.get("sensor.two").last_updated
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "HISTORY_STREAM_CHUNK_SIZE", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "start_time": now.isoformat(),
+                "end_time": end_time.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+        assert response["type"] == "result"
+
+        response = await client.receive_json()
+        assert response == {
+            "event": {
+                "end_time": sensor_one_second_updated.timestamp(),
+                "start_time": now.timestamp(),
+                "states": {
+                    "sensor.one": [
+                        {"lu": sensor_one_first_updated.timestamp(), "s": "on"},
+                        {"lu": sensor_one_second_updated.timestamp(), "s": "off"},
+                    ],
+                },
+            },
+            "id": 1,
+            "type": "event",
+        }
+
+        response = await client.receive_json()
+        assert response == {
+            "event": {
+                "end_time": sensor_two_last_updated.timestamp(),
+                "start_time": now.timestamp(),
+                "states": {
+                    "sensor.one": [
+                        {"lu": sensor_one_third_updated.timestamp(), "s": "on"}
+                    ],
+                    "sensor.two": [
+                        {"lu": sensor_two_last_updated.timestamp(), "s": "off"}
+                    ],
+                },
+            },
+            "id": 1,
+            "type": "event",
+        }
+
+
+async def test_history_stream_chunked_empty(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test chunked history stream sends an empty response without states."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "include_start_time_state": True,
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": end_time.timestamp(),
+            "start_time": now.timestamp(),
+            "states": {},
+        },
+        "id": 1,
+        "type": "event",
+    }
+
+
+async def test_history_during_period_buckets(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period and history/stream downsampled to buckets."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    start_time = dt_util.utcnow()
+    end_time = start_time + timedelta(minutes=40)
+    for minute, value in ((1, "3"), (2, "9"), (3, "1"), (4, "4"), (21, "7")):
+        with freeze_time(start_time + timedelta(minutes=minute)):
+            hass.states.async_set("sensor.power", value)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    def _timestamp(minute: int) -> float:
+        return (start_time + timedelta(minutes=minute)).timestamp()
+
+    expected_states = [
+        {"lu": _timestamp(1), "s": "3"},
+        {"lu": _timestamp(2), "s": "9"},
+        {"lu": _timestamp(3), "s": "1"},
+        {"lu": _timestamp(4), "s": "4"},
+        {"lu": _timestamp(21), "s": "7"},
+    ]
+    # The first state is always kept and the second bucket
+    # only holds its min and max
+    expected_downsampled_states = [
+        expected_states[0],
+        expected_states[1],
+        expected_states[2],
+        expected_states[4],
+    ]
+
+    client = await hass_ws_client()
+    with freeze_time(end_time + timedelta(minutes=1)):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": start_time.isoformat(),
+                "end_time": end_time.isoformat(),
+                "entity_ids": ["sensor.power"],
+                "include_start_time_state": False,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+                "buckets": 2,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] == {"sensor.power": expected_downsampled_states}
+
+        for msg_id, chunked in ((2, False), (3, True)):
+            await client.send_json(
+                {
+                    "id": msg_id,
+                    "type": "history/stream",
+                    "start_time": start_time.isoformat(),
+                    "end_time": end_time.isoformat(),
+                    "entity_ids": ["sensor.power"],
+                    "include_start_time_state": False,
+                    "significant_changes_only": False,
+                    "no_attributes": True,
+                    "minimal_response": True,
+                    "chunked": chunked,
+                    "buckets": 2,
+                }
+            )
+            response = await client.receive_json()
+            assert response["success"]
+            response = await client.receive_json()
+            assert response["event"]["states"] == {
+                "sensor.power": expected_downsampled_states
+            }
+
+        await client.send_json(
+            {
+                "id": 4,
+                "type": "history/history_during_period",
+                "start_time": start_time.isoformat(),
+                "end_time": end_time.isoformat(),
+                "entity_ids": ["sensor.power"],
+                "include_start_time_state": False,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] == {"sensor.power": expected_states}
+
+
 async def test_history_stream_significant_domain_historical_only(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -397,6 +397,47 @@ async def test_if_fires_on_sample_zha_event(hass: HomeAssistant, calls) -> None:
     assert len(calls) == 1
 
 
+async def test_if_fires_on_indexed_event_data(hass: HomeAssistant, calls) -> None:
+    """Test triggers with a string in the event data are indexed by it."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "event",
+                        "event_type": "test_event",
+                        "event_data": {"device_id": device_id, "type": "press"},
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"device_id": device_id},
+                    },
+                }
+                for device_id in ("abc", "def")
+            ]
+        },
+    )
+    assert hass.bus.async_listeners()["test_event"] == 2
+    assert "test_event" not in hass.bus._listeners
+
+    hass.bus.async_fire("test_event", {"device_id": "abc", "type": "release"})
+    hass.bus.async_fire("test_event", {"device_id": "ghi", "type": "press"})
+    hass.bus.async_fire("test_event", {"device_id": ["abc"], "type": "press"})
+    hass.bus.async_fire("test_event", {"device_id": "def", "type": "press"})
+    await hass.async_block_till_done()
+    assert [call.data["device_id"] for call in calls] == ["def"]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert "test_event" not in hass.bus.async_listeners()
+
+
 async def test_if_not_fires_if_event_data_not_matches(
     hass: HomeAssistant, calls
 ) -> None:
@@ -3,12 +3,14 @@
 from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
+from pathlib import Path
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
 
 from homeassistant.components import influxdb
 from homeassistant.components.influxdb.const import DEFAULT_BUCKET
+from homeassistant.components.influxdb.line_protocol import point_to_line
 from homeassistant.const import PERCENTAGE, STATE_OFF, STATE_ON, STATE_STANDBY
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.setup import async_setup_component
@@ -49,6 +51,14 @@ def mock_batch_timeout(hass, monkeypatch):
     )
 
 
+@pytest.fixture(name="spool_dir", autouse=True)
+def mock_spool_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the spool of each test in a temporary directory."""
+    spool_dir = tmp_path / "spool"
+    monkeypatch.setattr(f"{INFLUX_PATH}.SPOOL_DIR", str(spool_dir))
+    return spool_dir
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture(request):
     """Patch the InfluxDBClient object with mock for version under test."""
@@ -89,6 +99,17 @@ def _get_write_api_mock_v2(mock_influx_client):
     return mock_influx_client.return_value.write_api.return_value.write
 
 
+def _get_written_lines_v1(write_api):
+    """Return the line protocol written with the V1 write api mock."""
+    assert write_api.call_args.kwargs["protocol"] == "line"
+    return write_api.call_args.args[0]
+
+
+def _get_written_lines_v2(write_api):
+    """Return the line protocol written with the V2 write api mock."""
+    return write_api.call_args.kwargs["record"]
+
+
 @pytest.mark.parametrize(
     ("mock_client", "config_ext", "get_write_api"),
     [
@@ -1688,3 +1709,131 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_written_lines"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            _get_written_lines_v1,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            _get_written_lines_v2,
+        ),
+    ],
+    indirect=["mock_client"],
+)
+async def test_event_listener_spools_during_outage(
+    hass: HomeAssistant,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_written_lines,
+    spool_dir: Path,
+) -> None:
+    """Test events are spooled while influx is unavailable and written in order."""
+    await _setup(hass, mock_client, config_ext, get_write_api)
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = OSError("foo")
+
+    with patch.object(influxdb.time, "sleep") as mock_sleep:
+        for state in ("1", "2"):
+            hass.states.async_set("fake.entity_id", state)
+            await hass.async_block_till_done()
+            await async_wait_for_queue_to_process(hass)
+        assert not mock_sleep.called
+    # The second event is queued up behind the first one in the spool
+    assert write_api.call_count == 2
+    assert len(list(spool_dir.iterdir())) == 2
+
+    write_api.side_effect = None
+    hass.states.async_set("fake.entity_id", "3")
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    assert write_api.call_count == 3
+    lines = get_written_lines(write_api)
+    assert [line.rsplit(" ", 1)[0] for line in lines] == [
+        f"fake.entity_id,domain=fake,entity_id=entity_id value={value}"
+        for value in (1.0, 2.0, 3.0)
+    ]
+    assert not list(spool_dir.iterdir())
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api"),
+    [(influxdb.API_VERSION_2, BASE_V2_CONFIG, _get_write_api_mock_v2)],
+    indirect=["mock_client"],
+)
+async def test_event_listener_v2_spools_server_errors(
+    hass: HomeAssistant,
+    mock_client,
+    config_ext,
+    get_write_api,
+    spool_dir: Path,
+) -> None:
+    """Test V2 writes are synchronous so server errors are spooled."""
+    await _setup(hass, mock_client, config_ext, get_write_api)
+    assert mock_client.return_value.write_api.call_args_list == [
+        call(write_options=influxdb.SYNCHRONOUS)
+    ]
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = influxdb.ApiException(
+        status=HTTPStatus.SERVICE_UNAVAILABLE, http_resp=MagicMock()
+    )
+
+    with patch.object(influxdb.time, "sleep"):
+        hass.states.async_set("fake.entity_id", "1")
+        await hass.async_block_till_done()
+        await async_wait_for_queue_to_process(hass)
+
+    assert write_api.call_count == 1
+    assert len(list(spool_dir.iterdir())) == 1
+
+
+@pytest.mark.parametrize(
+    ("point", "precision", "line"),
+    [
+        (
+            {
+                "measurement": "fake.entity_id",
+                "tags": {"entity_id": "entity_id", "domain": "fake"},
+                "time": datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC),
+                "fields": {"value": 1.5, "state": "on"},
+            },
+            None,
+            'fake.entity_id,domain=fake,entity_id=entity_id value=1.5,state="on"'
+            " 1704067200000000000",
+        ),
+        (
+            {
+                "measurement": "°C, inside",
+                "tags": {"friendly name": "a=b", "empty": "", "missing": None},
+                "time": datetime.datetime(2024, 1, 1, 0, 0, 1, tzinfo=datetime.UTC),
+                "fields": {"count": 2, "on": True, "text": 'say "hi"\\', "x": None},
+            },
+            "s",
+            "°C\\,\\ inside,friendly\\ name=a\\=b"
+            ' count=2i,on=true,text="say \\"hi\\"\\\\" 1704067201',
+        ),
+        (
+            {
+                "measurement": "fake.entity_id",
+                "tags": {},
+                "time": datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC),
+                "fields": {},
+            },
+            "ms",
+            None,
+        ),
+    ],
+)
+def test_point_to_line(point, precision, line) -> None:
+    """Test points are encoded as line protocol."""
+    assert point_to_line(point, precision) == line
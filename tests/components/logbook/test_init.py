@@ -2957,6 +2957,59 @@ async def test_get_events_with_context_state(
     assert "context_event_type" not in results[3]
 
 
+async def test_get_events_with_context_origin_index(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events for entities uses the context origin index."""
+    before_setup = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    after_setup = dt_util.utcnow()
+
+    hass.states.async_set("binary_sensor.is_light", STATE_ON)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.states.async_set("binary_sensor.is_light", STATE_OFF, context=context)
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    logbook_config = hass.data[logbook.DOMAIN]
+    assert not logbook_config.context_origins.covers(before_setup.timestamp())
+    assert logbook_config.context_origins.covers(after_setup.timestamp())
+
+    client = await hass_ws_client()
+    results = []
+    for msg_id, start_time in enumerate((before_setup, after_setup), 1):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "logbook/get_events",
+                "start_time": start_time.isoformat(),
+                "entity_ids": ["light.kitchen"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        results.append(response["result"])
+
+    assert results[0] == results[1]
+    assert results[1][1]["entity_id"] == "light.kitchen"
+    assert results[1][1]["state"] == "on"
+    assert results[1][1]["context_entity_id"] == "binary_sensor.is_light"
+    assert results[1][1]["context_state"] == "off"
+    assert results[1][1]["context_user_id"] == "b400facee45711eaa9308bfd3d19e474"
+
+
 async def test_logbook_with_empty_config(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -1,8 +1,12 @@
 """The tests for the logbook component models."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
-from homeassistant.components.logbook.models import LazyEventPartialState
+from homeassistant.components.logbook.models import (
+    ContextOriginIndex,
+    LazyEventPartialState,
+)
+from homeassistant.core import Context, Event
 
 
 def test_lazy_event_partial_state_context():
@@ -25,3 +29,28 @@ def test_lazy_event_partial_state_context():
     assert state.event_type == "event_type"
     assert state.entity_id == "entity_id"
     assert state.state == "state"
+
+
+def test_context_origin_index():
+    """Test the context origin index remembers recently used contexts."""
+    index = ContextOriginIndex(100.0)
+    assert not index.covers(100.0)
+    assert index.covers(100.5)
+
+    context = Context()
+    origin = Event("call_service", context=context, time_fired_timestamp=101.0)
+    index.async_add(Event("state_changed", context=context, time_fired_timestamp=102.0))
+    assert index.get(context.id) is origin
+
+    with patch(
+        "homeassistant.components.logbook.models.CONTEXT_ORIGINS_GENERATION_SIZE", 2
+    ):
+        index.async_add(Event("other", time_fired_timestamp=103.0))
+        # The first generation is full, nothing was dropped yet
+        assert index.covers(100.5)
+        index.async_add(Event("other", context=context, time_fired_timestamp=104.0))
+        index.async_add(Event("other", time_fired_timestamp=105.0))
+        # The first generation was dropped, the context was used again since
+        assert not index.covers(103.0)
+        assert index.covers(103.5)
+        assert index.get(context.id) is origin
@@ -40,6 +40,14 @@ async def test_entry_diagnostics(
         "devices": [],
         "mqtt_config": default_config,
         "mqtt_debug_info": {"entities": [], "triggers": []},
+        "message_statistics": {
+            "received": 0,
+            "received_per_second": 0,
+            "dispatched": 0,
+            "dispatched_per_second": 0,
+            "batches": 0,
+            "pending": 0,
+        },
     }
 
     # Discover a device with an entity and a trigger
@@ -125,6 +133,14 @@ async def test_entry_diagnostics(
         "devices": [expected_device],
         "mqtt_config": default_config,
         "mqtt_debug_info": expected_debug_info,
+        "message_statistics": {
+            "received": 2,
+            "received_per_second": ANY,
+            "dispatched": 2,
+            "dispatched_per_second": ANY,
+            "batches": 0,
+            "pending": 0,
+        },
     }
 
     assert await get_diagnostics_for_device(
@@ -253,6 +269,7 @@ async def test_redact_diagnostics(
         "devices": [expected_device],
         "mqtt_config": expected_config,
         "mqtt_debug_info": expected_debug_info,
+        "message_statistics": ANY,
     }
 
     assert await get_diagnostics_for_device(
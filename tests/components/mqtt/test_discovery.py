@@ -26,6 +26,7 @@ from homeassistant.const import (
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.setup import async_setup_component
 
@@ -1783,3 +1784,44 @@ async def test_update_with_bad_config_not_breaks_discovery(
 
     state = hass.states.get("sensor.sbfspot_12345")
     assert state and state.state == "new_value"
+
+
+async def test_discovery_batches_entities_per_platform(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test entities discovered together are added with one call per platform."""
+    original_add_entities = EntityPlatform._async_schedule_add_entities_for_entry
+    with patch.object(
+        EntityPlatform,
+        "_async_schedule_add_entities_for_entry",
+        autospec=True,
+        side_effect=original_add_entities,
+    ) as mock_add_entities:
+        await mqtt_mock_entry()
+        mock_add_entities.reset_mock()
+        for idx in range(5):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/sensor/bla{idx}/config",
+                json.dumps({"name": f"Beer {idx}", "state_topic": f"test/{idx}"}),
+            )
+        async_fire_mqtt_message(
+            hass,
+            "homeassistant/sensor/bla_invalid/config",
+            json.dumps({"name": "Invalid", "state_topic": "test", "qos": "x"}),
+        )
+        await hass.async_block_till_done()
+
+    added = [
+        entity
+        for mock_call in mock_add_entities.mock_calls
+        for entity in mock_call.args[1]
+    ]
+    assert len(mock_add_entities.mock_calls) == 1
+    assert len(added) == 5
+    for idx in range(5):
+        assert hass.states.get(f"sensor.beer_{idx}") is not None
+    assert hass.states.get("sensor.invalid") is None
+    assert ("sensor", "bla_invalid") not in hass.data[
+        "mqtt"
+    ].discovery_already_discovered
@@ -9,12 +9,18 @@ from typing import Any, TypedDict
 from unittest.mock import ANY, MagicMock, call, mock_open, patch
 
 from freezegun.api import FrozenDateTimeFactory
+from paho.mqtt.client import MQTTMessage
 import pytest
 import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.client import (
+    EnsureJobAfterCooldown,
+    MessageRateCounter,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import (
     MessageCallbackType,
@@ -34,7 +40,7 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 import homeassistant.core as ha
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.core import CoreState, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr, entity_registry as er, template
 from homeassistant.helpers.entity import Entity
@@ -973,6 +979,94 @@ async def test_subscribe_topic(
         unsub()
 
 
+async def test_receive_messages_in_batches(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test messages from the paho thread are handled in batches."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/1", record_calls)
+    mqtt_client = hass.data["mqtt"].client
+
+    def _receive_messages(count: int) -> None:
+        for idx in range(count):
+            msg = MQTTMessage(topic=f"test-topic/{idx}".encode())
+            msg.payload = b"test-payload"
+            mqtt_client._mqtt_on_message(None, None, msg)
+
+    with patch("homeassistant.components.mqtt.client.MAX_MESSAGES_PER_BATCH", 2):
+        # Queue all messages before the loop gets to handle them
+        _receive_messages(5)
+        await hass.async_block_till_done()
+
+    assert [msg.topic for msg in calls] == [
+        "test-topic/0",
+        "test-topic/1",
+        "test-topic/1",
+        "test-topic/2",
+        "test-topic/3",
+        "test-topic/4",
+    ]
+    statistics = mqtt_client.async_message_statistics()
+    assert statistics["received"] == 5
+    assert statistics["dispatched"] == 6
+    # The loop was only woken up once for all messages
+    assert statistics["batches"] == 3
+    assert statistics["pending"] == 0
+
+    await hass.async_add_executor_job(_receive_messages, 1)
+    await hass.async_block_till_done()
+    assert len(calls) == 7
+    assert mqtt_client.async_message_statistics()["batches"] == 4
+
+
+async def test_receive_message_while_handling_batch(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+) -> None:
+    """Test a message queued while a batch is handled is not left pending."""
+    await mqtt_mock_entry()
+    mqtt_client = hass.data["mqtt"].client
+
+    def _receive_message(topic: str) -> None:
+        msg = MQTTMessage(topic=topic.encode())
+        msg.payload = b"test-payload"
+        mqtt_client._mqtt_on_message(None, None, msg)
+
+    @callback
+    def _record_and_receive(msg: ReceiveMessage) -> None:
+        calls.append(msg)
+        if msg.topic == "test-topic/first":
+            _receive_message("test-topic/second")
+
+    await mqtt.async_subscribe(hass, "test-topic/#", _record_and_receive)
+    _receive_message("test-topic/first")
+    await hass.async_block_till_done()
+
+    assert [msg.topic for msg in calls] == ["test-topic/first", "test-topic/second"]
+    assert mqtt_client.async_message_statistics()["pending"] == 0
+
+
+def test_message_rate_counter() -> None:
+    """Test counting messages per second."""
+    counter = MessageRateCounter()
+    counter.add(100)
+    counter.add(100, 2)
+    assert counter.per_second(100) == 0
+    assert counter.per_second(101) == 3
+    counter.add(101)
+    assert counter.per_second(101) == 3
+    assert counter.per_second(102) == 1
+    assert counter.per_second(103) == 0
+    counter.add(105)
+    assert counter.per_second(105) == 0
+    assert counter.total == 5
+
+
 async def test_subscribe_topic_not_initialize(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -1302,6 +1396,68 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert calls[0].payload == "test-payload"
 
 
+def test_subscription_trie() -> None:
+    """Test matching topics with the subscription trie."""
+    trie = SubscriptionTrie()
+    job = HassJob(lambda msg: None)
+    subscriptions = {
+        topic: Subscription(topic, job)
+        for topic in (
+            "#",
+            "home/+/temperature",
+            "home/#",
+            "home/+/+",
+            "home/kitchen/#",
+            "$SYS/#",
+            "+/kitchen",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+
+    def matching_topics(topic: str) -> set[str]:
+        return {subscription.topic for subscription in trie.matches(topic)}
+
+    assert matching_topics("home/kitchen/temperature") == {
+        "#",
+        "home/+/temperature",
+        "home/#",
+        "home/+/+",
+        "home/kitchen/#",
+    }
+    assert matching_topics("home/kitchen") == {
+        "#",
+        "home/#",
+        "home/kitchen/#",
+        "+/kitchen",
+    }
+    assert matching_topics("home") == {"#", "home/#"}
+    assert matching_topics("garden/kitchen") == {"#", "+/kitchen"}
+    assert matching_topics("$SYS/broker/uptime") == {"$SYS/#"}
+    assert matching_topics("$SYS/kitchen") == {"$SYS/#"}
+    assert "home/+/+" in trie
+    assert "home/+" not in trie
+    assert set(trie) == set(subscriptions.values())
+
+    trie.remove(subscriptions["home/+/+"])
+    trie.remove(subscriptions["#"])
+    assert "home/+/+" not in trie
+    assert "home/+/temperature" in trie
+    assert matching_topics("home/kitchen/temperature") == {
+        "home/+/temperature",
+        "home/#",
+        "home/kitchen/#",
+    }
+    with pytest.raises(ValueError):
+        trie.remove(subscriptions["home/+/+"])
+
+    for topic in ("home/+/temperature", "home/#", "home/kitchen/#", "$SYS/#"):
+        trie.remove(subscriptions[topic])
+    trie.remove(subscriptions["+/kitchen"])
+    assert not trie._root.children
+    assert trie.matches("home/kitchen") == []
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -3,11 +3,13 @@
 from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
+import re
 from typing import Any
 from unittest import mock
 
 from freezegun import freeze_time
 import prometheus_client
+from prometheus_client.openmetrics import exposition as openmetrics_exposition
 import pytest
 
 from homeassistant.components import (
@@ -674,6 +676,190 @@ async def test_update(
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_openmetrics(
+    client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
+) -> None:
+    """Test prometheus metrics view in the OpenMetrics format."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={"Accept": "application/openmetrics-text; version=1.0.0"},
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-type"] == openmetrics_exposition.CONTENT_TYPE_LATEST
+    body = await resp.text()
+
+    assert body.endswith("\n# EOF\n")
+    assert body.count("# EOF") == 1
+    assert "# HELP python_info Python platform information" in body
+    assert (
+        'entity_available{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_gzip(
+    client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
+) -> None:
+    """Test prometheus metrics view with gzip compression."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["content-type"] == CONTENT_TYPE_TEXT_PLAIN
+    body = await resp.text()
+
+    assert (
+        'entity_available{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("accept_encoding", ["gzip;q=0", "deflate", "identity"])
+async def test_view_gzip_not_accepted(
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+    accept_encoding: str,
+) -> None:
+    """Test prometheus metrics view does not compress unless gzip is accepted."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": accept_encoding}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert "content-encoding" not in resp.headers
+    body = await resp.text()
+
+    assert (
+        'entity_available{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_renders_changed_metrics_after_failure(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test metric families are rendered again after a failed scrape."""
+    await generate_latest_metrics(client)
+
+    set_state_with_entry(hass, sensor_entities["sensor_1"], 16.5)
+    await hass.async_block_till_done()
+
+    with mock.patch(
+        f"{PROMETHEUS_PATH}.prometheus_client.generate_latest",
+        side_effect=ValueError,
+    ):
+        resp = await client.get(prometheus.API_ENDPOINT)
+    assert resp.status == HTTPStatus.INTERNAL_SERVER_ERROR
+
+    body = await generate_latest_metrics(client)
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 16.5' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_renders_changed_metrics(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test only metric families changed since the last scrape are rendered."""
+    await generate_latest_metrics(client)
+
+    with mock.patch(
+        f"{PROMETHEUS_PATH}.prometheus_client.generate_latest",
+        wraps=prometheus_client.generate_latest,
+    ) as generate_latest:
+        body = await generate_latest_metrics(client)
+    # Only the collectors of the registry are rendered again
+    assert generate_latest.call_count == 1
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 15.6' in body
+    )
+
+    set_state_with_entry(hass, sensor_entities["sensor_1"], 16.5)
+    await hass.async_block_till_done()
+
+    with mock.patch(
+        f"{PROMETHEUS_PATH}.prometheus_client.generate_latest",
+        wraps=prometheus_client.generate_latest,
+    ) as generate_latest:
+        body = await generate_latest_metrics(client)
+    assert generate_latest.call_count > 1
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 16.5' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize(
+    ("accept", "exposition", "state_change_sections"),
+    [
+        ("text/plain", prometheus_client, 2),
+        ("application/openmetrics-text", openmetrics_exposition, 1),
+    ],
+)
+async def test_view_renders_changed_entities(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+    accept: str,
+    exposition: Any,
+    state_change_sections: int,
+) -> None:
+    """Test only the samples of entities changed since the last scrape are rendered."""
+    await client.get(prometheus.API_ENDPOINT, headers={"Accept": accept})
+
+    set_state_with_entry(hass, sensor_entities["sensor_1"], 16.5)
+    await hass.async_block_till_done()
+
+    generate_latest = exposition.generate_latest
+    rendered_entities: set[str] = set()
+
+    def _generate_latest(registry: Any) -> bytes:
+        body = generate_latest(registry)
+        rendered_entities.update(re.findall(r'entity="([^"]*)"', body.decode()))
+        return body
+
+    with mock.patch.object(exposition, "generate_latest", _generate_latest):
+        resp = await client.get(prometheus.API_ENDPOINT, headers={"Accept": accept})
+    assert resp.status == HTTPStatus.OK
+    body = (await resp.text()).split("\n")
+
+    assert rendered_entities == {"sensor.outside_temperature"}
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 16.5' in body
+    )
+    # The samples of the other entities are served from the cache
+    assert (
+        'entity_available{domain="sensor",'
+        'entity="sensor.outside_humidity",'
+        'friendly_name="Outside Humidity"} 1.0' in body
+    )
+    # The samples of all entities share the sections of their family
+    assert (
+        len([line for line in body if line.startswith("# HELP state_change")])
+        == state_change_sections
+    )
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_renaming_entity_name(
     hass: HomeAssistant,
@@ -1272,3 +1272,55 @@ def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty(
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     hass = hass_recorder()
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+def test_downsample_compressed_states() -> None:
+    """Test downsampling compressed states to the min and max of each bucket."""
+    states = [
+        {"s": "5", "lu": 0.0, "a": {"unit_of_measurement": "W"}},
+        # Bucket 0
+        {"s": "3", "lu": 1.0},
+        {"s": "9", "lu": 2.0},
+        {"s": "1", "lu": 3.0},
+        {"s": "4", "lu": 4.0},
+        # Bucket 1
+        {"s": "7", "lu": 11.0},
+        {"s": "unavailable", "lu": 12.0},
+        {"s": "2", "lu": 13.0},
+        # Bucket 2
+        {"s": "8", "lu": 21.0},
+        {"s": "6", "lu": 22.0},
+        {"s": "nan", "lu": 23.0},
+        # Bucket 3
+        {"s": "6", "lu": 31.0},
+        {"s": "2", "lu": 32.0},
+        {"s": "3", "lu": 33.0},
+    ]
+    assert list(history.downsample_compressed_states(states, 0.0, 40.0, 4)) == [
+        {"s": "5", "lu": 0.0, "a": {"unit_of_measurement": "W"}},
+        {"s": "9", "lu": 2.0},
+        {"s": "1", "lu": 3.0},
+        {"s": "7", "lu": 11.0},
+        {"s": "unavailable", "lu": 12.0},
+        {"s": "2", "lu": 13.0},
+        {"s": "8", "lu": 21.0},
+        {"s": "6", "lu": 22.0},
+        {"s": "nan", "lu": 23.0},
+        {"s": "6", "lu": 31.0},
+        {"s": "2", "lu": 32.0},
+        {"s": "3", "lu": 33.0},
+    ]
+    assert list(history.downsample_compressed_states(states, 0.0, 40.0, 1)) == [
+        {"s": "5", "lu": 0.0, "a": {"unit_of_measurement": "W"}},
+        {"s": "9", "lu": 2.0},
+        {"s": "1", "lu": 3.0},
+        {"s": "unavailable", "lu": 12.0},
+        {"s": "2", "lu": 13.0},
+        {"s": "8", "lu": 21.0},
+        {"s": "nan", "lu": 23.0},
+        {"s": "6", "lu": 31.0},
+        {"s": "2", "lu": 32.0},
+        {"s": "3", "lu": 33.0},
+    ]
+    assert list(history.downsample_compressed_states([], 0.0, 40.0, 4)) == []
+    assert list(history.downsample_compressed_states(states, 40.0, 40.0, 4)) == states
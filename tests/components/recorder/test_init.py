@@ -81,6 +81,7 @@ from homeassistant.util.json import json_loads
 
 from .common import (
     async_block_recorder,
+    async_recorder_block_till_done,
     async_wait_recording_done,
     convert_pending_states_to_meta,
     corrupt_db_file,
@@ -115,6 +116,8 @@ def _default_recorder(hass):
         hass,
         auto_purge=True,
         auto_repack=True,
+        incremental_purge=False,
+        purge_by_time_window=False,
         keep_days=7,
         commit_interval=1,
         uri="sqlite://",
@@ -381,6 +384,9 @@ def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
+    # The bulk writer does not add the States to the session
+    get_instance(hass).states_bulk_writer.enabled = False
+
     def _throw_if_state_in_session(*args, **kwargs):
         for obj in get_instance(hass).event_session:
             if isinstance(obj, States):
@@ -426,6 +432,9 @@ def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
+    # The bulk writer does not add the States to the session
+    get_instance(hass).states_bulk_writer.enabled = False
+
     def _throw_if_state_in_session(*args, **kwargs):
         for obj in get_instance(hass).event_session:
             if isinstance(obj, States):
@@ -1425,6 +1434,108 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("bulk_writes", [True, False])
+async def test_saving_sets_old_state_inside_commit_interval(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    bulk_writes: bool,
+) -> None:
+    """Test saving sets old state for many changes inside the commit interval."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 60}
+    )
+    instance.states_bulk_writer.enabled = bulk_writes
+
+    for idx in range(4):
+        hass.states.async_set("test.one", f"one_{idx}", {"idx": idx})
+        hass.states.async_set("test.two", f"two_{idx}", {"same": True})
+    # The commit is only triggered once the recorder has pending writes
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "one_4", {"idx": 4})
+    hass.states.async_remove("test.two")
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 10
+        states_by_state = {state.state: state for state in states}
+
+        for prefix, entity_id in (("one", "test.one"), ("two", "test.two")):
+            assert states_by_state[f"{prefix}_0"].old_state_id is None
+            for idx in range(1, 4):
+                state = states_by_state[f"{prefix}_{idx}"]
+                assert state.entity_id == entity_id
+                assert (
+                    state.old_state_id
+                    == states_by_state[f"{prefix}_{idx - 1}"].state_id
+                )
+
+        assert (
+            states_by_state["one_4"].old_state_id == states_by_state["one_3"].state_id
+        )
+        assert states_by_state[None].entity_id == "test.two"
+        assert states_by_state[None].old_state_id == states_by_state["two_3"].state_id
+        assert (
+            len({states_by_state[f"one_{idx}"].attributes_id for idx in range(5)}) == 5
+        )
+        assert (
+            len({states_by_state[f"two_{idx}"].attributes_id for idx in range(4)}) == 1
+        )
+        # The removed entity is recorded with empty attributes
+        assert session.query(StateAttributes).count() == 7
+
+
+async def test_bulk_writes_retry_after_failed_commit(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test the bulk writer writes the same rows again after a failed commit."""
+    instance = await async_setup_recorder_instance(
+        hass,
+        {
+            recorder.CONF_COMMIT_INTERVAL: 60,
+            recorder.CONF_DB_RETRY_WAIT: 0,
+        },
+    )
+    assert instance.states_bulk_writer.enabled is True
+    original_commit = instance.event_session.commit
+    fail_once = True
+
+    def _commit_that_fails_once() -> None:
+        nonlocal fail_once
+        if fail_once:
+            fail_once = False
+            instance.event_session.rollback()
+            raise OperationalError("insert the state", {}, "database is locked")
+        original_commit()
+
+    hass.states.async_set("test.one", "on", {"attr": 1})
+    hass.states.async_set("test.one", "off", {"attr": 1})
+    with patch.object(
+        instance.event_session, "commit", side_effect=_commit_that_fails_once
+    ):
+        await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+
+    assert fail_once is False
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(session.query(States.state_id, States.old_state_id, States.state))
+        assert len(states) == 2
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["on"].old_state_id is None
+        assert states_by_state["off"].old_state_id == states_by_state["on"].state_id
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -3,7 +3,8 @@
 from datetime import datetime, timedelta
 import json
 import sqlite3
-from unittest.mock import patch
+from typing import Any
+from unittest.mock import Mock, PropertyMock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -23,13 +24,18 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    _purge_short_term_statistics_by_time_window,
+    purge_old_data,
+    purge_old_data_slice,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
 )
-from homeassistant.components.recorder.tasks import PurgeTask
+from homeassistant.components.recorder.statistics import StatisticsDuringPeriodCache
+from homeassistant.components.recorder.tasks import IncrementalPurgeTask, PurgeTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_THEMES_UPDATED, STATE_ON
 from homeassistant.core import HomeAssistant
@@ -44,6 +50,7 @@ from .common import (
     convert_pending_states_to_meta,
 )
 
+from tests.common import async_fire_time_changed
 from tests.typing import RecorderInstanceGenerator
 
 TEST_EVENT_TYPES = (
@@ -191,6 +198,250 @@ async def test_purge_old_states(
         assert state_attributes.count() == 3
 
 
+@pytest.mark.parametrize(
+    "dialect", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
+)
+async def test_purge_old_data_by_time_window(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    dialect: SupportedDialect,
+) -> None:
+    """Test purging one time window per batch with range deletes."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_PURGE_BY_TIME_WINDOW: True}
+    )
+
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+    await _add_test_statistics(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with (
+        patch.object(
+            type(instance),
+            "dialect_name",
+            new_callable=PropertyMock,
+            return_value=dialect,
+        ),
+        session_scope(hass=hass) as session,
+    ):
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+        )
+        statistics = session.query(StatisticsShortTerm)
+        assert states.count() == 6
+        assert state_attributes.count() == 3
+        assert events.count() == 6
+        assert statistics.count() == 6
+
+        # The first window covers the rows from eleven days ago
+        finished = purge_old_data(
+            instance,
+            purge_before,
+            repack=False,
+            states_batch_size=1,
+            events_batch_size=1,
+        )
+        assert not finished
+        assert states.count() == 4
+        assert state_attributes.count() == 2
+        assert events.count() == 4
+        assert statistics.count() == 4
+
+        finished = purge_old_data(
+            instance,
+            purge_before,
+            repack=False,
+            states_batch_size=1,
+            events_batch_size=1,
+        )
+        assert not finished
+        assert {state.state for state in states} == {"dontpurgeme_4", "dontpurgeme_5"}
+        assert state_attributes.count() == 1
+        assert events.count() == 2
+        assert statistics.count() == 2
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+
+        state_map_by_state = {state.state: state for state in states}
+        dontpurgeme_5 = state_map_by_state["dontpurgeme_5"]
+        dontpurgeme_4 = state_map_by_state["dontpurgeme_4"]
+        assert dontpurgeme_5.old_state_id == dontpurgeme_4.state_id
+        assert dontpurgeme_4.old_state_id is None
+        assert "test.recorder2" in instance.states_manager._last_committed_id
+
+        # Purge everything including the committed state
+        finished = purge_old_data(instance, dt_util.utcnow(), repack=False)
+        assert finished
+        assert states.count() == 0
+        assert state_attributes.count() == 0
+        assert events.count() == 0
+        assert statistics.count() == 0
+        assert "test.recorder2" not in instance.states_manager._last_committed_id
+
+
+async def test_purge_time_window_limited_by_rows(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a time window does not purge more than max_bind_vars rows."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_PURGE_BY_TIME_WINDOW: True}
+    )
+    eleven_days_ago = dt_util.utcnow() - timedelta(days=11)
+    with freeze_time(eleven_days_ago) as freezer:
+        for state in ("purgeme_0", "purgeme_1", "purgeme_2"):
+            hass.states.async_set("test.recorder", state)
+            await hass.async_block_till_done()
+            await async_wait_recording_done(hass)
+            freezer.tick(timedelta(seconds=1))
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with (
+        patch.object(
+            type(instance),
+            "dialect_name",
+            new_callable=PropertyMock,
+            return_value=SupportedDialect.MYSQL,
+        ),
+        patch.object(instance, "max_bind_vars", 2),
+        session_scope(hass=hass) as session,
+    ):
+        states = session.query(States)
+        assert states.count() == 3
+
+        finished = purge_old_data(
+            instance,
+            purge_before,
+            repack=False,
+            states_batch_size=1,
+            events_batch_size=1,
+        )
+        assert not finished
+        assert {state.state for state in states} == {"purgeme_2"}
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        assert states.count() == 0
+
+
+async def test_purge_by_time_window_is_opt_in(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test MySQL uses the id based purge unless time windows are enabled."""
+    instance = await async_setup_recorder_instance(hass)
+    with (
+        patch.object(
+            type(instance),
+            "dialect_name",
+            new_callable=PropertyMock,
+            return_value=SupportedDialect.MYSQL,
+        ),
+        patch(
+            "homeassistant.components.recorder.purge._purge_states_by_time_window"
+        ) as purge_states_by_time_window,
+    ):
+        await _add_test_states(hass)
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        finished = purge_old_data(instance, purge_before, repack=False)
+
+    assert finished
+    assert not purge_states_by_time_window.called
+
+
+async def test_purge_old_data_slice(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purging old states and events in bounded slices."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+    assert instance.purge_cursor is None
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+        )
+        assert states.count() == 6
+        assert events.count() == 6
+
+        finished = purge_old_data_slice(instance, purge_before, 1)
+        assert not finished
+        assert states.count() == 5
+        assert events.count() == 5
+        assert instance.purge_cursor < purge_before.timestamp()
+
+        while not purge_old_data_slice(instance, purge_before, 1):
+            pass
+        assert states.count() == 2
+        assert state_attributes.count() == 1
+        assert events.count() == 2
+        assert instance.purge_cursor >= purge_before.timestamp()
+
+        # Nothing is old enough to purge so the database is not touched
+        with patch.object(instance, "get_session", side_effect=AssertionError):
+            assert purge_old_data_slice(instance, purge_before, 1)
+
+
+async def test_incremental_purge(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the incremental purge runs in slices and persists its cursor."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_INCREMENTAL_PURGE: True, "purge_keep_days": 2}
+    )
+    utcnow = dt_util.utcnow()
+    with session_scope(hass=hass) as session:
+        for timestamp, state in (
+            (utcnow - timedelta(days=3), "purgeme"),
+            (utcnow - timedelta(days=3), "purgeme"),
+            (utcnow, "dontpurgeme"),
+        ):
+            session.add(
+                States(
+                    entity_id="test.recorder2",
+                    state=state,
+                    last_changed_ts=timestamp.timestamp(),
+                    last_updated_ts=timestamp.timestamp(),
+                )
+            )
+        convert_pending_states_to_meta(instance, session)
+
+    async_fire_time_changed(hass, utcnow + timedelta(seconds=6))
+    await async_recorder_block_till_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert [state.state for state in session.query(States)] == ["dontpurgeme"]
+    cursor = instance.purge_cursor
+    assert utcnow.timestamp() - timedelta(days=2).total_seconds() < cursor
+
+    async_fire_time_changed(hass, utcnow + timedelta(seconds=70))
+    await hass.async_block_till_done()
+    assert hass_storage["recorder.purge_cursor"]["data"] == {"cursor": cursor}
+
+    # The slices are skipped while the recorder has a backlog
+    with (
+        patch.object(
+            type(instance), "backlog", new_callable=PropertyMock, return_value=1000
+        ),
+        patch.object(instance, "queue_task") as queue_task_mock,
+    ):
+        async_fire_time_changed(hass, utcnow + timedelta(seconds=80))
+        await hass.async_block_till_done()
+    assert not any(
+        isinstance(call[0][0], IncrementalPurgeTask)
+        for call in queue_task_mock.call_args_list
+    )
+
+
 async def test_purge_old_states_encouters_database_corruption(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
@@ -388,6 +639,101 @@ async def test_purge_old_statistics_runs(
         assert statistics_runs.count() == 1
 
 
+async def test_purge_old_statistics_invalidates_cache(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purging short term statistics invalidates the cached results."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_statistics(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with patch.object(StatisticsDuringPeriodCache, "invalidate") as invalidate_mock:
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        invalidate_mock.assert_called_once_with(None, None)
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+
+        # Nothing was purged, so the cache is kept
+        invalidate_mock.reset_mock()
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        invalidate_mock.assert_not_called()
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsShortTerm).count() == 2
+
+
+async def test_purge_statistics_runs_keeps_cache(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purging only statistics runs keeps the cached results."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_statistics_runs(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with patch.object(StatisticsDuringPeriodCache, "invalidate") as invalidate_mock:
+        while not purge_old_data(instance, purge_before, repack=False):
+            pass
+
+    invalidate_mock.assert_not_called()
+
+
+async def test_purge_old_statistics_failed_commit_keeps_cache(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the cached results are kept when the purge is not committed."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_statistics(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    get_session = instance.get_session
+
+    def _get_session_failing_commit() -> Session:
+        session = get_session()
+        session.commit = Mock(
+            side_effect=OperationalError("statement", {}, Exception("failed"))
+        )
+        return session
+
+    with (
+        patch.object(instance, "get_session", _get_session_failing_commit),
+        patch.object(StatisticsDuringPeriodCache, "invalidate") as invalidate_mock,
+    ):
+        purge_old_data(instance, purge_before, repack=False)
+
+    invalidate_mock.assert_not_called()
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsShortTerm).count() == 6
+
+
+async def test_purge_short_term_statistics_by_time_window(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the time window purge reports whether it deleted statistics."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_statistics(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with session_scope(hass=hass) as session:
+        # The rows of eleven days ago and of five days ago are in separate windows
+        assert _purge_short_term_statistics_by_time_window(
+            session, instance.max_bind_vars, purge_before
+        ) == (True, True)
+        assert _purge_short_term_statistics_by_time_window(
+            session, instance.max_bind_vars, purge_before
+        ) == (True, True)
+        # Nothing is left to purge or deleted
+        assert _purge_short_term_statistics_by_time_window(
+            session, instance.max_bind_vars, purge_before
+        ) == (False, False)
+        assert session.query(StatisticsShortTerm).count() == 2
+
+
 @pytest.mark.parametrize("use_sqlite", [True, False], indirect=True)
 async def test_purge_method(
     async_setup_recorder_instance: RecorderInstanceGenerator,
@@ -2276,6 +2276,98 @@ def test_change(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+def test_statistics_during_period_cache(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test statistics_during_period results are cached until they are modified."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    period1 = zero - timedelta(hours=4)
+    period2 = zero - timedelta(hours=3)
+    period3 = zero - timedelta(hours=2)
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "recorder",
+        "statistic_id": "sensor.total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_import_statistics(
+        hass,
+        external_metadata,
+        (
+            {"start": period1, "state": 0, "sum": 2},
+            {"start": period2, "state": 1, "sum": 3},
+        ),
+    )
+    wait_recording_done(hass)
+
+    def _sums(stats: dict[str, list[dict]]) -> list[float]:
+        return [row["sum"] for row in stats["sensor.total_energy_import"]]
+
+    statistic_ids = {"sensor.total_energy_import"}
+    with patch.object(
+        statistics,
+        "_statistics_during_period_with_session",
+        wraps=statistics._statistics_during_period_with_session,
+    ) as during_period_mock:
+        stats = statistics_during_period(hass, period1, None, statistic_ids)
+        assert _sums(stats) == [2, 3]
+        assert during_period_mock.call_count == 1
+
+        # Modifying a result does not modify the cached result
+        stats["sensor.total_energy_import"][0]["sum"] = 100
+        stats = statistics_during_period(hass, period1, None, statistic_ids)
+        assert _sums(stats) == [2, 3]
+        assert during_period_mock.call_count == 1
+
+        # A different request is not served from the cache
+        stats = statistics_during_period(hass, period1, period2, statistic_ids)
+        assert _sums(stats) == [2]
+        assert during_period_mock.call_count == 2
+
+        # Importing statistics after the end of a result keeps it cached
+        async_import_statistics(
+            hass, external_metadata, ({"start": period3, "state": 2, "sum": 5},)
+        )
+        wait_recording_done(hass)
+        stats = statistics_during_period(hass, period1, period2, statistic_ids)
+        assert _sums(stats) == [2]
+        assert during_period_mock.call_count == 2
+        stats = statistics_during_period(hass, period1, None, statistic_ids)
+        assert _sums(stats) == [2, 3, 5]
+        assert during_period_mock.call_count == 3
+
+        # Adjusting statistics invalidates the results from the adjusted period
+        instance.async_adjust_statistics(
+            "sensor.total_energy_import", period2, 10, "kWh"
+        )
+        wait_recording_done(hass)
+        stats = statistics_during_period(hass, period1, period2, statistic_ids)
+        assert _sums(stats) == [2]
+        assert during_period_mock.call_count == 3
+        stats = statistics_during_period(hass, period1, None, statistic_ids)
+        assert _sums(stats) == [2, 13, 15]
+        assert during_period_mock.call_count == 4
+
+        # Compiling statistics invalidates results which include the period
+        do_adhoc_statistics(hass, start=period1)
+        wait_recording_done(hass)
+        stats = statistics_during_period(hass, period1, None, statistic_ids)
+        assert _sums(stats) == [2, 13, 15]
+        assert during_period_mock.call_count == 5
+
+        # Clearing statistics invalidates all results
+        instance.async_clear_statistics(["sensor.total_energy_import"])
+        wait_recording_done(hass)
+        assert statistics_during_period(hass, period1, period2, statistic_ids) == {}
+        assert during_period_mock.call_count == 6
+
+
 @pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
 @pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
 def test_change_with_none(
@@ -1,8 +1,11 @@
 """Tests for Search integration."""
 
+from unittest.mock import patch
+
 import pytest
 from pytest_unordered import unordered
 
+from homeassistant.components import automation
 from homeassistant.components.search import ItemType, Searcher
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import (
@@ -12,6 +15,7 @@ from homeassistant.helpers import (
     floor_registry as fr,
     label_registry as lr,
 )
+from homeassistant.const import SERVICE_RELOAD
 from homeassistant.helpers.entity import EntityInfo
 from homeassistant.setup import async_setup_component
 
@@ -986,3 +990,57 @@ async def test_search(
         ),
         ItemType.SCRIPT: unordered(["script.device", "script.hue"]),
     }
+
+
+async def test_search_after_reload(hass: HomeAssistant) -> None:
+    """Test the references of reloaded automations are found."""
+    assert await async_setup_component(hass, "search", {})
+
+    def automation_config(entity_id: str) -> dict:
+        """Return an automation turning on an entity."""
+        return {
+            "id": "unique_id",
+            "alias": "light",
+            "trigger": {"platform": "event", "event_type": "test_event"},
+            "action": {"service": "light.turn_on", "entity_id": entity_id},
+        }
+
+    assert await async_setup_component(
+        hass, automation.DOMAIN, {automation.DOMAIN: automation_config("light.a")}
+    )
+
+    def search(item_type: ItemType, item_id: str) -> dict[str, set[str]]:
+        """Search."""
+        return Searcher(hass, {}).async_search(item_type, item_id)
+
+    assert search(ItemType.ENTITY, "light.a") == {
+        ItemType.AUTOMATION: {"automation.light"}
+    }
+    assert not search(ItemType.ENTITY, "light.b")
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={automation.DOMAIN: automation_config("light.b")},
+    ):
+        await hass.services.async_call(
+            automation.DOMAIN, SERVICE_RELOAD, blocking=True
+        )
+        await hass.async_block_till_done()
+
+    assert not search(ItemType.ENTITY, "light.a")
+    assert search(ItemType.ENTITY, "light.b") == {
+        ItemType.AUTOMATION: {"automation.light"}
+    }
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={},
+    ):
+        await hass.services.async_call(
+            automation.DOMAIN, SERVICE_RELOAD, blocking=True
+        )
+        await hass.async_block_till_done()
+
+    assert not search(ItemType.ENTITY, "light.b")
@@ -409,6 +409,141 @@ async def test_sampling_size_reduced(hass: HomeAssistant) -> None:
     assert state.attributes.get("buffer_usage_ratio") == round(5 / 5, 2)
 
 
+@pytest.mark.parametrize(
+    ("characteristic", "expected_fn"),
+    [
+        ("mean", statistics.mean),
+        ("standard_deviation", statistics.stdev),
+        ("variance", statistics.variance),
+        ("median", statistics.median),
+        ("value_max", max),
+        ("value_min", min),
+        ("sum", sum),
+        ("distance_absolute", lambda values: max(values) - min(values)),
+        (
+            "sum_differences",
+            lambda values: sum(abs(j - i) for i, j in zip(values, values[1:])),
+        ),
+    ],
+)
+async def test_sampling_size_reduced_rolling(
+    hass: HomeAssistant, characteristic: str, expected_fn: Any
+) -> None:
+    """Test aggregates follow the samples dropped from a full buffer."""
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": 5,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    values = VALUES_NUMERIC * 3
+    for count, value in enumerate(values, 1):
+        hass.states.async_set(
+            "sensor.test_monitored",
+            str(value),
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+        await hass.async_block_till_done()
+
+        window = [float(value) for value in values[max(count - 5, 0) : count]]
+        if len(window) < 2 and characteristic in ("standard_deviation", "variance"):
+            continue
+        state = hass.states.get("sensor.test")
+        assert state is not None
+        assert float(state.state) == pytest.approx(expected_fn(window), abs=0.01)
+
+
+@pytest.mark.parametrize("non_finite", ["inf", "-inf", "nan"])
+@pytest.mark.parametrize(
+    ("characteristic", "expected"),
+    [
+        ("mean", 3.0),
+        ("sum_differences", 2.0),
+        ("mean_circular", 3.0),
+        ("median", 3.0),
+        ("percentile", 3.0),
+    ],
+)
+async def test_sampling_size_reduced_non_finite(
+    hass: HomeAssistant, non_finite: str, characteristic: str, expected: float
+) -> None:
+    """Test aggregates recover once a non finite sample is dropped."""
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": 3,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    for value in ("1", non_finite, "2", "3", "4"):
+        hass.states.async_set(
+            "sensor.test_monitored",
+            value,
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+        await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test")
+    assert state is not None
+    assert float(state.state) == pytest.approx(expected, abs=0.01)
+
+
+@pytest.mark.parametrize("characteristic", ["median", "percentile"])
+async def test_sampling_size_reduced_nan_order(
+    hass: HomeAssistant, characteristic: str
+) -> None:
+    """Test a nan sample does not break the order statistics."""
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": 3,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    for value in ("3", "nan", "1", "2", "5", "4"):
+        hass.states.async_set(
+            "sensor.test_monitored",
+            value,
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+        await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test")
+    assert state is not None
+    assert float(state.state) == 4.0
+
+
 async def test_sampling_size_1(hass: HomeAssistant) -> None:
     """Test validity of stats requiring only one sample."""
     assert await async_setup_component(
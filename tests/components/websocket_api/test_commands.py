@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
@@ -24,6 +25,7 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -31,6 +33,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1195,6 +1198,66 @@ async def test_subscribe_unsubscribe_entities(
     }
 
 
+async def test_subscribe_entities_coalesce_when_behind(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test state changes are merged per entity while the client is behind."""
+    hass.states.async_set("light.one", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce": True}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.one": {"a": {}, "c": ANY, "lc": ANY, "s": "off"}}
+    }
+
+    with patch(
+        "homeassistant.components.websocket_api.const.PENDING_MSG_COALESCE_THRESHOLD",
+        0,
+    ):
+        hass.states.async_set("light.one", "on")
+        hass.states.async_set("light.one", "off")
+        hass.states.async_set("light.one", "on", {"color": "red"})
+        hass.states.async_set("light.two", "on")
+        hass.states.async_set("light.two", "off", {"color": "blue"})
+        hass.states.async_set("light.three", "on")
+        hass.states.async_remove("light.three")
+        # Nothing is flushed while the client is still behind
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.two": {"a": {"color": "blue"}, "c": ANY, "lc": ANY, "s": "off"}},
+        "c": {
+            "light.one": {"+": {"a": {"color": "red"}, "c": ANY, "lc": ANY, "s": "on"}}
+        },
+    }
+
+    # Once caught up, state changes are sent as they happen again
+    hass.states.async_set("light.one", "off", {"color": "red"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+
+
 async def test_subscribe_unsubscribe_entities_specific_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2510,6 +2573,30 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_import_info(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test integration/import_info returns the import timings."""
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_import_timings",
+        return_value={
+            "hue": 0.5,
+            "hue.config_flow": 0.25,
+        },
+    ):
+        await websocket_client.send_json({"id": 7, "type": "integration/import_info"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {"module": "hue", "seconds": 0.5},
+        {"module": "hue.config_flow", "seconds": 0.25},
+    ]
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import timedelta
+import logging
 from typing import Any, cast
 from unittest.mock import patch
 
@@ -14,12 +15,22 @@ from homeassistant.components.websocket_api import (
     http,
     websocket_command,
 )
+from homeassistant.components.websocket_api.auth import (
+    TYPE_AUTH,
+    TYPE_AUTH_OK,
+    TYPE_AUTH_REQUIRED,
+)
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -435,6 +446,168 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_set_compression_level(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test setting the deflate level through supported features."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    client = await hass_client_no_auth()
+
+    async with client.ws_connect(const.URL, compress=15) as ws:
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_REQUIRED
+        await ws.send_json({"type": TYPE_AUTH, "access_token": hass_access_token})
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_OK
+
+        with patch(
+            "homeassistant.components.websocket_api.http.ZLibCompressor",
+            wraps=http.ZLibCompressor,
+        ) as mock_compressor:
+            await ws.send_json(
+                {
+                    "id": 1,
+                    "type": "supported_features",
+                    "features": {const.FEATURE_COMPRESSION_LEVEL: 12},
+                }
+            )
+            msg = await ws.receive_json()
+            assert msg["id"] == 1
+            assert msg["success"] is True
+
+        assert len(mock_compressor.mock_calls) == 1
+        assert mock_compressor.mock_calls[0].kwargs["level"] == 9
+
+        # Messages are still readable once the compressor has been replaced
+        hass.states.async_set("light.kitchen", "on", {"friendly_name": "Kitchen"})
+        await ws.send_json({"id": 2, "type": "get_states"})
+        msg = await ws.receive_json()
+        assert msg["id"] == 2
+        assert msg["success"] is True
+        assert msg["result"][0]["entity_id"] == "light.kitchen"
+
+
+async def test_set_compression_level_private_api(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test the private aiohttp API used to set the deflate level is still there.
+
+    The compression level silently falls back to the level of aiohttp if the
+    API changes, this test makes an aiohttp upgrade that changes it fail.
+    """
+    assert http.ZLibCompressor is not None
+    compressed: list[bytes] = []
+
+    class TrackingZLibCompressor(http.ZLibCompressor):
+        """Compressor that records the data it compresses."""
+
+        async def compress(self, data: bytes) -> bytes:
+            """Record and compress data."""
+            compressed.append(data)
+            return await super().compress(data)
+
+    assert await async_setup_component(hass, "websocket_api", {})
+    client = await hass_client_no_auth()
+
+    async with client.ws_connect(const.URL, compress=15) as ws:
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_REQUIRED
+        await ws.send_json({"type": TYPE_AUTH, "access_token": hass_access_token})
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_OK
+
+        with patch(
+            "homeassistant.components.websocket_api.http.ZLibCompressor",
+            TrackingZLibCompressor,
+        ):
+            await ws.send_json(
+                {
+                    "id": 1,
+                    "type": "supported_features",
+                    "features": {const.FEATURE_COMPRESSION_LEVEL: 9},
+                }
+            )
+            msg = await ws.receive_json()
+            assert msg["id"] == 1
+            assert msg["success"] is True
+
+        hass.states.async_set("light.kitchen", "on", {"friendly_name": "Kitchen"})
+        await ws.send_json({"id": 2, "type": "get_states"})
+        msg = await ws.receive_json()
+        assert msg["id"] == 2
+        assert msg["result"][0]["entity_id"] == "light.kitchen"
+
+    # The messages were sent through the replaced compressor
+    assert any(b"light.kitchen" in data for data in compressed)
+
+
+async def test_set_compression_level_not_supported(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the compression level is ignored if aiohttp does not expose it."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    client = await hass_client_no_auth()
+
+    async with client.ws_connect(const.URL, compress=15) as ws:
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_REQUIRED
+        await ws.send_json({"type": TYPE_AUTH, "access_token": hass_access_token})
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_OK
+
+        with (
+            caplog.at_level(logging.DEBUG),
+            patch("homeassistant.components.websocket_api.http.ZLibCompressor", None),
+        ):
+            await ws.send_json(
+                {
+                    "id": 1,
+                    "type": "supported_features",
+                    "features": {const.FEATURE_COMPRESSION_LEVEL: 9},
+                }
+            )
+            msg = await ws.receive_json()
+            assert msg["id"] == 1
+            assert msg["success"] is True
+
+        assert "Compression level is not supported" in caplog.text
+
+        hass.states.async_set("light.kitchen", "on", {"friendly_name": "Kitchen"})
+        await ws.send_json({"id": 2, "type": "get_states"})
+        msg = await ws.receive_json()
+        assert msg["id"] == 2
+        assert msg["success"] is True
+        assert msg["result"][0]["entity_id"] == "light.kitchen"
+
+
+async def test_set_compression_level_without_deflate(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the compression level is ignored without permessage-deflate."""
+    with patch(
+        "homeassistant.components.websocket_api.http.ZLibCompressor"
+    ) as mock_compressor:
+        await websocket_client.send_json(
+            {
+                "id": 1,
+                "type": "supported_features",
+                "features": {const.FEATURE_COMPRESSION_LEVEL: 6},
+            }
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 1
+        assert msg["success"] is True
+
+    assert not mock_compressor.mock_calls
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
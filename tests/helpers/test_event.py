@@ -2019,6 +2019,57 @@ async def test_track_template_result_with_group(hass: HomeAssistant) -> None:
     assert specific_runs[-1] == 100.1 + 200.2 + 0 + 800.8
 
 
+async def test_track_template_result_defer_render(hass: HomeAssistant) -> None:
+    """Test simple templates are not rendered until the first refresh."""
+    specific_runs = []
+    hass.states.async_set("light.a", "off")
+    hass.states.async_set("light.b", "off")
+    template_simple = Template(
+        "{{ is_state('light.a', 'on') and states.light.b.state == 'on' }}", hass
+    )
+    template_dynamic = Template("{{ states(entity_id) }}", hass)
+
+    def specific_run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        specific_runs.append({update.template: update.result for update in updates})
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as render_mock:
+        info = async_track_template_result(
+            hass,
+            [
+                TrackTemplate(template_simple, None),
+                TrackTemplate(template_dynamic, {"entity_id": "light.b"}),
+            ],
+            specific_run_callback,
+            defer_render=True,
+        )
+    assert [call.args[0] for call in render_mock.call_args_list] == [template_dynamic]
+    assert info.listeners == {
+        "all": False,
+        "domains": set(),
+        "entities": {"light.a", "light.b"},
+        "time": False,
+    }
+
+    info.async_refresh()
+    assert specific_runs == [{template_simple: False, template_dynamic: "off"}]
+
+    hass.states.async_set("light.a", "on")
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 1
+
+    hass.states.async_set("light.b", "on")
+    await hass.async_block_till_done()
+    assert specific_runs[-1] == {template_simple: True, template_dynamic: "on"}
+
+
 async def test_track_template_result_and_conditional(hass: HomeAssistant) -> None:
     """Test tracking template with an and conditional."""
     specific_runs = []
@@ -17,6 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    STORAGE_JOURNAL_KEY,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -132,8 +133,22 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
         await hass.async_block_till_done()
 
+    # Nothing changed since the startup save
+    assert not mock_write_data.called
+
+    data.async_restore_entity_added(entity)
+    hass.states.async_set("input_boolean.b1", "on")
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
+        await hass.async_block_till_done()
+
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -145,7 +160,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
-        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=45))
         await hass.async_block_till_done()
 
     assert not mock_write_data.called
@@ -192,6 +207,9 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    data.async_restore_entity_added(entity)
+    hass.states.async_set("input_boolean.b1", "on")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -200,6 +218,8 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     # Verify still saving
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -353,6 +373,86 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_journal(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test only changed states are written to the journal and restored."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    for idx in range(4):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        await platform.async_add_entities([entity])
+        hass.states.async_set(entity.entity_id, "off")
+
+    data = async_get(hass)
+    await data.async_dump_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 4
+    assert STORAGE_JOURNAL_KEY not in hass_storage
+
+    # Nothing changed, nothing is written
+    await data.async_dump_journal()
+    assert STORAGE_JOURNAL_KEY not in hass_storage
+
+    hass.states.async_set("input_boolean.b1", "on")
+    await data.async_dump_journal()
+    journal = hass_storage[STORAGE_JOURNAL_KEY]["data"]
+    assert len(journal) == 1
+    assert journal[0]["state"]["entity_id"] == "input_boolean.b1"
+    assert journal[0]["state"]["state"] == "on"
+    # The full dump is left untouched
+    assert all(
+        item["state"]["state"] == "off" for item in hass_storage[STORAGE_KEY]["data"]
+    )
+
+    # Emulate a fresh load, the journal is applied on top of the full dump
+    restored = RestoreStateData(hass)
+    await restored.async_load()
+    last_states = restored.last_states
+    assert last_states["input_boolean.b0"].state.state == "off"
+    assert last_states["input_boolean.b1"].state.state == "on"
+
+    # Once half of the states changed the journal is compacted
+    hass.states.async_set("input_boolean.b2", "on")
+    hass.states.async_set("input_boolean.b3", "on")
+    await data.async_dump_journal()
+    assert STORAGE_JOURNAL_KEY not in hass_storage
+    assert [item["state"]["state"] for item in hass_storage[STORAGE_KEY]["data"]] == [
+        "off",
+        "on",
+        "on",
+        "on",
+    ]
+
+
+async def test_dump_journal_compact_interval(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test all states are rewritten once the compaction interval has passed."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    for idx in range(4):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        await platform.async_add_entities([entity])
+        hass.states.async_set(entity.entity_id, "off")
+
+    data = async_get(hass)
+    await data.async_dump_states()
+    hass.states.async_set("input_boolean.b1", "on")
+    await data.async_dump_journal()
+    assert len(hass_storage[STORAGE_JOURNAL_KEY]["data"]) == 1
+
+    with patch(
+        "homeassistant.helpers.restore_state.dt_util.utcnow",
+        return_value=dt_util.utcnow() + timedelta(days=1),
+    ):
+        await data.async_dump_journal()
+
+    assert STORAGE_JOURNAL_KEY not in hass_storage
+    assert hass_storage[STORAGE_KEY]["data"][1]["state"]["state"] == "on"
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
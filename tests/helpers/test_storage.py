@@ -1159,3 +1159,132 @@ async def test_store_manager_cleanup_after_stop(
         assert store_manager.async_fetch("integration1") is None
         assert store_manager.async_fetch("integration2") is None
         await hass.async_stop(force=True)
+
+
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test changed records are appended to the journal and applied on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir) as hass:
+        records = {"a": {"id": "a", "value": 1}, "b": {"id": "b", "value": 2}}
+        changes: list[tuple[str, str, Any]] = []
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_key="id")
+        data_func = Mock(side_effect=lambda: {"items": list(records.values())})
+        changes_func = Mock(side_effect=lambda: changes)
+
+        store.async_delay_save_changes(data_func, changes_func)
+        # sleep is to run one event loop to get the task scheduled
+        await asyncio.sleep(0)
+        await hass.async_block_till_done()
+        assert len(data_func.mock_calls) == 1
+        assert not changes_func.mock_calls
+        assert not await hass.async_add_executor_job(
+            os.path.exists, store.journal_path
+        )
+
+        changes = [
+            ("items", "b", {"id": "b", "value": 3}),
+            ("items", "a", None),
+            ("items", "c", {"id": "c", "value": 4}),
+        ]
+        store.async_delay_save_changes(data_func, changes_func)
+        # sleep is to run one event loop to get the task scheduled
+        await asyncio.sleep(0)
+        await hass.async_block_till_done()
+        assert len(data_func.mock_calls) == 1
+        assert len(changes_func.mock_calls) == 1
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        # The full data on disk is left untouched
+        stored = await hass.async_add_executor_job(
+            storage.json_util.load_json, store.path
+        )
+        assert stored["data"] == {"items": list(records.values())}
+
+        new_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_key="id")
+        assert await new_store.async_load() == {
+            "items": [{"id": "b", "value": 3}, {"id": "c", "value": 4}]
+        }
+
+        # A full write clears the journal
+        await store.async_save({"items": []})
+        assert not await hass.async_add_executor_job(
+            os.path.exists, store.journal_path
+        )
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_outdated_or_incomplete(tmpdir: py.path.local) -> None:
+    """Test a journal of older data or an incomplete record is not applied."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_key="id")
+        store.async_delay_save_changes(
+            lambda: {"items": [{"id": "a", "value": 1}]},
+            lambda: [("items", "a", {"id": "a", "value": 2})],
+        )
+        await asyncio.sleep(0)
+        await hass.async_block_till_done()
+        journal_id = (
+            await hass.async_add_executor_job(storage.json_util.load_json, store.path)
+        )["journal_id"]
+
+        def _write_journal(journal_id: str, record: bytes) -> None:
+            with open(store.journal_path, "wb") as fdesc:
+                fdesc.write(json_bytes({"journal_id": journal_id}) + b"\n" + record)
+
+        await hass.async_add_executor_job(
+            _write_journal,
+            "outdated",
+            json_bytes({"c": "items", "k": "a", "v": {"id": "a", "value": 2}}),
+        )
+        new_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_key="id")
+        assert await new_store.async_load() == {"items": [{"id": "a", "value": 1}]}
+
+        await hass.async_add_executor_job(
+            _write_journal, journal_id, b'{"c":"items","k":"a","v":{"id":'
+        )
+        new_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_key="id")
+        assert await new_store.async_load() == {"items": [{"id": "a", "value": 1}]}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is written into the data on the final write."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir) as hass:
+        records = {"a": {"id": "a", "value": 1}}
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_key="id")
+
+        def data_func() -> dict[str, Any]:
+            return {"items": list(records.values())}
+
+        def changes_func() -> list[tuple[str, str, Any]]:
+            return [("items", "a", records["a"])]
+
+        store.async_delay_save_changes(data_func, changes_func)
+        await asyncio.sleep(0)
+        await hass.async_block_till_done()
+
+        records["a"] = {"id": "a", "value": 2}
+        store.async_delay_save_changes(data_func, changes_func)
+        await asyncio.sleep(0)
+        await hass.async_block_till_done()
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        assert not await hass.async_add_executor_job(
+            os.path.exists, store.journal_path
+        )
+        stored = await hass.async_add_executor_job(
+            storage.json_util.load_json, store.path
+        )
+        assert stored["data"] == {"items": [{"id": "a", "value": 2}]}
+
+        await hass.async_stop(force=True)
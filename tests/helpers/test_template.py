@@ -4654,8 +4654,8 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+async def test_cache_survives_template_instances() -> None:
+    """Test the compiled template is kept after its templates are removed."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
@@ -4674,7 +4674,73 @@ async def test_cache_garbage_collection() -> None:
     del tpl
     assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template._NO_HASS_ENV.template_cache.get(template_string)
+
+    code = template._NO_HASS_ENV.template_cache.get(template_string)
+    tpl3 = template.Template(template_string)
+    tpl3.ensure_valid()
+    assert tpl3._compiled_code is code
+
+
+@pytest.mark.parametrize(
+    ("template_string", "entities", "domains"),
+    [
+        (
+            "{{ states('sensor.temperature') | float + 1 }}",
+            {"sensor.temperature"},
+            set(),
+        ),
+        (
+            "{{ is_state('light.kitchen', 'on') and state_attr('light.hall', 'x') }}",
+            {"light.kitchen", "light.hall"},
+            set(),
+        ),
+        ("{{ states.sensor.temperature.state }}", {"sensor.temperature"}, set()),
+        ("{{ states['sensor.temperature'].state }}", {"sensor.temperature"}, set()),
+        ("{{ states.sensor['temperature'].state }}", {"sensor.temperature"}, set()),
+        ("{{ 'sensor.temperature' | states }}", {"sensor.temperature"}, set()),
+        ("{{ 'light.kitchen' is is_state('on') }}", {"light.kitchen"}, set()),
+        ("{{ states.light | count }}", set(), {"light"}),
+        ("{{ 1 + 1 }}", set(), set()),
+    ],
+)
+async def test_static_render_info(
+    hass: HomeAssistant, template_string: str, entities: set[str], domains: set[str]
+) -> None:
+    """Test collecting the dependencies of a template without rendering it."""
+    tpl = template.Template(template_string, hass)
+
+    with patch.object(template.Template, "async_render") as render_mock:
+        info = tpl.async_static_render_info()
+    render_mock.assert_not_called()
+
+    assert info is not None
+    assert info.entities == entities
+    assert info.domains == domains
+    assert not info.all_states
+    assert not info.has_time
+
+
+@pytest.mark.parametrize(
+    "template_string",
+    [
+        "{{ states(entity_id) }}",
+        "{{ entity_id | states }}",
+        "{% for state in states %}{{ state.entity_id }}{% endfor %}",
+        "{{ states.sensor.temperature.last_changed < now() }}",
+        "{{ expand('group.all') | count }}",
+        "{{ closest('zone.home', 'device_tracker.phone') }}",
+        "{{ this.state }}",
+        "{% from 'macros.jinja' import my_macro %}{{ my_macro() }}",
+        "{{ states('sensor.temperature'",
+    ],
+)
+async def test_static_render_info_needs_render(
+    hass: HomeAssistant, template_string: str
+) -> None:
+    """Test templates that need a render to collect their dependencies."""
+    tpl = template.Template(template_string, hass)
+    assert tpl.async_static_render_info() is None
 
 
 def test_is_template_string() -> None:
@@ -1,5 +1,6 @@
 """Tests for the update coordinator."""
 
+import asyncio
 from datetime import timedelta
 import logging
 from unittest.mock import AsyncMock, Mock, patch
@@ -716,3 +717,122 @@ async def test_always_callback_when_always_update_is_true(
     update_callback.reset_mock()
 
     remove_callbacks()
+
+
+async def test_refresh_stats(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test refresh latency and failures are recorded."""
+    entry = MockConfigEntry(domain="test")
+    config_entries.current_entry.set(entry)
+    entry_crd = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+    config_entries.current_entry.set(None)
+
+    await entry_crd.async_refresh()
+    entry_crd.update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+    await entry_crd.async_refresh()
+    await crd.async_refresh()
+
+    assert entry_crd.refresh_stats.refreshes == 2
+    assert entry_crd.refresh_stats.failures == 1
+    assert entry_crd.refresh_stats.last_duration is not None
+
+    stats = update_coordinator.async_get_refresh_stats(hass, entry.entry_id)
+    assert stats == [
+        {
+            "name": "test",
+            "update_interval": 10.0,
+            "refreshes": 2,
+            "failures": 1,
+            "last_duration": entry_crd.refresh_stats.last_duration,
+            "max_duration": entry_crd.refresh_stats.max_duration,
+            "average_duration": entry_crd.refresh_stats.total_duration / 2,
+        }
+    ]
+    assert update_coordinator.async_get_refresh_stats(hass, "unknown") == []
+
+
+async def test_refresh_phase_is_stable(hass: HomeAssistant) -> None:
+    """Test the refresh phase is stable and within the update interval."""
+    first = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+    # A coordinator with the same logger, entry and name gets another phase
+    second = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+
+    assert first._refresh_phase != second._refresh_phase
+    assert first._refresh_phase == update_coordinator._refresh_phase(
+        f"{_LOGGER.name}--test-0"
+    )
+    assert second._refresh_phase == update_coordinator._refresh_phase(
+        f"{_LOGGER.name}--test-1"
+    )
+    for crd in (first, second):
+        assert 0 <= crd._refresh_phase < 1
+
+    # A coordinator created after a shutdown takes over the free slot
+    await first.async_shutdown()
+    third = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+    assert third._refresh_phase == update_coordinator._refresh_phase(
+        f"{_LOGGER.name}--test-0"
+    )
+
+
+async def test_refresh_is_scheduled_on_phase(hass: HomeAssistant) -> None:
+    """Test the next refresh is scheduled on the phase of the coordinator."""
+    crd = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+    interval = DEFAULT_UPDATE_INTERVAL.total_seconds()
+    crd._refresh_phase = 0.25
+
+    before = hass.loop.time()
+    crd._schedule_refresh()
+    after = hass.loop.time()
+    next_refresh = crd._unsub_refresh.__self__.when()
+    crd._unschedule_refresh()
+
+    assert before < next_refresh <= after + interval
+    cycles = (next_refresh - 0.25 * interval) / interval
+    assert cycles == pytest.approx(round(cycles))
+
+
+async def test_scheduled_refreshes_are_limited(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test scheduled refreshes of an integration share a concurrency limit."""
+    in_flight = 0
+    max_in_flight = 0
+    release = asyncio.Event()
+
+    async def refresh() -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await release.wait()
+        in_flight -= 1
+        return 1
+
+    with patch.object(update_coordinator, "MAX_CONCURRENT_SCHEDULED_REFRESHES", 2):
+        coordinators = [
+            update_coordinator.DataUpdateCoordinator[int](
+                hass,
+                logger,
+                name=f"test {idx}",
+                update_method=refresh,
+                update_interval=DEFAULT_UPDATE_INTERVAL,
+            )
+            for logger in (_LOGGER, logging.getLogger(f"{__name__}.other"))
+            for idx in range(3)
+        ]
+    for coordinator in coordinators:
+        coordinator.async_add_listener(Mock())
+
+    freezer.tick(DEFAULT_UPDATE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=False)
+    # Each integration is limited on its own
+    assert max_in_flight == 4
+
+    release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert max_in_flight == 4
+    assert all(coordinator.data == 1 for coordinator in coordinators)
@@ -2,6 +2,7 @@
 
 import asyncio
 from collections.abc import Generator, Iterable
+from datetime import timedelta
 import glob
 import os
 import sys
@@ -21,11 +22,13 @@ from homeassistant.helpers.translation import async_translations_loaded
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
 from homeassistant.setup import BASE_PLATFORMS
+import homeassistant.util.dt as dt_util
 
 from .common import (
     MockConfigEntry,
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     get_test_config_dir,
     mock_integration,
     mock_platform,
@@ -1398,3 +1401,53 @@ async def test_setup_does_base_platforms_first(hass: HomeAssistant) -> None:
     # only that they are setup before other integrations.
     assert set(order[1:3]) == {"sensor", "binary_sensor"}
     assert order[3:] == ["root", "first_dep", "second_dep"]
+
+
+async def test_startup_plan_loads_all_manifests_in_first_round(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the stored startup plan loads all resolved manifests at once."""
+    mock_integration(
+        hass, MockModule("root", partial_manifest={"dependencies": ["first_dep"]})
+    )
+    mock_integration(
+        hass,
+        MockModule("first_dep", partial_manifest={"dependencies": ["second_dep"]}),
+    )
+    mock_integration(hass, MockModule("second_dep"))
+
+    async def _async_first_round() -> set[str]:
+        with patch(
+            "homeassistant.bootstrap.loader.async_get_integrations",
+            wraps=loader.async_get_integrations,
+        ) as mock_get_integrations:
+            domains, _ = await bootstrap._async_resolve_domains_to_setup(
+                hass, {"root": {}}
+            )
+        assert {"root", "first_dep", "second_dep"} <= domains
+        return set(mock_get_integrations.call_args_list[0][0][1])
+
+    # Without a plan the dependencies are discovered round by round
+    assert "second_dep" not in await _async_first_round()
+    assert bootstrap.STARTUP_PLAN_STORAGE_KEY not in hass_storage
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=bootstrap.STARTUP_PLAN_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    plan = hass_storage[bootstrap.STARTUP_PLAN_STORAGE_KEY]["data"]
+    assert {"root", "first_dep", "second_dep"} <= set(plan["manifests"])
+
+    assert "second_dep" in await _async_first_round()
+
+    # The plan is ignored once the Home Assistant version changes
+    with patch("homeassistant.bootstrap.__version__", "9999.1.0"):
+        assert "second_dep" not in await _async_first_round()
+
+    # The plan is ignored once the configured domains change
+    mock_integration(hass, MockModule("other"))
+    with patch(
+        "homeassistant.bootstrap.loader.async_get_integrations",
+        wraps=loader.async_get_integrations,
+    ) as mock_get_integrations:
+        await bootstrap._async_resolve_domains_to_setup(hass, {"root": {}, "other": {}})
+    assert "second_dep" not in mock_get_integrations.call_args_list[0][0][1]
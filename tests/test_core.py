@@ -1163,6 +1163,121 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_indexed_listener(hass: HomeAssistant) -> None:
+    """Test indexed listeners only run for matching events."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_indexed(
+        "test", listener, "entity_id", ["light.kitchen", "light.bed"]
+    )
+    unsub_other = hass.bus.async_listen_indexed(
+        "test", listener, "device_id", "abc", run_immediately=True
+    )
+    assert hass.bus.async_listeners()["test"] == 2
+
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bed"})
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    await hass.async_block_till_done()
+    assert [event.data for event in calls] == [
+        {"device_id": "abc"},
+        {"entity_id": "light.kitchen"},
+        {"entity_id": "light.bed"},
+    ]
+
+    unsub()
+    calls.clear()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+    assert hass.bus.async_listeners()["test"] == 1
+
+    unsub_other()
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_indexed_listener_with_filter(hass: HomeAssistant) -> None:
+    """Test indexed listeners with an event filter."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def event_filter(event_data):
+        """Mock filter."""
+        return event_data.get("type") == "press"
+
+    hass.bus.async_listen_indexed(
+        "test", listener, "device_id", "abc", event_filter=event_filter
+    )
+
+    hass.bus.async_fire("test", {"device_id": "abc", "type": "release"})
+    hass.bus.async_fire("test", {"device_id": "other", "type": "press"})
+    hass.bus.async_fire("test", {"device_id": "abc", "type": "press"})
+    await hass.async_block_till_done()
+    assert [event.data for event in calls] == [{"device_id": "abc", "type": "press"}]
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_indexed(
+            "test", listener, "device_id", "abc", event_filter=lambda data: True
+        )
+
+
+async def test_eventbus_indexed_listener_restrictions(hass: HomeAssistant) -> None:
+    """Test restrictions on indexed listeners."""
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_indexed(
+            MATCH_ALL, lambda event: None, "entity_id", "light.kitchen"
+        )
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_indexed(
+            EVENT_STATE_REPORTED, lambda event: None, "entity_id", "light.kitchen"
+        )
+
+
+async def test_eventbus_indexed_state_reported_listener(hass: HomeAssistant) -> None:
+    """Test indexed state_reported listeners also receive state_changed."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    hass.bus.async_listen_indexed(
+        EVENT_STATE_REPORTED,
+        listener,
+        "entity_id",
+        "light.kitchen",
+        run_immediately=True,
+    )
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bed", "on")
+    hass.states.async_set("light.bed", "on")
+    await hass.async_block_till_done()
+
+    assert [event.event_type for event in calls] == [
+        EVENT_STATE_CHANGED,
+        EVENT_STATE_REPORTED,
+    ]
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1464,6 +1579,46 @@ async def test_statemachine_entity_ids(hass: HomeAssistant) -> None:
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_snapshot(hass: HomeAssistant) -> None:
+    """Test async_snapshot method."""
+    snapshot = hass.states.async_snapshot()
+    assert len(snapshot) == 0
+    assert snapshot.states() == ()
+    assert snapshot.states("light") == ()
+
+    hass.states.async_set("light.bowl", "on", {})
+    hass.states.async_set("SWITCH.AC", "off", {})
+    snapshot = hass.states.async_snapshot()
+    assert hass.states.async_snapshot() is snapshot
+    assert [state.entity_id for state in snapshot] == ["light.bowl", "switch.ac"]
+    assert [state.entity_id for state in snapshot.states("LIGHT")] == ["light.bowl"]
+    assert snapshot.states(("light", "switch", "other")) == snapshot.states()
+    assert snapshot.states(("LIGHT", "Switch")) == snapshot.states()
+    assert set(snapshot.domains()) == {"light", "switch"}
+
+    # Reporting the same state does not invalidate the snapshot
+    hass.states.async_set("light.bowl", "on", {})
+    assert hass.states.async_snapshot() is snapshot
+
+    hass.states.async_set("light.bowl", "off", {})
+    new_snapshot = hass.states.async_snapshot()
+    assert new_snapshot is not snapshot
+    assert new_snapshot.version > snapshot.version
+    assert snapshot.states("light")[0].state == "on"
+    assert new_snapshot.states("light")[0].state == "off"
+    # The view of a domain that did not change is shared
+    assert new_snapshot.states("switch") is snapshot.states("switch")
+
+    hass.states.async_remove("switch.ac")
+    # A snapshot that is still referenced keeps the states it was taken at
+    assert [state.entity_id for state in new_snapshot] == ["light.bowl", "switch.ac"]
+    assert set(new_snapshot.domains()) == {"light", "switch"}
+    snapshot = hass.states.async_snapshot()
+    assert [state.entity_id for state in snapshot] == ["light.bowl"]
+    assert snapshot.states("switch") == ()
+    assert set(snapshot.domains()) == {"light"}
+
+
 async def test_statemachine_remove(hass: HomeAssistant) -> None:
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})
@@ -1248,6 +1248,29 @@ async def test_async_get_component_preloads_config_and_config_flow(
     }
 
 
+async def test_async_get_component_records_import_timings(
+    hass: HomeAssistant,
+) -> None:
+    """Verify the component and platform import times are recorded."""
+    executor_import_integration = _get_test_integration(
+        hass, "executor_import", True, import_executor=True
+    )
+
+    with (
+        patch("homeassistant.loader.importlib.import_module"),
+        patch.object(
+            executor_import_integration,
+            "platforms_exists",
+            return_value=["config_flow"],
+        ),
+    ):
+        await executor_import_integration.async_get_component()
+
+    timings = loader.async_get_import_timings(hass)
+    assert timings.keys() == {"executor_import", "executor_import.config_flow"}
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
 async def test_async_get_component_loads_loop_if_already_in_sys_modules(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,